@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""benchmarks/bench_engine.py — Stehende Micro-/Macro-Benchmarks der Engine.
+
+Misst die heißen Pfade einzeln (Zeit pro Aufruf in µs, Minimum über mehrere
+Runden) und vergleicht mit der gespeicherten Baseline
+(`benchmarks/baseline.json`). Der Regressions-Gate schlägt fehl (Exit-Code 1),
+wenn ein Benchmark um mehr als `--max-slowdown` Prozent langsamer ist — auch
+nach `--retries` Nachmessungen.
+
+Jeder Micro-Fall baut seinen Zustand einmal auf und stellt ihn vor jedem Aufruf
+ungemessen wieder her (`restore(snapshot)`), damit jeder Aufruf dieselbe
+Arbeit tut — ein voller Node bleibt voll, ein Experiment bleibt eine
+Entdeckung. Experimente laufen ohne Memo (`ExperimentMemo(0)`): gemessen wird
+Matching bzw. `_no_match`, nicht der Cache. Der Content hat nur Blueprints mit
+2 und 3 Slots; für 4 und 5 Slots kommen synthetische Blueprints dazu.
+
+Zwei Sorten Fälle mit Baselines verschiedener Herkunft:
+
+- Macro-Benchmarks (`macro_*`: eine schlichte Sammel-Schleife, Scorecard-Läufe
+  und `compute_all`) brauchen nur API, die es schon vor der Performance-Serie
+  gab. Ihre Baseline ist auf dem Stand vor der Serie (29e3d99) gemessen — der
+  Gate fängt hier Rückschritte gegenüber dem Code vor der Serie.
+- Die Micro-Benchmarks brauchen die API der Serie (`seed=`, `ExperimentMemo`,
+  `ProcessAvailability`); ihre Baseline stammt vom Stand danach.
+
+`BENCH_ROOT` zeigt das Skript auf einen anderen Checkout; fehlt dort die API
+der Serie, stehen nur die Macro-Benchmarks zur Wahl. So entsteht die
+Macro-Baseline (Teil-Update, die übrigen Werte bleiben):
+
+    git worktree add /tmp/base 29e3d99
+    BENCH_ROOT=/tmp/base python benchmarks/bench_engine.py --only macro --update
+
+Ein `--update` ohne `--only` auf dem aktuellen Stand überschreibt auch die
+Macro-Werte; danach die Macro-Baseline wie oben neu messen.
+
+Damit Baselines zwischen Rechnern (und Lastphasen) vergleichbar bleiben, läuft
+vor jedem Benchmark eine Kalibrier-Schleife aus reinem Python; verglichen wird
+das Verhältnis von Benchmark- zu Kalibrier-Zeit.
+
+    python benchmarks/bench_engine.py                 # messen + Gate
+    python benchmarks/bench_engine.py --update        # Baseline neu schreiben
+    python benchmarks/bench_engine.py --only experiment --max-slowdown 40
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, List, NamedTuple, Optional
+
+ROOT = Path(os.environ.get("BENCH_ROOT") or Path(__file__).resolve().parent.parent).resolve()
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from engine.components import Inventory, ToolBlueprint  # noqa: E402
+from engine.core import GameEngine                   # noqa: E402
+from data.items import TEMPLATE_DB, create_item      # noqa: E402
+
+try:
+    from engine.availability import ProcessAvailability  # noqa: E402
+    from engine.memo import ExperimentMemo               # noqa: E402
+except ImportError:     # Stand vor der Performance-Serie: nur Macro-Benchmarks
+    ProcessAvailability = ExperimentMemo = None
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+BASELINE_VERSION = 1
+MAX_SLOWDOWN = 25.0     # Prozent; die Messungen streuen auf geteilten Rechnern um ~±20 %
+REPEAT = 5
+RETRIES = 2             # Nachmessungen, bevor eine Überschreitung als Regression zählt
+UPDATE_RUNS = 3         # Läufe für eine neue Baseline; gespeichert wird der mittlere
+GATHER_LOOP = 150       # Aufrufe je macro_gather_loop
+
+# Materialien, die je N Slots genau einen Blueprint treffen (Content bzw.
+# synthetisch) — und solche ohne RIGID, die nie passen.
+HIT_ITEMS = {
+    2: ("flint_shard", "stick"),                                          # knife
+    3: ("flint_shard", "stick", "plant_fiber"),                           # axe
+    4: ("flint_shard", "stick", "plant_fiber", "pebble"),                 # bench_4
+    5: ("flint_shard", "stick", "plant_fiber", "pebble", "bone"),         # bench_5
+}
+MISS_ITEMS = ("pebble", "bone", "mushroom", "clay_lump", "berries")
+SYNTHETIC = {
+    4: {"head": "FLINT", "handle": "RIGID", "binding": "FIBER", "weight": "STONE"},
+    5: {"head": "FLINT", "handle": "RIGID", "binding": "FIBER", "weight": "STONE",
+        "guard": "BONE"},
+}
+
+
+class Bench(NamedTuple):
+    """Ein Benchmark: `setup()` liefert `(op, prepare)`; gemessen wird nur
+    `op(*prepare())`, `number` Aufrufe pro Runde."""
+    name: str
+    setup: Callable
+    number: int
+
+
+def _engine(*templates, memo: bool = True) -> GameEngine:
+    game = GameEngine(seed=1)
+    for tid in templates:
+        game.player.inventory.add(create_item(tid))
+    if not memo:
+        game._memo = ExperimentMemo(0)
+    return game
+
+
+def _restoring(game: GameEngine, args: Callable[[], tuple] = tuple):
+    """prepare(): Zustand zurücksetzen, dann die Argumente des Aufrufs bauen."""
+    snap = game.snapshot()
+
+    def prepare():
+        game.restore(snap)
+        return args()
+    return prepare
+
+
+def _setup_init():
+    return (lambda: GameEngine(seed=1)), tuple
+
+
+def _setup_gather(depleted: bool):
+    def setup():
+        game = _engine()
+        if depleted:
+            for node in game.current_location.nodes:
+                node.stock, node.depleted = 0.0, True
+        return game.gather, _restoring(game)
+    return setup
+
+
+def _setup_experiment(slots: int, hit: bool):
+    def setup():
+        templates = HIT_ITEMS[slots] if hit else MISS_ITEMS[:slots]
+        game = _engine(*templates, memo=False)
+        if slots in SYNTHETIC:
+            bp_id = f"bench_{slots}"
+            game.blueprints[bp_id] = ToolBlueprint(bp_id, f"Bench-{slots}", SYNTHETIC[slots], 1.0)
+        items = game.player.inventory.items
+        return game.execute_experiment, _restoring(game, lambda: (list(items),))
+    return setup
+
+
+def _setup_inventory_add():
+    """40 `add` in ein leeres Inventar — 5 Templates, also meist Stapeln."""
+    templates = HIT_ITEMS[5] * 8
+
+    def add_all(inv, items):
+        for item in items:
+            inv.add(item)
+        return [(i.template_id, i.quantity) for i in inv.items]
+
+    def prepare():
+        return Inventory(), [create_item(tid) for tid in templates]
+    return add_all, prepare
+
+
+def _setup_no_match_reason():
+    game = _engine(*HIT_ITEMS[3][:2], "mushroom")
+    items = game.player.inventory.items
+    return game._no_match_reason, _restoring(game, lambda: (list(items),))
+
+
+def _large_inventory(copies: int = 30) -> GameEngine:
+    """~540 Einzel-Items: jedes Template `copies`-mal als eigener Stack."""
+    game = _engine()
+    inv = game.player.inventory
+    for tid in sorted(TEMPLATE_DB):
+        for _ in range(copies):
+            inv.items.append(create_item(tid))
+    return game
+
+
+def _setup_available_cold():
+    game = _large_inventory()
+
+    def prepare():
+        game._avail = ProcessAvailability()   # Voll-Prüfung aller Prozesse
+        return ()
+    return game.available_processes, prepare
+
+
+def _setup_available_touched():
+    game = _large_inventory()
+    items = game.player.inventory.items
+    size = len(items)
+    game.available_processes()
+
+    def prepare():
+        if len(items) > size:                      # Stapel des letzten Aufrufs weg
+            del items[size:]
+            game.available_processes()
+        items.append(create_item("plant_fiber"))  # berührt FIBER-Prozesse
+        return ()
+    return game.available_processes, prepare
+
+
+def _setup_advance_time():
+    game = _engine()
+    game.player.energy = 1e9                     # kein Hunger-Pfad über 10k Ticks
+
+    def ten_thousand_ticks():
+        advance = game._advance_time
+        for _ in range(10_000):
+            advance(1)
+    return ten_thousand_ticks, _restoring(game)
+
+
+def _setup_session_depth():
+    import scorecard
+    seed = scorecard.SEEDS[0]
+    return scorecard._run_session_depth, lambda: (seed,)
+
+
+def _gather_loop(game: GameEngine) -> int:
+    p = game.player
+    for _ in range(GATHER_LOOP):
+        game.gather()
+        p.energy, p.hp = p.max_energy, p.max_hp
+    return game.tick_counter
+
+
+def _setup_gather_loop():
+    """`GATHER_LOOP` × gather() auf einer frischen Engine ohne Seed (globaler
+    Strom, vor jedem Lauf gleich geseedet); Energie und HP werden aufgefüllt."""
+    def prepare():
+        random.seed(1)
+        return (GameEngine(),)
+    return _gather_loop, prepare
+
+
+def _setup_scorecard_run(runner: str):
+    def setup():
+        import scorecard
+        seed = scorecard.SEEDS[0]
+        return getattr(scorecard, runner), lambda: (seed,)
+    return setup
+
+
+def _setup_compute_all():
+    import scorecard
+    return scorecard.compute_all, tuple
+
+
+# Läuft auch auf dem Stand vor der Performance-Serie (siehe Modul-Docstring).
+MACRO_BENCHES: List[Bench] = [
+    Bench("macro_gather_loop", _setup_gather_loop, 5),
+    Bench("macro_session_depth", _setup_scorecard_run("_run_session_depth"), 3),
+    Bench("macro_forage_pressure", _setup_scorecard_run("_run_forage_pressure"), 3),
+    Bench("macro_warmth_stability", _setup_scorecard_run("_run_warmth_stability"), 3),
+    Bench("macro_compute_all", _setup_compute_all, 1),
+]
+
+MICRO_BENCHES: List[Bench] = [
+    Bench("engine_init", _setup_init, 20),
+    Bench("gather_full", _setup_gather(False), 200),
+    Bench("gather_depleted", _setup_gather(True), 200),
+    *(Bench(f"experiment_{n}slot_{'hit' if hit else 'miss'}", _setup_experiment(n, hit), 200)
+      for n in (2, 3, 4, 5) for hit in (True, False)),
+    Bench("no_match_reason", _setup_no_match_reason, 500),
+    Bench("inventory_add_40", _setup_inventory_add, 200),
+    Bench("available_processes_cold", _setup_available_cold, 50),
+    Bench("available_processes_touched", _setup_available_touched, 200),
+    Bench("advance_time_10k", _setup_advance_time, 1),
+    Bench("session_depth_seed", _setup_session_depth, 3),
+]
+
+BENCHES: List[Bench] = MACRO_BENCHES + (MICRO_BENCHES if ExperimentMemo else [])
+
+
+def calibrate(repeat: int = REPEAT) -> float:
+    """µs für eine feste Schleife aus Dict- und Float-Arbeit."""
+    def loop():
+        d, x = {}, 0.0
+        for i in range(5_000):
+            d[i & 255] = x
+            x += d[i & 255] * 0.5 + 1.0
+        return x
+    best = float("inf")
+    for _ in range(3 * repeat):   # kurz und oft: das Minimum ist stabiler
+        start = perf_counter()
+        loop()
+        best = min(best, perf_counter() - start)
+    return best * 1e6
+
+
+def measure(bench: Bench, repeat: int = REPEAT, number: Optional[int] = None) -> float:
+    """µs pro Aufruf: Minimum über `repeat` Runden (je Runde Mittel über
+    `number` Aufrufe). GC ist während der Aufrufe aus, wie bei timeit."""
+    op, prepare = bench.setup()
+    number = number or bench.number
+    best = float("inf")
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            total = 0.0
+            for _ in range(number):
+                args = prepare()
+                gc.disable()
+                start = perf_counter()
+                op(*args)
+                total += perf_counter() - start
+                if gc_was_enabled:
+                    gc.enable()
+            best = min(best, total / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best * 1e6
+
+
+def run(names: Optional[List[str]] = None, repeat: int = REPEAT,
+        number: Optional[int] = None) -> dict:
+    """Misst die (ausgewählten) Benchmarks; Ergebnis im Baseline-Format.
+
+    Kalibriert wird direkt vor jedem Benchmark — schwankt die Rechenleistung
+    während des Laufs (geteilte Maschine, Taktung), trifft das beide gleich.
+    """
+    results, calibration = {}, {}
+    for bench in BENCHES:
+        if names is None or bench.name in names:
+            calibration[bench.name] = round(calibrate(repeat), 3)
+            results[bench.name] = round(measure(bench, repeat, number), 3)
+    return {"version": BASELINE_VERSION, "python": platform.python_version(),
+            "calibration_us": calibration, "results": results}
+
+
+def compare(current: dict, baseline: dict, max_slowdown: float = MAX_SLOWDOWN) -> List[dict]:
+    """Zeilen je gemeinsamem Benchmark: kalibrierte Änderung in Prozent und
+    ob sie die Schwelle reißt. Ohne Baseline-Wert: `change` None."""
+    rows = []
+    for name, us in current["results"].items():
+        base = baseline["results"].get(name)
+        change = None
+        if base:
+            scale = baseline["calibration_us"][name] / current["calibration_us"][name]
+            change = round((us * scale / base - 1) * 100, 1)
+        rows.append({"name": name, "us": us, "baseline_us": base, "change": change,
+                     "regression": change is not None and change > max_slowdown})
+    return rows
+
+
+def _median_run(runs: List[dict]) -> dict:
+    """Je Benchmark der Lauf mit dem mittleren Verhältnis zur Kalibrierung —
+    ein zufällig schneller Lauf soll nicht zur Baseline werden."""
+    merged = dict(runs[0], calibration_us={}, results={})
+    for name in runs[0]["results"]:
+        ordered = sorted(runs, key=lambda r: r["results"][name] / r["calibration_us"][name])
+        middle = ordered[len(ordered) // 2]
+        merged["calibration_us"][name] = middle["calibration_us"][name]
+        merged["results"][name] = middle["results"][name]
+    return merged
+
+
+def gate(current: dict, baseline: dict, max_slowdown: float = MAX_SLOWDOWN,
+         retries: int = RETRIES, repeat: int = REPEAT) -> List[dict]:
+    """`compare`, aber Überschreitungen werden bis zu `retries`-mal neu
+    gemessen; es zählt die beste Messung. Echte Regressionen bleiben, ein
+    einzelner Ausreißer der Maschine nicht."""
+    rows = compare(current, baseline, max_slowdown)
+    for _ in range(retries):
+        failed = [r["name"] for r in rows if r["regression"]]
+        if not failed:
+            break
+        again = {r["name"]: r for r in compare(run(failed, repeat), baseline, max_slowdown)}
+        rows = [again[r["name"]] if r["name"] in again and again[r["name"]]["change"] < r["change"]
+                else r for r in rows]
+    return rows
+
+
+def load_baseline(path: Path = BASELINE) -> Optional[dict]:
+    if not path.exists():
+        return None
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return data if data.get("version") == BASELINE_VERSION else None
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--only", action="append", default=None,
+                    help="nur Benchmarks, deren Name den Text enthält (mehrfach möglich)")
+    ap.add_argument("--repeat", type=int, default=REPEAT)
+    ap.add_argument("--max-slowdown", type=float, default=MAX_SLOWDOWN,
+                    help=f"erlaubte Verlangsamung in Prozent (Default {MAX_SLOWDOWN:g})")
+    ap.add_argument("--retries", type=int, default=RETRIES,
+                    help="Nachmessungen je Überschreitung vor dem Fehlschlag")
+    ap.add_argument("--baseline", type=Path, default=BASELINE)
+    ap.add_argument("--update", action="store_true", help="Baseline mit dieser Messung ersetzen")
+    args = ap.parse_args(argv)
+
+    names = None
+    if args.only:
+        names = [b.name for b in BENCHES if any(o in b.name for o in args.only)]
+    baseline = load_baseline(args.baseline)
+
+    if args.update:
+        current = _median_run([run(names, args.repeat) for _ in range(UPDATE_RUNS)])
+        if baseline and names is not None:        # Teil-Update: übrige Werte behalten
+            for key in ("calibration_us", "results"):
+                baseline[key].update(current[key])
+            current = baseline
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline geschrieben: {args.baseline} ({len(current['results'])} Benchmarks)")
+        return 0
+
+    current = run(names, args.repeat)
+    rows = gate(current, baseline, args.max_slowdown, args.retries, args.repeat) if baseline else [
+        {"name": k, "us": v, "baseline_us": None, "change": None, "regression": False}
+        for k, v in current["results"].items()]
+    width = max(len(r["name"]) for r in rows)
+    for r in rows:
+        base = f"{r['baseline_us']:12.1f}" if r["baseline_us"] else f"{'—':>12}"
+        change = f"{r['change']:+7.1f} %" if r["change"] is not None else f"{'—':>9}"
+        flag = "  REGRESSION" if r["regression"] else ""
+        print(f"  {r['name']:<{width}} {r['us']:12.1f} µs {base} µs {change}{flag}")
+    print(f"  ({'Änderung kalibriert' if baseline else 'ohne Baseline'}, "
+          f"Schwelle {args.max_slowdown:g} %)")
+    failed = [r["name"] for r in rows if r["regression"]]
+    if failed:
+        print(f"\n{len(failed)} Benchmark(s) mehr als {args.max_slowdown:g} % langsamer "
+              f"als die Baseline: {', '.join(failed)}")
+        return 1
+    if baseline is None:
+        print(f"\nKeine Baseline unter {args.baseline} — mit --update anlegen.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""benchmarks/bench_items.py — Speicher pro 10k gesammelter Items.
+
+Vergleicht das Flyweight-Item (geteilter ItemProto, Copy-on-Write) mit dem
+früheren Layout: Dataclass mit __dict__ und eigenen Kopien von Tags und
+Attributen pro Item. Gemessen mit tracemalloc (nur Allokationen der Items).
+
+    python benchmarks/bench_items.py [--count 10000]
+"""
+import argparse
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from data.items import TEMPLATE_DB, create_item  # noqa: E402
+
+
+@dataclass
+class LegacyItem:
+    """Das Item-Layout vor dem Flyweight (nur als Vergleichsgröße)."""
+    name: str
+    base_weight: float
+    tags: Dict[str, Any] = field(default_factory=dict)
+    quantity: int = 1
+    condition: float = 1.0
+    attributes: Dict[str, float] = field(default_factory=dict)
+    template_id: str = ""
+
+
+def legacy_create_item(template_id: str, quantity: int = 1) -> LegacyItem:
+    data = TEMPLATE_DB[template_id]
+    return LegacyItem(name=data.name, base_weight=data.weight, tags=data.tags.copy(),
+                      attributes=data.attributes.copy(), quantity=quantity,
+                      template_id=template_id)
+
+
+def measure(factory, template_ids, count: int) -> int:
+    """Bytes, die `count` Items aus `factory` belegen (Templates reihum)."""
+    factory(template_ids[0])          # Protos/Caches anlegen, nicht mitzählen
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [factory(template_ids[i % len(template_ids)]) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del items
+    return used
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--count", type=int, default=10_000)
+    args = ap.parse_args(argv)
+    tids = sorted(TEMPLATE_DB)
+    for tid in tids:                  # alle Protos vorab anlegen
+        create_item(tid)
+    legacy = measure(legacy_create_item, tids, args.count)
+    flyweight = measure(create_item, tids, args.count)
+    per = 10_000 / args.count
+    print(f"{args.count} Items über {len(tids)} Templates")
+    print(f"  Dataclass + Dict-Kopien: {legacy * per / 1024:9.1f} KiB / 10k Items")
+    print(f"  Flyweight (ItemProto):   {flyweight * per / 1024:9.1f} KiB / 10k Items")
+    print(f"  Ersparnis:               {(legacy - flyweight) * per / 1024:9.1f} KiB "
+          f"({100 * (1 - flyweight / legacy):.0f} %)")
+
+
+if __name__ == "__main__":
+    main()
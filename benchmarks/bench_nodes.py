@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""benchmarks/bench_nodes.py — Speicher und Klon-Zeit großer Node-Welten.
+
+Vergleicht den NodeStore (eine Array-Spalte pro Feld) mit dem früheren
+Layout, einer Dataclass pro Node. Gemessen wird der Speicher der Node-Daten
+(tracemalloc) und die Zeit, um die Welt zu klonen (from_prototype/fork).
+
+    python benchmarks/bench_nodes.py [--count 100000]
+"""
+import argparse
+import copy
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from data.locations import NodeStore, ResourceNode  # noqa: E402
+
+
+@dataclass
+class LegacyNode:
+    """Das Node-Layout vor dem NodeStore (nur als Vergleichsgröße)."""
+    result_template_id: str
+    min_qty: int
+    max_qty: int
+    chance: float
+    req_perception: float = 0.0
+    req_tool_tag: Optional[str] = None
+    max_stock: float = 10.0
+    regen_per_tick: float = 0.05
+    harvest_cost: float = 1.0
+    stock: float = 0.0
+    depleted: bool = False
+
+
+def _spec(i: int) -> dict:
+    # Variierende Werte, damit keine Float-Objekte geteilt werden.
+    return dict(result_template_id="stick", min_qty=1, max_qty=3, chance=0.5 + i * 1e-9,
+                max_stock=10.0 + i * 1e-9, regen_per_tick=0.05 + i * 1e-9,
+                harvest_cost=1.0 + i * 1e-9)
+
+
+def measure(build, count: int):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    world = build(count)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return world, used
+
+
+def build_legacy(count: int):
+    return [LegacyNode(**_spec(i)) for i in range(count)]
+
+
+def build_store(count: int):
+    store = NodeStore()
+    for i in range(count):
+        store.add(req_perception=0.0, req_tool_tag=None, **_spec(i))
+    return store
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--count", type=int, default=100_000)
+    args = ap.parse_args(argv)
+    n = args.count
+    legacy, legacy_mem = measure(build_legacy, n)
+    store, store_mem = measure(build_store, n)
+
+    t = time.perf_counter()
+    [copy.copy(node) for node in legacy]
+    legacy_clone = time.perf_counter() - t
+    t = time.perf_counter()
+    store.copy()
+    store_clone = time.perf_counter() - t
+    t = time.perf_counter()
+    views = [ResourceNode._view(store, i) for i in range(n)]
+    view_time = time.perf_counter() - t
+    del views
+
+    print(f"{n} Nodes")
+    print(f"  Dataclass pro Node: {legacy_mem / n:6.1f} B/Node, Klon {legacy_clone * 1e3:7.1f} ms")
+    print(f"  NodeStore-Spalten:  {store_mem / n:6.1f} B/Node, Klon {store_clone * 1e3:7.1f} ms"
+          f" (+ Sichten {view_time * 1e3:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,18 +3,18 @@ data/blueprints.py
 Baupläne für das Experimentier-System — geladen aus blueprints.json.
 """
 from engine.components import ToolBlueprint
-from data.loader import load_blueprints
+from data.loader import load_content
 
 
 def get_all_blueprints():
     return [
         ToolBlueprint(
-            id=bp.id,
-            result_name=bp.result_name,
-            slots=bp.slots,
-            base_efficiency=bp.base_efficiency,
-            min_survival_req=bp.min_survival_req,
-            tool_tags=list(bp.tool_tags),
+            id=bp["id"],
+            result_name=bp["result_name"],
+            slots=dict(bp["slots"]),
+            base_efficiency=bp["base_efficiency"],
+            min_survival_req=bp["min_survival_req"],
+            tool_tags=list(bp["tool_tags"]),
         )
-        for bp in load_blueprints()
+        for bp in load_content().blueprints
     ]
\ No newline at end of file
@@ -2,21 +2,27 @@
 data/items.py
 Template-Datenbank — geladen aus items.json.
 """
-from engine.components import Item
-from data.loader import load_items
+from engine.components import Item, ItemProto
+from data.loader import item_templates
 
-TEMPLATE_DB = load_items()
+TEMPLATE_DB = item_templates()
+
+# template_id → (Template, geteilter ItemProto). Das Template-Objekt dient als
+# Schlüssel-Check: wird ein Eintrag in TEMPLATE_DB ersetzt, entsteht ein neuer Proto.
+_PROTOS = {}
+
+
+def _proto_of(template_id: str, data) -> ItemProto:
+    cached = _PROTOS.get(template_id)
+    if cached is None or cached[0] is not data:
+        cached = _PROTOS[template_id] = (data, ItemProto(template_id, data.tags, data.attributes))
+    return cached[1]
 
 
 def create_item(template_id: str, quantity: int = 1) -> Item:
     data = TEMPLATE_DB.get(template_id)
     if not data:
         return Item("Unbekannt", 0.1)
-    return Item(
-        name=data.name,
-        base_weight=data.weight,
-        tags=data.tags.copy(),
-        attributes=data.attributes.copy(),
-        quantity=quantity,
-        template_id=template_id,
-    )
\ No newline at end of file
+    cached = _PROTOS.get(template_id)
+    proto = cached[1] if cached is not None and cached[0] is data else _proto_of(template_id, data)
+    return Item(data.name, data.weight, None, quantity, 1.0, None, template_id, proto)
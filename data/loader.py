@@ -3,14 +3,26 @@ data/loader.py — JSON-Datenlader mit pydantic-Validierung.
 
 Lädt Items, Blueprints und Locations aus JSON-Dateien.
 Validiert Struktur und Typen beim Laden.
+
+Kompilierter Content-Cache: `load_content()` validiert die vier Content-Dateien
+genau einmal pro Inhaltsstand (SHA-256 über die Dateien) und legt das Ergebnis
+als Pickle in `data/__contentcache__/` ab. Die `get_all_*`-Konstruktoren bauen
+daraus billige, frische Instanzen — veränderlicher Zustand (Node-Vorrat,
+Feuer) ist damit weiterhin pro Engine frisch.
 """
+import hashlib
 import json
+import os
+import pickle
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple
 
 from pydantic import BaseModel, RootModel, ValidationError
 
 DATA_DIR = Path(__file__).parent
+CONTENT_FILES = ("items.json", "blueprints.json", "locations.json", "processes.json")
+CACHE_DIR = DATA_DIR / "__contentcache__"
+CACHE_FORMAT = 1   # erhöhen, wenn sich die kompilierte Form ändert
 
 
 # --- Pydantic models for validation ---
@@ -121,4 +133,116 @@ def load_processes() -> List[ProcessData]:
     try:
         return [ProcessData.model_validate(p) for p in data]
     except ValidationError as e:
-        raise ValueError(f"Invalid processes.json schema: {e}")
\ No newline at end of file
+        raise ValueError(f"Invalid processes.json schema: {e}")
+
+
+# --- Kompilierter Content-Cache ---
+
+class CompiledContent(NamedTuple):
+    """Validierter Content als reine Python-Primitive (dict/list/str/float).
+
+    Wird zwischen Engines geteilt und darf NICHT verändert werden — die
+    `get_all_*`-Konstruktoren kopieren alles Veränderliche heraus.
+    """
+    content_hash: str
+    items: Dict[str, dict]
+    blueprints: Tuple[dict, ...]
+    locations: Tuple[dict, ...]
+    processes: Tuple[dict, ...]
+
+
+# (Datei-Signatur aus mtime/size, CompiledContent) des zuletzt geladenen Stands.
+# Spart das erneute Lesen + Hashen, solange sich keine Datei geändert hat.
+_compiled: Optional[Tuple[tuple, CompiledContent]] = None
+
+
+def _file_signature() -> tuple:
+    sig = []
+    for name in CONTENT_FILES:
+        path = DATA_DIR / name
+        if not path.exists():
+            raise FileNotFoundError(f"Missing data file: {path}")
+        st = path.stat()
+        sig.append((name, st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
+def content_hash() -> str:
+    """SHA-256 über Namen und Bytes der vier Content-Dateien."""
+    h = hashlib.sha256()
+    for name in CONTENT_FILES:
+        raw = (DATA_DIR / name).read_bytes()
+        h.update(name.encode())
+        h.update(len(raw).to_bytes(8, "little"))
+        h.update(raw)
+    return h.hexdigest()
+
+
+def _cache_path(digest: str) -> Path:
+    return CACHE_DIR / f"content-{digest}.v{CACHE_FORMAT}.pickle"
+
+
+def _compile(digest: str) -> CompiledContent:
+    """Volle pydantic-Validierung aller Dateien → Primitive."""
+    return CompiledContent(
+        content_hash=digest,
+        items={tid: t.model_dump() for tid, t in load_items().items()},
+        blueprints=tuple(bp.model_dump() for bp in load_blueprints()),
+        locations=tuple(loc.model_dump() for loc in load_locations()),
+        processes=tuple(p.model_dump() for p in load_processes()),
+    )
+
+
+def _read_cache(digest: str) -> Optional[CompiledContent]:
+    try:
+        with open(_cache_path(digest), "rb") as f:
+            raw = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if not isinstance(raw, tuple) or len(raw) != len(CompiledContent._fields):
+        return None
+    content = CompiledContent(*raw)
+    return content if content.content_hash == digest else None
+
+
+def _write_cache(content: CompiledContent):
+    """Schreibt atomar (tmp + replace); ein schreibgeschütztes data/ ist kein Fehler."""
+    path = _cache_path(content.content_hash)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickle.dump(tuple(content), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def load_content() -> CompiledContent:
+    """Validierter, kompilierter Content — pro Inhaltsstand genau einmal validiert.
+
+    Reihenfolge: Prozess-Memo (Dateien unverändert) → Pickle auf Platte
+    (gleicher Content-Hash) → volle Validierung + Pickle schreiben.
+    """
+    global _compiled
+    sig = _file_signature()
+    if _compiled is not None and _compiled[0] == sig:
+        return _compiled[1]
+    digest = content_hash()
+    content = _read_cache(digest)
+    if content is None:
+        content = _compile(digest)
+        _write_cache(content)
+    _compiled = (sig, content)
+    return content
+
+
+def item_templates() -> Dict[str, ItemTemplate]:
+    """ItemTemplates aus dem kompilierten Content (ohne erneute Validierung)."""
+    return {tid: ItemTemplate.model_construct(
+                name=data["name"], weight=data["weight"],
+                tags=dict(data["tags"]), attributes=dict(data["attributes"]))
+            for tid, data in load_content().items.items()}
\ No newline at end of file
@@ -2,36 +2,169 @@
 data/locations.py
 Erweiterte Locations mit Temperatur-Daten — geladen aus locations.json.
 """
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Optional
-from data.loader import load_locations, ResourceNodeData
+from typing import Dict, List, Optional
+from data.loader import load_content
+
+
+class NodeStore:
+    """Node-Daten einer Welt spaltenweise: ein Array pro Feld, Index = Node-ID.
+
+    Ein Node kostet so gut drei Dutzend Bytes (plus die geteilten Strings)
+    statt eines Objekts mit __dict__, und eine Welt lässt sich per Array-Kopie
+    klonen. `ResourceNode` ist nur noch eine Sicht (Store, ID) darauf.
+    """
+
+    def __init__(self):
+        self.result_template_id: List[str] = []
+        self.req_tool_tag: List[Optional[str]] = []
+        self.min_qty = array("l")
+        self.max_qty = array("l")
+        self.chance = array("d")
+        self.req_perception = array("d")
+        self.max_stock = array("d")
+        self.regen_per_tick = array("d")
+        self.harvest_cost = array("d")
+        self.stock = array("d")
+        self.depleted = bytearray()
+        # Zählt Schreibzugriffe von außen (Node-Properties, Ernte) — ein Ort,
+        # dessen Nodes alle voll sind, muss erst danach wieder abrechnen.
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self.stock)
+
+    def add(self, result_template_id, min_qty, max_qty, chance, req_perception,
+            req_tool_tag, max_stock, regen_per_tick, harvest_cost) -> int:
+        """Legt einen vollen, nicht erschöpften Node an; liefert seine ID."""
+        self.result_template_id.append(result_template_id)
+        self.req_tool_tag.append(req_tool_tag)
+        self.min_qty.append(min_qty)
+        self.max_qty.append(max_qty)
+        self.chance.append(chance)
+        self.req_perception.append(req_perception)
+        self.max_stock.append(max_stock)
+        self.regen_per_tick.append(regen_per_tick)
+        self.harvest_cost.append(harvest_cost)
+        self.stock.append(max_stock)
+        self.depleted.append(0)
+        return len(self.stock) - 1
+
+    def copy(self) -> "NodeStore":
+        """Unabhängige Kopie (Arrays werden kopiert, Strings geteilt)."""
+        new = NodeStore.__new__(NodeStore)
+        for name, column in self.__dict__.items():
+            new.__dict__[name] = column[:] if name != "version" else column
+        return new
+
+    def settle(self, ids, pending) -> List[int]:
+        """Regeneration der Nodes `ids` über die Zeitschritte `pending`.
+
+        Pro Node jeder Schritt einzeln (Float-Reihenfolge wie bisher); ein
+        voller, nicht erschöpfter Node mit regen >= 0 bleibt voll (Abbruch).
+        Gibt die IDs zurück, die danach noch nicht so in Ruhe sind.
+        """
+        stock, depleted = self.stock, self.depleted
+        max_stock, regen, cost = self.max_stock, self.regen_per_tick, self.harvest_cost
+        active = []
+        for j in ids:
+            s, cap, r, c = stock[j], max_stock[j], regen[j], cost[j]
+            dep = depleted[j]
+            for ticks in pending:
+                s = min(cap, s + r * ticks)
+                # Ein erschöpfter Node erholt sich erst, wenn genug Zeit
+                # vergangen ist, um mindestens eine Ernte-Portion aufzufüllen.
+                if dep and s >= c:
+                    dep = 0
+                if s == cap and not dep and r >= 0:
+                    break
+            else:
+                active.append(j)
+            stock[j] = s
+            depleted[j] = dep
+        return active
+
+
+def _column(name: str, doc: str, convert=None):
+    """Property, die ein Feld des Nodes in seiner Store-Spalte liest/schreibt."""
+    if convert is None:
+        def fget(node):
+            return getattr(node._store, name)[node._id]
+    else:
+        def fget(node):
+            return convert(getattr(node._store, name)[node._id])
+
+    def fset(node, value):
+        store = node._store
+        getattr(store, name)[node._id] = value
+        store.version += 1
+
+    return property(fget, fset, doc=doc)
 
 
-@dataclass
 class ResourceNode:
-    result_template_id: str
-    min_qty: int
-    max_qty: int
-    chance: float
-    req_perception: float = 0.0
-    req_tool_tag: Optional[str] = None
+    """Ein Sammel-Node — Sicht auf eine Zeile im NodeStore seiner Welt.
+
+    Felder wie früher (Konstruktor-Signatur der alten Dataclass). Ohne `store`
+    bekommt der Node einen eigenen Ein-Node-Store.
+    """
+    __slots__ = ("_store", "_id")
+    __hash__ = None
+
+    def __init__(self, result_template_id: str, min_qty: int, max_qty: int, chance: float,
+                 req_perception: float = 0.0, req_tool_tag: Optional[str] = None,
+                 max_stock: float = 10.0, regen_per_tick: float = 0.05,
+                 harvest_cost: float = 1.0, stock: float = 0.0, depleted: bool = False,
+                 store: Optional[NodeStore] = None):
+        # stock/depleted werden (wie zuvor in __post_init__) ignoriert: jeder
+        # Node startet voll und nicht erschöpft — kein Cross-Session-Bleed.
+        self._store = store if store is not None else NodeStore()
+        self._id = self._store.add(result_template_id, min_qty, max_qty, chance,
+                                   req_perception, req_tool_tag, max_stock,
+                                   regen_per_tick, harvest_cost)
+
+    @classmethod
+    def _view(cls, store: NodeStore, node_id: int) -> "ResourceNode":
+        node = cls.__new__(cls)
+        node._store = store
+        node._id = node_id
+        return node
+
+    result_template_id = _column("result_template_id", "Template der Ausbeute.")
+    min_qty = _column("min_qty", "Mindestmenge pro Fund.")
+    max_qty = _column("max_qty", "Höchstmenge pro Fund.")
+    chance = _column("chance", "Fundchance bei vollem Vorrat.")
+    req_perception = _column("req_perception", "Nötige Wahrnehmung.")
+    req_tool_tag = _column("req_tool_tag", "Nötiges Werkzeug-Tag oder None.")
     # Vorratsbasierte Nodes (SPEC-004): Ernte reduziert den Vorrat, Regeneration
-    # über verstrichene Spielzeit. `stock` ist veränderlicher Zustand und wird
-    # pro Instanz frisch auf max_stock initialisiert (kein Cross-Session-Bleed).
-    max_stock: float = 10.0
-    regen_per_tick: float = 0.05
-    harvest_cost: float = 1.0
-    stock: float = 0.0
+    # über verstrichene Spielzeit.
+    max_stock = _column("max_stock", "Vorrats-Obergrenze.")
+    regen_per_tick = _column("regen_per_tick", "Regeneration pro Tick.")
+    harvest_cost = _column("harvest_cost", "Vorratsverbrauch pro Ernte.")
+    stock = _column("stock", "Aktueller Vorrat.")
     # `depleted` ist ein ehrlicher Zustand für den Spieler: einmal bis unter
     # eine Ernte-Portion geleert, bleibt der Node erschöpft und meldet das,
     # bis verstrichene Zeit (Regeneration) mindestens eine Portion wieder
     # aufgefüllt hat. So übersteht er nicht still, nur weil ein einzelner
     # Gather-Tick eine homöopathische Menge nachschiebt.
-    depleted: bool = False
+    depleted = _column("depleted", "Erschöpft bis zur Regeneration.", bool)
+
+    _FIELDS = ("result_template_id", "min_qty", "max_qty", "chance", "req_perception",
+               "req_tool_tag", "max_stock", "regen_per_tick", "harvest_cost",
+               "stock", "depleted")
 
-    def __post_init__(self):
-        self.stock = self.max_stock
-        self.depleted = False
+    def _values(self) -> tuple:
+        return tuple(getattr(self, f) for f in self._FIELDS)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __repr__(self):
+        fields = ", ".join(f"{f}={v!r}" for f, v in zip(self._FIELDS, self._values()))
+        return f"ResourceNode({fields})"
 
 
 @dataclass
@@ -48,31 +181,71 @@ class LocationDef:
     # fire_fuel:  Brennstoff in Ticks, sinkt pro _advance_time; bei 0 erlischt das Feuer.
     fire_active: bool = False
     fire_fuel: float = 0.0
+    # Lazy-Regeneration: Index ins Regen-Log der Engine, bis zu dem die Nodes
+    # dieses Orts abgerechnet sind (GameEngine._settle_nodes).
+    regen_mark: int = field(default=0, compare=False, repr=False)
+    # (ids, Store-Version, noch regenerierende IDs) der letzten Abrechnung:
+    # volle Nodes ändern sich erst nach einem Schreibzugriff wieder.
+    regen_rest: Optional[tuple] = field(default=None, compare=False, repr=False)
+    # Gecachte Spalten-Sicht der Nodes (nodes, Anzahl, Store, IDs), s. node_view().
+    _view: Optional[tuple] = field(default=None, compare=False, repr=False)
+
+    def node_view(self) -> tuple:
+        """(Store, IDs) der Nodes dieses Orts, solange `nodes` dieselbe Liste
+        gleicher Länge ist; liegen die Nodes in verschiedenen Stores (z.B. in
+        Tests eingesetzte), ist der Store None."""
+        nodes = self.nodes
+        view = self._view
+        if view is None or view[0] is not nodes or view[1] != len(nodes):
+            store = nodes[0]._store if nodes else None
+            if any(node._store is not store for node in nodes):
+                store = None
+            view = self._view = (nodes, len(nodes), store, tuple(node._id for node in nodes))
+        return view[2], view[3]
+
+    def clone(self) -> "LocationDef":
+        """Kopie mit eigenen Nodes — Vorrat und Feuer werden nicht geteilt."""
+        return clone_locations({self.id: self})[self.id]
+
+
+def clone_locations(locations: Dict[str, LocationDef]) -> Dict[str, LocationDef]:
+    """Klont eine Welt: jeder NodeStore wird einmal (als Array-Kopie) kopiert,
+    die Nodes der Klone sind Sichten auf die Kopien."""
+    stores = {}
+    cloned = {}
+    for lid, loc in locations.items():
+        new = _shallow_copy(loc)
+        nodes = []
+        for node in loc.nodes:
+            store = stores.get(id(node._store))
+            if store is None:
+                store = stores[id(node._store)] = node._store.copy()
+            nodes.append(ResourceNode._view(store, node._id))
+        new.nodes = nodes
+        cloned[lid] = new
+    return cloned
 
 
-def _node_from_data(n: ResourceNodeData) -> ResourceNode:
-    return ResourceNode(
-        result_template_id=n.result_template_id,
-        min_qty=n.min_qty,
-        max_qty=n.max_qty,
-        chance=n.chance,
-        req_perception=n.req_perception,
-        req_tool_tag=n.req_tool_tag,
-        max_stock=n.max_stock,
-        regen_per_tick=n.regen_per_tick,
-        harvest_cost=n.harvest_cost,
-    )
+def _shallow_copy(obj):
+    """Flache Kopie einer Dataclass ohne den copy-Modul-Umweg (Fork-Pfad)."""
+    new = object.__new__(obj.__class__)
+    new.__dict__.update(obj.__dict__)
+    return new
 
 
 def get_all_locations() -> List[LocationDef]:
+    # Aus dem kompilierten Content (validiert einmal pro Inhaltsstand); die
+    # Nodes aller Orte teilen einen frischen NodeStore, starten also wieder
+    # auf max_stock.
+    store = NodeStore()
     return [
         LocationDef(
-            id=loc.id,
-            name=loc.name,
-            description=loc.description,
-            base_temp=loc.base_temp,
-            exposure=loc.exposure,
-            nodes=[_node_from_data(n) for n in loc.nodes],
+            id=loc["id"],
+            name=loc["name"],
+            description=loc["description"],
+            base_temp=loc["base_temp"],
+            exposure=loc["exposure"],
+            nodes=[ResourceNode(**n, store=store) for n in loc["nodes"]],
         )
-        for loc in load_locations()
+        for loc in load_content().locations
     ]
\ No newline at end of file
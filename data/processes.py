@@ -6,7 +6,7 @@ ProcessDefs werden aus processes.json geladen (keine hartkodierten Dicts).
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
-from data.loader import load_processes
+from data.loader import load_content
 
 
 @dataclass
@@ -23,13 +23,13 @@ class ProcessDef:
 def get_all_processes() -> List[ProcessDef]:
     return [
         ProcessDef(
-            id=p.id,
-            name=p.name,
-            inputs=p.inputs,
-            tools=p.tools,
-            outputs=p.outputs,
-            duration_ticks=p.duration_ticks,
-            required_tag_in_env=p.required_tag_in_env,
+            id=p["id"],
+            name=p["name"],
+            inputs=dict(p["inputs"]),
+            tools=list(p["tools"]),
+            outputs=dict(p["outputs"]),
+            duration_ticks=p["duration_ticks"],
+            required_tag_in_env=p["required_tag_in_env"],
         )
-        for p in load_processes()
+        for p in load_content().processes
     ]
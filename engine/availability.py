@@ -0,0 +1,125 @@
+"""
+engine/availability.py
+Inkrementelle Prozess-Verfügbarkeit für `GameEngine.available_processes()`.
+
+Ein Prozess ist verfügbar, wenn seine Inputs in Menge da sind, zu jedem
+Werkzeug-Tag ein intaktes Item existiert und die Umgebung sein
+`required_tag_in_env` erfüllt. Statt das bei jeder Abfrage für alle Prozesse
+neu zu prüfen, merkt sich `ProcessAvailability` das Ergebnis pro Prozess und
+prüft nur die Prozesse nach, deren Abhängigkeiten seit der letzten Abfrage
+berührt wurden: Input-Templates und Werkzeug-Tags meldet das Inventar
+(`Inventory.watch()`), der Umgebungszustand (Feuer am aktuellen Ort) wird pro
+Abfrage verglichen — so fällt auch ein während `_advance_time` erloschenes
+Feuer auf.
+"""
+from typing import Dict, List, Optional, Tuple
+
+# Zuletzt gebauter Index (geteilt, solange die Prozess-Definitionen dieselben
+# sind, wie beim Blueprint-Index in engine/core.py).
+_proc_index = None
+
+
+class ProcessIndex:
+    """Prozesse in Dict-Reihenfolge und ihre Positionen je Abhängigkeit."""
+
+    def __init__(self, processes: Dict[str, object]):
+        self.source = tuple(processes.values())
+        self.ids = tuple(processes)
+        # Kopie der indizierten Felder: auch an Ort und Stelle geänderte
+        # Prozesse (proc.inputs[...] = …) invalidieren den Index.
+        self.shape = tuple((dict(p.inputs), list(p.tools), p.required_tag_in_env)
+                           for p in self.source)
+        self.by_template: Dict[str, List[int]] = {}
+        self.by_tag: Dict[str, List[int]] = {}
+        self.by_env: Dict[str, List[int]] = {}
+        for pos, proc in enumerate(self.source):
+            for tid in proc.inputs:
+                self.by_template.setdefault(tid, []).append(pos)
+            for tag in proc.tools:
+                self.by_tag.setdefault(tag, []).append(pos)
+            if proc.required_tag_in_env:
+                self.by_env.setdefault(proc.required_tag_in_env, []).append(pos)
+
+    def matches_source(self, processes: Dict[str, object]) -> bool:
+        """Ob der Index noch zu `processes` passt (gleiche Schlüssel und
+        Objekte in gleicher Reihenfolge, unveränderte Inputs, Werkzeuge und
+        Umgebungs-Tags) — ausgetauschte, entfernte oder editierte Prozesse
+        invalidieren."""
+        src = self.source
+        if len(src) != len(processes):
+            return False
+        for a, key, (k, b), (inputs, tools, env) in zip(src, self.ids, processes.items(),
+                                                        self.shape):
+            if (a is not b or key != k or b.inputs != inputs or b.tools != tools
+                    or b.required_tag_in_env != env):
+                return False
+        return True
+
+
+def process_index(processes: Dict[str, object]) -> ProcessIndex:
+    global _proc_index
+    if _proc_index is None or not _proc_index.matches_source(processes):
+        _proc_index = ProcessIndex(processes)
+    return _proc_index
+
+
+class ProcessAvailability:
+    """Verfügbarkeit aller Prozesse einer Engine, nachgeführt pro Abfrage.
+
+    Neu aufgebaut wird, wenn sich der Prozess-Bestand oder das Inventar-Objekt
+    (restore, Tests) ändert; sonst nur, was das Inventar als berührt meldet
+    oder dessen Umgebungs-Tag umgeschlagen ist.
+    """
+
+    __slots__ = ("index", "inventory", "ready", "env", "result")
+
+    def __init__(self):
+        self.index: Optional[ProcessIndex] = None
+        self.inventory = None
+        self.ready: List[bool] = []
+        self.env: Dict[str, bool] = {}
+        self.result: Tuple[str, ...] = ()
+
+    def query(self, engine) -> List[str]:
+        index = process_index(engine.processes)
+        inv = engine.player.inventory
+        full = index is not self.index or inv is not self.inventory
+        if full:
+            self.index, self.inventory = index, inv
+            self.ready = [False] * len(index.ids)
+            inv.watch()
+        changes = inv.take_changes()
+        if full or changes is None:
+            dirty = set(range(len(index.ids)))
+        else:
+            dirty = set()
+            templates, tags = changes
+            for tid in templates:
+                dirty.update(index.by_template.get(tid, ()))
+            for tag in tags:
+                dirty.update(index.by_tag.get(tag, ()))
+        env = self.env
+        for tag, positions in index.by_env.items():
+            ok = engine._env_satisfied(tag)
+            if env.get(tag) is not ok:
+                env[tag] = ok
+                dirty.update(positions)
+
+        changed = full
+        ready = self.ready
+        for pos in dirty:
+            ok = self._check(index.source[pos], inv)
+            if ready[pos] is not ok:
+                ready[pos] = ok
+                changed = True
+        if changed:
+            self.result = tuple(pid for pid, ok in zip(index.ids, ready) if ok)
+        return list(self.result)
+
+    def _check(self, proc, inv) -> bool:
+        if any(inv.count_template(i) < q for i, q in proc.inputs.items()):
+            return False
+        if any(not inv.find_item_by_tag(t) for t in proc.tools):
+            return False
+        tag = proc.required_tag_in_env
+        return not tag or self.env[tag]
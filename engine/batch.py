@@ -0,0 +1,332 @@
+"""
+engine/batch.py
+Batch-Simulator: N unabhängige Welten im Gleichschritt (Balancing-Sweeps).
+
+Der Zustand aller Welten liegt spaltenweise in `array`-Spalten (Energie, HP,
+Körpertemperatur, Uhr, Wetter, Ort, Node-Vorrat, Feuer), die Operationen
+`gather`, `travel`, `eat_best` und `advance` laufen in einer Schleife über die
+(maskierten) Welten — ohne Item-Objekte, Meldungstexte, Event-Queue und
+Regen-Log pro Welt. Stdlib only (CONSTITUTION: kein numpy).
+
+Welt i entspricht `GameEngine(seed=seeds[i])`: dieselben benannten RNG-Ströme,
+dieselben Würfe in derselben Reihenfolge und dieselben Float-Operationen —
+die Welten sind also nicht nur statistisch, sondern Tick für Tick gleich.
+Abgebildet ist der Überlebenskern (Sammeln, Reisen, Essen, Zeit: Hunger,
+Thermodynamik, Feuer-Brennstoff, Wetter, Regeneration, Verletzungen samt
+Werkzeug-Verschleiß). Crafting und Prozesse gibt es im Batch nicht — Wunden
+bleiben daher unbehandelt, Feuer brennt nur, was `light_fire` vorgibt.
+"""
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from engine.climate import DAY_TICKS
+from engine.core import (
+    CUT_BLEED_PER_TICK, FIRE_HEAT, INJURE_CUT_CHANCE, INJURE_STRAIN_CHANCE,
+    STRAIN_EFFORT_MALUS, GameEngine, _next_weather_tick, _rng_stream,
+)
+from data.items import create_item
+
+# Obergrenze für Orte und Wettertypen (Index-Spalten vom Typ "H").
+MAX_LOCATIONS = 65535
+
+
+class BatchEngine:
+    """N Welten, eine pro Seed, spaltenweise gespeichert.
+
+    Masken sind Sequenzen von Wahrheitswerten (eine pro Welt); `None` heißt
+    alle Welten. Tote Welten (hp <= 0) werden wie in der Engine weiter
+    simuliert, sofern die Maske sie enthält — `alive()` liefert die Maske.
+    """
+
+    def __init__(self, seeds: Sequence[int], template: Optional[GameEngine] = None):
+        # Startzustand und Content aus einer frischen Engine, damit Batch und
+        # GameEngine nicht auseinanderlaufen können.
+        eng = template or GameEngine.from_prototype()
+        p = eng.player
+        self.seeds = list(seeds)
+        n = self.n = len(self.seeds)
+
+        self._weather_keys = tuple(eng.weather_types)
+
+        locs = list(eng.locations.values())
+        if len(locs) > MAX_LOCATIONS or len(self._weather_keys) > MAX_LOCATIONS:
+            raise ValueError(f"BatchEngine: höchstens {MAX_LOCATIONS} Orte/Wettertypen")
+        self._loc_ids = [loc.id for loc in locs]
+        self._loc_index = {lid: i for i, lid in enumerate(self._loc_ids)}
+        self._loc_exposure = tuple(loc.exposure for loc in locs)
+        # Klimatabelle der Engine, nach Index statt Schlüssel: [Ort][Wetter]
+        climate = eng.climate
+        self._ambient = tuple(tuple(climate.ambient[lid][k] for k in self._weather_keys)
+                              for lid in self._loc_ids)
+        self._exposure = tuple(tuple(climate.exposure[lid][k] for k in self._weather_keys)
+                               for lid in self._loc_ids)
+
+        # Nodes flach nummeriert; pro Ort der Bereich [start, end).
+        self._templates: List[str] = []
+        self._tpl_index: Dict[str, int] = {}
+        # pro Template: (Name, Gewicht, EDIBLE-kcal, SHARP?, Isolation falls
+        # CLOTHING, Tag-Menge, Haltbarkeit als Werkzeug)
+        self._tpl_data: List[tuple] = []
+        self._loc_nodes = []
+        nodes = []
+        for loc in locs:
+            start = len(nodes)
+            nodes.extend(loc.nodes)
+            self._loc_nodes.append((start, len(nodes)))
+        self._node_tpl = tuple(self._template(nd.result_template_id) for nd in nodes)
+        self._node_static = tuple(
+            (nd.chance, nd.max_stock, nd.regen_per_tick, nd.harvest_cost,
+             nd.min_qty, nd.max_qty, nd.req_perception, nd.req_tool_tag)
+            for nd in nodes)
+        self._node_regen = tuple((j, nd.max_stock, nd.regen_per_tick, nd.harvest_cost)
+                                 for j, nd in enumerate(nodes))
+        k = self._k = len(nodes)
+        self._has_clothing = any(t[4] is not None for t in self._tpl_data)
+
+        self._max_energy = p.max_energy
+        self._max_hp = p.max_hp
+        self._perception = p.stats["perception"]
+        self._capacity = p.inventory.capacity_kg
+
+        start_loc = self._loc_index[eng.current_location_id]
+        self.energy = array("d", [p.energy] * n)
+        self.hp = array("d", [p.hp] * n)
+        self.body_temp = array("d", [p.body_temp] * n)
+        self.tick = array("q", [eng.tick_counter] * n)
+        self._weather_due = array("q", [_next_weather_tick(eng.tick_counter)] * n)
+        self.weather = array("H", [self._weather_keys.index(eng.current_weather)] * n)
+        self.location = array("H", [start_loc] * n)
+        self.stock = array("d", [nd.stock for nd in nodes] * n)
+        self.depleted = bytearray([nd.depleted for nd in nodes] * n)
+        # Pro Welt die Nodes, die noch regenerieren (nicht voll oder erschöpft);
+        # volle Nodes ändern sich nicht, bis gather sie wieder anfasst.
+        resting = [nd.stock == nd.max_stock and not nd.depleted and nd.regen_per_tick >= 0
+                   for nd in nodes]
+        self._regen_active: List[List[int]] = [
+            [j for j in range(k) if not resting[j]] for _ in range(n)]
+        self.fire_fuel = array("d", [loc.fire_fuel for loc in locs] * n)
+        self.fire_active = bytearray([loc.fire_active for loc in locs] * n)
+        # Unbehandelte Wunden (Batch kennt keine Behandlung), in Entstehungs-
+        # reihenfolge wie Player.injuries.
+        self.cut = bytearray(n)
+        self.strain = bytearray(n)
+        # Inventar: pro Welt die Stacks [template_index, quantity, condition]
+        # in Aufnahme-Reihenfolge — Stacks bleiben wie in Inventory.add getrennt,
+        # sobald sich Name oder Zustand unterscheiden.
+        self.stacks: List[List[list]] = [[] for _ in range(n)]
+        self._gather_rng = [_rng_stream(s, "gather") for s in self.seeds]
+        self._weather_rng = [_rng_stream(s, "weather") for s in self.seeds]
+        self._injury_rng = [_rng_stream(s, "injury") for s in self.seeds]
+
+    def _template(self, template_id: str) -> int:
+        idx = self._tpl_index.get(template_id)
+        if idx is None:
+            idx = self._tpl_index[template_id] = len(self._templates)
+            self._templates.append(template_id)
+            item = create_item(template_id)
+            tags = item.tags
+            self._tpl_data.append((
+                item.name, item.base_weight, tags.get("EDIBLE"), "SHARP" in tags,
+                item.get_attr("insulation", 0.0) if "CLOTHING" in tags else None,
+                frozenset(tags), item.get_attr("durability", 0.5),
+            ))
+        return idx
+
+    # -- Masken ---------------------------------------------------------------
+
+    def _worlds(self, mask):
+        if mask is None:
+            return range(self.n)
+        return [i for i, m in enumerate(mask) if m]
+
+    def alive(self) -> List[bool]:
+        return [h > 0 for h in self.hp]
+
+    # -- Zeit -----------------------------------------------------------------
+
+    def advance(self, ticks: int, effort_multiplier: float = 1.0, mask=None):
+        """Zeit für die maskierten Welten (wie GameEngine._advance_time)."""
+        for i in self._worlds(mask):
+            self._advance(i, ticks, effort_multiplier)
+
+    def _advance(self, i: int, ticks: int, effort: float):
+        tick = self.tick[i] + ticks
+        self.tick[i] = tick
+        if self._weather_due[i] <= tick:
+            if tick % 12 == 0:
+                self.weather[i] = self._weather_keys.index(
+                    self._weather_rng[i].choice(self._weather_keys))
+            self._weather_due[i] = _next_weather_tick(tick)
+
+        # Regeneration der noch regenerierenden Nodes; wer wieder voll und
+        # nicht erschöpft ist, fällt aus der Liste (gather trägt ihn neu ein).
+        active = self._regen_active[i]
+        if active:
+            stock, depleted, node_regen = self.stock, self.depleted, self._node_regen
+            base = i * self._k
+            rest = []
+            for j in active:
+                _, max_stock, regen, cost = node_regen[j]
+                b = base + j
+                s = min(max_stock, stock[b] + regen * ticks)
+                stock[b] = s
+                if depleted[b] and s >= cost:
+                    depleted[b] = 0
+                if s != max_stock or depleted[b] or regen < 0:
+                    rest.append(j)
+            self._regen_active[i] = rest
+
+        energy = max(0, self.energy[i] - 5.0 * effort * ticks)
+        self.energy[i] = energy
+        hp = self.hp[i]
+        if energy <= 0:
+            hp -= 2.0 * ticks
+
+        loc = self.location[i]
+        w = self.weather[i]
+        ambient = self._ambient[loc][w][self.tick[i] % DAY_TICKS]
+        fire_warmth = 0.0
+        f = i * len(self._loc_ids) + loc
+        if self.fire_active[f] and self.fire_fuel[f] > 0:
+            fire_warmth = FIRE_HEAT
+            fuel = max(0.0, self.fire_fuel[f] - ticks)
+            self.fire_fuel[f] = fuel
+            if fuel <= 0:
+                self.fire_active[f] = 0
+        exposure = self._exposure[loc][w]
+        insulation = self._insulation(i)
+        effective = ambient + fire_warmth
+        body = self.body_temp[i]
+        temp_loss = (body - effective) * 0.01 * exposure * (1.0 - min(0.9, insulation))
+        body -= temp_loss * ticks
+        self.body_temp[i] = body
+        if body < 35.0 or body > 40.0:
+            hp -= 1.0 * ticks
+        if self.cut[i]:
+            hp -= CUT_BLEED_PER_TICK * ticks
+        self.hp[i] = hp
+
+    def _insulation(self, i: int):
+        # Ohne sammelbare Kleidung bleibt die Isolation 0 (wie die leere Summe).
+        if not self._has_clothing:
+            return 0
+        tpl = self._tpl_data
+        return sum(tpl[s[0]][4] for s in self.stacks[i] if tpl[s[0]][4] is not None)
+
+    # -- Aktionen -------------------------------------------------------------
+
+    def travel(self, dest, mask=None):
+        """Reisen: `dest` ist eine Orts-ID oder eine ID pro Welt."""
+        per_world = not isinstance(dest, str)
+        for i in self._worlds(mask):
+            lid = dest[i] if per_world else dest
+            if lid not in self._loc_index:
+                raise KeyError(f"Unbekannte Location: {lid}")
+            self.location[i] = self._loc_index[lid]
+            self._advance(i, 3, 1.5)
+
+    def light_fire(self, fuel: float, mask=None):
+        """Setzt am aktuellen Ort ein Feuer mit `fuel` Brennstoff-Ticks."""
+        nloc = len(self._loc_ids)
+        for i in self._worlds(mask):
+            f = i * nloc + self.location[i]
+            self.fire_active[f] = 1
+            self.fire_fuel[f] = fuel
+
+    def gather(self, mask=None):
+        """Sammeln am aktuellen Ort (wie GameEngine.gather)."""
+        tpl, static, node_tpl = self._tpl_data, self._node_static, self._node_tpl
+        stock, depleted = self.stock, self.depleted
+        for i in self._worlds(mask):
+            effort = 2.0 + (STRAIN_EFFORT_MALUS if self.strain[i] else 0.0)
+            self._advance(i, 1, effort)
+            loc = self.location[i]
+            start, end = self._loc_nodes[loc]
+            base = i * self._k
+            rng = self._gather_rng[i]
+            stacks = self.stacks[i]
+            for j in range(start, end):
+                chance, max_stock, _, cost, qmin, qmax, req_perc, req_tool = static[j]
+                if self._perception < req_perc:
+                    continue
+                tool = None
+                if req_tool:
+                    tool = next((s for s in stacks
+                                 if req_tool in tpl[s[0]][5] and s[2] > 0), None)
+                    if tool is None:
+                        continue
+                s = stock[base + j]
+                if s <= 0 or depleted[base + j]:
+                    continue
+                if rng.random() <= chance * (s / max_stock):
+                    qty = rng.randint(qmin, qmax)
+                    t = node_tpl[j]
+                    if self._add(stacks, t, qty):
+                        s = max(0.0, s - cost)
+                        stock[base + j] = s
+                        if s < cost:
+                            depleted[base + j] = 1
+                        active = self._regen_active[i]
+                        if j not in active:
+                            active.append(j)
+                        inj = self._injury_rng[i]
+                        if tpl[t][3] and inj.random() < INJURE_CUT_CHANCE:
+                            self.cut[i] = 1
+                        if self._loc_exposure[loc] >= 0.8 and inj.random() < INJURE_STRAIN_CHANCE:
+                            self.strain[i] = 1
+                        if tool is not None:
+                            wear = 0.05 / tpl[tool[0]][6]
+                            tool[2] = max(0, tool[2] - round(wear, 2))
+                            if tool[2] <= 0:
+                                # list.remove-Semantik: erster gleicher Stack
+                                stacks.remove(tool)
+
+    def _add(self, stacks: list, t: int, qty: int) -> bool:
+        tpl = self._tpl_data
+        weight = tpl[t][1]
+        if sum(tpl[s[0]][1] * s[1] for s in stacks) + weight * qty > self._capacity:
+            return False
+        name = tpl[t][0]
+        for s in stacks:
+            if tpl[s[0]][0] == name and s[2] == 1.0:
+                s[1] += qty
+                return True
+        stacks.append([t, qty, 1.0])
+        return True
+
+    def eat_best(self, mask=None):
+        """Isst das nahrhafteste essbare Item (bei Gleichstand den ersten Stack)."""
+        tpl = self._tpl_data
+        for i in self._worlds(mask):
+            stacks = self.stacks[i]
+            best = None
+            for s in stacks:
+                kcal = tpl[s[0]][2]
+                if kcal is not None and (best is None or kcal > tpl[best[0]][2]):
+                    best = s
+            if best is None:
+                continue
+            kcal = tpl[best[0]][2]
+            self.energy[i] = min(self._max_energy, self.energy[i] + kcal)
+            self.hp[i] = min(self._max_hp, self.hp[i] + (kcal / 20))
+            if best[1] > 1:
+                best[1] -= 1
+            else:
+                stacks.remove(best)
+
+    # -- Auswertung -----------------------------------------------------------
+
+    def count_template(self, i: int, template_id: str) -> int:
+        t = self._tpl_index.get(template_id)
+        return sum(s[1] for s in self.stacks[i] if s[0] == t)
+
+    def aggregates(self, mask=None) -> Dict[str, float]:
+        """Mittelwerte über die (maskierten) Welten plus Anzahl Lebender."""
+        worlds = list(self._worlds(mask))
+        n = max(1, len(worlds))
+        return {
+            "energy": sum(self.energy[i] for i in worlds) / n,
+            "hp": sum(self.hp[i] for i in worlds) / n,
+            "body_temp": sum(self.body_temp[i] for i in worlds) / n,
+            "alive": sum(1 for i in worlds if self.hp[i] > 0),
+        }
@@ -0,0 +1,95 @@
+"""
+engine/climate.py
+Vorberechnete Klimatabellen: Umgebungstemperatur und Exposition je Ort × Wetter.
+
+Die Umgebungstemperatur hängt nur von Ort, Wetter und Tageszeit ab
+(`base_temp + temp_mod + Nacht-Malus`), die effektive Exposition nur von Ort
+und Wetter (`exposure * exposure_mod`). Beides wird einmal pro Content-Stand
+tabelliert — `[Ort][Wetter][tick % DAY_TICKS]` bzw. `[Ort][Wetter]` — und mit
+exakt denselben Float-Operationen wie die frühere Einzelrechnung befüllt.
+`climate_table()` teilt die zuletzt gebaute Tabelle mit allen Engines, deren
+Orte und Wettertypen dieselben Werte haben. Die Tabelle merkt sich ihre
+Eingangswerte je Ort und Wetter; `is_current()` prüft einen Eintrag gegen die
+lebenden Objekte, damit In-place-Änderungen (`loc.base_temp = …`,
+`weather_types["RAIN"]["temp_mod"] = …`) einen Neubau auslösen.
+"""
+from typing import Dict, Iterable, Optional, Tuple
+
+DAY_TICKS = 144      # 144 Ticks = 24h, 6 Ticks pro Stunde
+NIGHT_MOD = -10      # Nachts kälter: hour < 6 oder hour > 20
+
+
+def night_mod(tick: int) -> int:
+    """Tag/Nacht-Malus zur Uhrzeit `tick`."""
+    hour = (tick % DAY_TICKS) / 6
+    return NIGHT_MOD if (hour < 6 or hour > 20) else 0
+
+
+def _source_key(locations: Iterable, weather_types: Dict[str, dict]) -> tuple:
+    """Alle Eingangswerte der Tabelle (nicht die Objekte — Locations werden
+    pro Engine neu angelegt)."""
+    return (tuple((loc.id, loc.base_temp, loc.exposure) for loc in locations),
+            tuple((key, w["temp_mod"], w["exposure_mod"]) for key, w in weather_types.items()))
+
+
+class ClimateTable:
+    """Klima aller Orte, vorberechnet aus Locations und Wettertypen.
+
+    Unveränderlich nach dem Aufbau; Engines mit demselben Content (Prototyp,
+    Forks) teilen sich eine Tabelle. `site_exposure` ist die Exposition des
+    Orts ohne Wetter (Ruhe-/Zerrungs-Schwellen), `exposure` die effektive.
+    """
+
+    def __init__(self, locations: Iterable, weather_types: Dict[str, dict]):
+        locations = tuple(locations)
+        self.source = _source_key(locations, weather_types)
+        # Eingangswerte je Ort bzw. Wetter (für is_current()).
+        self.sites: Dict[str, Tuple[float, float]] = {
+            loc.id: (loc.base_temp, loc.exposure) for loc in locations}
+        self.weathers: Dict[str, Tuple[float, float]] = {
+            key: (w["temp_mod"], w["exposure_mod"]) for key, w in weather_types.items()}
+        self.site_exposure: Dict[str, float] = {loc.id: loc.exposure for loc in locations}
+        self.ambient: Dict[str, Dict[str, Tuple[float, ...]]] = {}
+        self.exposure: Dict[str, Dict[str, float]] = {}
+        nights = tuple(night_mod(m) for m in range(DAY_TICKS))
+        for loc in locations:
+            ambient = self.ambient[loc.id] = {}
+            exposure = self.exposure[loc.id] = {}
+            for key, weather in weather_types.items():
+                base = loc.base_temp + weather["temp_mod"]
+                ambient[key] = tuple(base + n for n in nights)
+                exposure[key] = loc.exposure * weather["exposure_mod"]
+
+    def matches_source(self, locations: Iterable, weather_types: Dict[str, dict]) -> bool:
+        """Ob die Tabelle zu diesen Orts- und Wetterwerten gebaut wurde."""
+        return self.source == _source_key(locations, weather_types)
+
+    def is_current(self, loc, key: str, weather: dict) -> bool:
+        """Ob der Eintrag (`loc`, Wetter `key`) noch zu den aktuellen Werten
+        von Ort und Wettertyp passt — O(1), für jeden Zeitschritt."""
+        site = self.sites.get(loc.id)
+        mods = self.weathers.get(key)
+        return (site is not None and mods is not None
+                and site[0] == loc.base_temp and site[1] == loc.exposure
+                and mods[0] == weather["temp_mod"] and mods[1] == weather["exposure_mod"])
+
+    def ambient_at(self, location_id: str, tick: int, weather: str) -> float:
+        """Umgebungstemperatur (ohne Feuer) am Ort zur Uhrzeit `tick`."""
+        return self.ambient[location_id][weather][tick % DAY_TICKS]
+
+    def exposure_at(self, location_id: str, weather: str) -> float:
+        """Effektive Exposition (Ort × Wetter-Faktor)."""
+        return self.exposure[location_id][weather]
+
+
+# Zuletzt gebaute Tabelle; geteilt, solange Orte und Wetter dieselben Werte haben.
+_table: Optional[ClimateTable] = None
+
+
+def climate_table(locations: Iterable, weather_types: Dict[str, dict]) -> ClimateTable:
+    """Geteilte Klimatabelle zu `locations` × `weather_types` (nur lesen)."""
+    global _table
+    locations = tuple(locations)
+    if _table is None or not _table.matches_source(locations, weather_types):
+        _table = ClimateTable(locations, weather_types)
+    return _table
@@ -2,25 +2,252 @@
 engine/components.py
 Erweiterte Entitäten mit Thermodynamik-Attributen.
 """
+from bisect import insort
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Set
+from operator import attrgetter
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Any, Set, Tuple
+
+# Relative Rundungsschranke je Float-Operation der Gewichtssummen (großzügig 2·u).
+_EPS = 2.0 ** -52
+# Genauigkeit von Inventory.current_weight (relativ, ab 1 kg; darunter absolut).
+WEIGHT_REL_ERR = 1e-9
+
+
+class ItemProto:
+    """Geteilte, unveränderliche Template-Daten (Tags + Attribute) aller Items
+    eines Templates. `create_item` legt pro Template genau einen an; Items
+    lesen daraus, bis sie eigene Tags/Attribute bekommen (Copy-on-Write).
+    """
+    __slots__ = ("template_id", "tags", "attributes")
+
+    def __init__(self, template_id: str, tags: Dict[str, Any], attributes: Dict[str, float]):
+        self.template_id = template_id
+        self.tags = MappingProxyType(dict(tags))
+        self.attributes = MappingProxyType(dict(attributes))
+
+    def __repr__(self):
+        return f"ItemProto({self.template_id!r})"
+
+    # Geteilt bleibt geteilt: Kopien zeigen auf dasselbe Template.
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (ItemProto, (self.template_id, dict(self.tags), dict(self.attributes)))
+
+
+class _TemplateMap(MutableMapping):
+    """Veränderbare Sicht auf Tags bzw. Attribute eines Items, das (noch)
+    die geteilten Template-Daten liest.
+
+    Gelesen wird, was das Item gerade hat. Die erste Änderung kopiert die
+    Template-Daten und weist die Kopie dem Item zu (wie `set_tag`), im
+    Inventar samt Index-Pflege; das Template selbst bleibt unberührt.
+    """
+    __slots__ = ("_item", "_field", "_own")
+
+    def __init__(self, item: "Item", field: str, own: str):
+        self._item = item
+        self._field = field    # "tags" / "attributes"
+        self._own = own        # Slot der eigenen Kopie ("_tags" / "_attrs")
+
+    def _data(self) -> Mapping[str, Any]:
+        item = self._item
+        own = getattr(item, self._own)
+        return getattr(item._proto, self._field) if own is None else own
+
+    def __getitem__(self, key):
+        return self._data()[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._data()
+
+    def __iter__(self):
+        return iter(self._data())
+
+    def __len__(self) -> int:
+        return len(self._data())
+
+    def get(self, key, default=None):
+        return self._data().get(key, default)
+
+    def __setitem__(self, key, value):
+        data = dict(self._data())
+        data[key] = value
+        setattr(self._item, self._field, data)
+
+    def __delitem__(self, key):
+        data = dict(self._data())
+        del data[key]
+        setattr(self._item, self._field, data)
+
+    def __repr__(self):
+        return repr(dict(self._data()))
+
+
+# Zustand eines Items für copy/pickle (ohne Inventar-Anbindung).
+_ITEM_STATE = ("name", "base_weight", "quantity", "condition", "template_id",
+               "_proto", "_tags", "_attrs")
+
+
+def _indexed(name: str, doc: str) -> property:
+    """Item-Feld, das ein Inventar indiziert: liegt im Slot `_<name>`.
+    Zuweisungen an ein Item im Inventar laufen über dessen Index-Pflege
+    (Gewicht, Tag-/Template-/Stack-Index), sonst direkt in den Slot."""
+    raw = "_" + name
+
+    def fset(item, value):
+        owner = item._owner
+        if owner is None:
+            object.__setattr__(item, raw, value)
+        else:
+            owner._update_item(item, name, value)
+
+    return property(attrgetter(raw), fset, doc=doc)
+
 
-@dataclass
 class Item:
-    name: str
-    base_weight: float
-    tags: Dict[str, Any] = field(default_factory=dict)
-    quantity: int = 1
-    condition: float = 1.0 
-    attributes: Dict[str, float] = field(default_factory=dict)
-    template_id: str = ""
+    """Ein Item-Stack. Slotted, Felder und ==/repr wie die frühere Dataclass.
+
+    Tags und Attribute kommen entweder aus einem geteilten `ItemProto` oder
+    aus eigenen Dicts. Solange ein Item das Template liest, liefern `tags`
+    und `attributes` eine veränderbare Sicht darauf (`_TemplateMap`); die
+    erste Änderung — per Zuweisung, `set_tag`/`set_attr` oder direkt wie
+    `item.tags["X"] = True` — legt eine eigene Kopie an. Items ohne Proto
+    (Werkzeuge, Tests) besitzen ihre Dicts von Anfang an.
+    """
+    # Inventar-Anbindung: das Inventar, dessen Indizes dieses Item führt, wie
+    # oft es dort liegt und sein Reihenfolge-Schlüssel (`_refs`/`_seq` setzt
+    # erst Inventory._attach).
+    __slots__ = ("_name", "_base_weight", "_quantity", "_condition", "_template_id",
+                 "_proto", "_tags", "_attrs", "_owner", "_refs", "_seq")
+    __hash__ = None
+
+    def __init__(self, name: str, base_weight: float, tags: Optional[Dict[str, Any]] = None,
+                 quantity: int = 1, condition: float = 1.0,
+                 attributes: Optional[Dict[str, float]] = None, template_id: str = "",
+                 proto: Optional[ItemProto] = None):
+        self._owner = None
+        self._name = name
+        self._base_weight = base_weight
+        self._quantity = quantity
+        self._condition = condition
+        self._template_id = template_id
+        self._proto = proto
+        if proto is None:
+            self._tags = {} if tags is None else tags
+            self._attrs = {} if attributes is None else attributes
+        else:
+            self._tags = tags
+            self._attrs = attributes
+
+    name = _indexed("name", "Anzeigename (Stack-Schlüssel).")
+    base_weight = _indexed("base_weight", "Gewicht pro Stück in kg.")
+    quantity = _indexed("quantity", "Stückzahl des Stacks.")
+    condition = _indexed("condition", "Zustand 0..1 (Stack-Schlüssel).")
+    template_id = _indexed("template_id", "Template-ID oder \"\".")
+
+    def __getstate__(self):
+        return {key: getattr(self, key) for key in _ITEM_STATE}
+
+    def __setstate__(self, state):
+        self._owner = None
+        for key in _ITEM_STATE:
+            setattr(self, key, state[key])
+
+    def _record(self) -> tuple:
+        """Zustand als Tupel für Inventory.snapshot(); geteilte Protos bleiben
+        geteilt, eigene Dicts werden kopiert."""
+        tags, attrs = self._tags, self._attrs
+        return (self.name, self.base_weight, self.quantity, self.condition,
+                self.template_id, self._proto,
+                None if tags is None else dict(tags),
+                None if attrs is None else dict(attrs))
+
+    @classmethod
+    def _from_record(cls, record: tuple) -> "Item":
+        name, weight, quantity, condition, template_id, proto, tags, attrs = record
+        return cls(name, weight, None if tags is None else dict(tags), quantity,
+                   condition, None if attrs is None else dict(attrs), template_id, proto)
+
+    def __eq__(self, other):
+        # Feldweise in Dataclass-Reihenfolge (name, base_weight, tags, quantity,
+        # condition, attributes, template_id), mit Abbruch beim ersten Unterschied.
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self._name == other._name and self._base_weight == other._base_weight
+                and self.tag_data() == other.tag_data() and self._quantity == other._quantity
+                and self._condition == other._condition
+                and self.attr_data() == other.attr_data()
+                and self._template_id == other._template_id)
+
+    def __repr__(self):
+        return (f"Item(name={self.name!r}, base_weight={self.base_weight!r}, "
+                f"tags={dict(self.tag_data())!r}, quantity={self.quantity!r}, "
+                f"condition={self.condition!r}, attributes={dict(self.attr_data())!r}, "
+                f"template_id={self.template_id!r})")
+
+    @property
+    def tags(self) -> "MutableMapping[str, Any]":
+        own = self._tags
+        return _TemplateMap(self, "tags", "_tags") if own is None else own
+
+    @tags.setter
+    def tags(self, value: Dict[str, Any]):
+        owner = self._owner
+        if owner is None:
+            self._tags = value
+        else:
+            owner._update_item(self, "tags", value)
+
+    @property
+    def attributes(self) -> "MutableMapping[str, float]":
+        own = self._attrs
+        return _TemplateMap(self, "attributes", "_attrs") if own is None else own
+
+    @attributes.setter
+    def attributes(self, value: Dict[str, float]):
+        self._attrs = value
+
+    def tag_data(self) -> Mapping[str, Any]:
+        """Tags nur zum Lesen — ohne Sicht-Objekt, für heiße Pfade."""
+        own = self._tags
+        return self._proto.tags if own is None else own
+
+    def attr_data(self) -> Mapping[str, float]:
+        """Attribute nur zum Lesen (vgl. `tag_data`)."""
+        own = self._attrs
+        return self._proto.attributes if own is None else own
+
+    def set_tag(self, tag: str, value: Any = True):
+        """Setzt einen Tag auf einer eigenen Kopie (Template bleibt unberührt)."""
+        tags = dict(self.tag_data())
+        tags[tag] = value
+        self.tags = tags
+
+    def remove_tag(self, tag: str):
+        tags = dict(self.tag_data())
+        tags.pop(tag, None)
+        self.tags = tags
+
+    def set_attr(self, key: str, value: float):
+        """Setzt ein Attribut auf einer eigenen Kopie (Template bleibt unberührt)."""
+        attrs = dict(self.attr_data())
+        attrs[key] = value
+        self.attributes = attrs
 
     @property
     def total_weight(self):
         return self.base_weight * self.quantity
 
     def get_attr(self, key: str, default: float = 0.0) -> float:
-        return self.attributes.get(key, default)
+        own = self._attrs
+        return (self._proto.attributes if own is None else own).get(key, default)
 
 @dataclass
 class ToolBlueprint:
@@ -31,34 +258,364 @@ class ToolBlueprint:
     min_survival_req: float = 0.0
     tool_tags: List[str] = field(default_factory=list)
 
-@dataclass
+
+def _seq_of(item: Item) -> int:
+    return item._seq
+
+
+class ItemList(list):
+    """Die Item-Liste eines Inventars: eine normale Liste (Reihenfolge und
+    Index-Zugriff wie gehabt, `eat(item_index)`), deren verändernde Methoden
+    die Indizes des Inventars mitführen. Auch direkte Eingriffe
+    (`items.append/remove/clear`, wie in Tests und Tools) bleiben konsistent.
+    """
+
+    def __init__(self, inventory: "Inventory", items=()):
+        super().__init__()
+        self._inv = inventory
+        self.extend(items)
+
+    def __reduce_ex__(self, protocol):
+        # Kopien/Pickles als einfache Liste; das Inventar baut sie wieder ein.
+        return (list, (list(self),))
+
+    def append(self, item: Item):
+        self._inv._attach(item, self._inv._next_seq())
+        super().append(item)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __contains__(self, item) -> bool:
+        # Ein Item, das dieses Inventar führt, liegt sicher in der Liste —
+        # sonst wie list: Vergleich per Item.__eq__.
+        return getattr(item, "_owner", None) is self._inv or super().__contains__(item)
+
+    def remove(self, item: Item):
+        # list.remove-Semantik: erstes *gleiches* Element (Item.__eq__).
+        del self[self.index(item)]
+
+    def pop(self, index: int = -1) -> Item:
+        item = self[index]
+        del self[index]
+        return item
+
+    def clear(self):
+        for item in self:
+            self._inv._detach(item)
+        super().clear()
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            super().__delitem__(index)
+            self._inv._rebuild()
+            return
+        self._inv._detach(self[index])
+        super().__delitem__(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            super().__setitem__(index, value)
+            self._inv._rebuild()
+            return
+        old = self[index]
+        self._inv._detach(old)
+        self._inv._attach(value, old._seq)
+        super().__setitem__(index, value)
+
+    def insert(self, index: int, item: Item):
+        super().insert(index, item)
+        self._inv._rebuild()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._inv._rebuild()
+
+    def reverse(self):
+        super().reverse()
+        self._inv._rebuild()
+
+    def __imul__(self, n):
+        super().__imul__(n)
+        self._inv._rebuild()
+        return self
+
+
 class Inventory:
-    capacity_kg: float = 20.0
-    items: List[Item] = field(default_factory=list)
+    """Inventar mit laufendem Gewicht und Indizes.
+
+    `items` bleibt die geordnete Liste (Stacks in Aufnahme-Reihenfolge). Daneben
+    geführt: das Gesamtgewicht als laufende Float-Summe samt Schranke ihres
+    Rundungsfehlers (nahe der Kapazität bzw. bei zu großem Fehler wird exakt
+    wie früher neu summiert), Tag → Items, template_id → Stacks samt Gesamtmenge und der
+    Stack-Schlüssel (name, condition) fürs Zusammenlegen. Alle Index-Listen sind
+    nach Listen-Reihenfolge sortiert, "das erste Item mit …" bleibt also
+    dasselbe wie beim linearen Durchlauf. Ein Item gehört zu höchstens einem
+    Inventar; `set_tag` meldet sich selbst, eigene Tag-Dicts, die *in place*
+    geändert werden, meldet `reindex(item)` an.
+
+    Wer wissen will, was sich seit der letzten Abfrage geändert hat (z.B. die
+    Prozess-Verfügbarkeit der Engine), schaltet mit `watch()` das Mitschreiben
+    berührter Templates und Tags ein und holt sie mit `take_changes()` ab.
+    """
+
+    def __init__(self, capacity_kg: float = 20.0, items: Optional[List[Item]] = None):
+        self.capacity_kg = capacity_kg
+        # Berührte (Templates, Tags) seit take_changes(); None = niemand schaut zu.
+        self._watch: Optional[Tuple[set, set]] = None
+        self._watch_all = False
+        self._reset_index()
+        self._items = ItemList(self, items or ())
+
+    def __repr__(self):
+        return f"Inventory(capacity_kg={self.capacity_kg!r}, items={list(self._items)!r})"
+
+    def __getstate__(self):
+        # Indizes sind abgeleitet: Kopien/Pickles tragen nur Kapazität + Liste.
+        return {"capacity_kg": self.capacity_kg, "items": list(self._items)}
+
+    def __setstate__(self, state):
+        self.__init__(state["capacity_kg"], state["items"])
+
+    def snapshot(self) -> tuple:
+        """Abzug (Kapazität + Item-Zustände), unabhängig von späteren Änderungen."""
+        return (self.capacity_kg, tuple(it._record() for it in self._items))
+
+    @classmethod
+    def from_snapshot(cls, state: tuple) -> "Inventory":
+        """Frisches Inventar (eigene Item-Objekte) aus einem `snapshot()`."""
+        capacity, records = state
+        return cls(capacity, [Item._from_record(r) for r in records])
+
+    @property
+    def items(self) -> ItemList:
+        return self._items
+
+    @items.setter
+    def items(self, items: List[Item]):
+        self._items.clear()
+        self._items.extend(items)
+
+    # -- Index-Pflege --------------------------------------------------------
+
+    def _reset_index(self):
+        self._weight = 0.0
+        self._weight_err = 0.0
+        self._seq_counter = 0
+        self._by_tag: Dict[str, List[Item]] = {}
+        self._by_template: Dict[str, List[Item]] = {}
+        self._template_qty: Dict[str, int] = {}
+        self._by_key: Dict[tuple, List[Item]] = {}
+
+    def _next_seq(self) -> int:
+        self._seq_counter += 1
+        return self._seq_counter
+
+    def _attach(self, item: Item, seq: int):
+        if item._owner is not self:
+            item._owner = self
+            item._refs = 0
+            item._seq = seq
+        item._refs += 1
+        self._index(item)
+
+    def _detach(self, item: Item):
+        self._unindex(item)
+        item._refs -= 1
+        if item._refs <= 0:
+            item._owner = None
+
+    def _touch(self, item: Item, tags: bool = True):
+        watch = self._watch
+        if watch is not None:
+            watch[0].add(item.template_id)
+            if tags:
+                watch[1].update(item.tag_data())
+
+    def _add_weight(self, dw: float):
+        # Laufende Float-Summe plus Schranke ihres Rundungsfehlers (je Schritt
+        # höchstens 2⁻⁵² von Summand und Ergebnis, inkl. Produkt-Rundung).
+        w = self._weight + dw
+        self._weight = w
+        self._weight_err += (w + abs(dw)) * _EPS
+
+    def _index(self, item: Item):
+        if self._watch is not None:
+            self._touch(item)
+        self._add_weight(item.base_weight * item.quantity)
+        tid = item.template_id
+        self._template_qty[tid] = self._template_qty.get(tid, 0) + item.quantity
+        insort(self._by_template.setdefault(tid, []), item, key=_seq_of)
+        insort(self._by_key.setdefault((item.name, item.condition), []), item, key=_seq_of)
+        for tag in item.tag_data():
+            insort(self._by_tag.setdefault(tag, []), item, key=_seq_of)
+
+    def _unindex(self, item: Item, tags: bool = True):
+        if self._watch is not None:
+            self._touch(item, tags)
+        self._add_weight(-(item.base_weight * item.quantity))
+        tid = item.template_id
+        self._template_qty[tid] -= item.quantity
+        _drop(self._by_template, tid, item)
+        _drop(self._by_key, (item.name, item.condition), item)
+        if tags:
+            for tag in item.tag_data():
+                _drop(self._by_tag, tag, item)
+
+    def _update_item(self, item: Item, name: str, value):
+        if name == "quantity":
+            # Häufigster Fall (Stacks zusammenlegen/verbrauchen): nur Zahlen.
+            delta = (value - item.quantity) * item._refs
+            self._add_weight(item.base_weight * delta)
+            self._template_qty[item.template_id] += delta
+            if self._watch is not None:
+                self._watch[0].add(item.template_id)
+            item._quantity = value
+            return
+        for _ in range(item._refs):
+            self._unindex(item)
+        object.__setattr__(item, "_" + name, value)
+        for _ in range(item._refs):
+            self._index(item)
+
+    def reindex(self, item: Item):
+        """Nach In-place-Änderungen an `item.tags` die Indizes nachziehen."""
+        refs = item._refs if item._owner is self else 0
+        for _ in range(refs):
+            self._unindex(item, tags=False)
+        # Die alten Tags sind nicht mehr bekannt (in place geändert) — das Item
+        # aus allen Tag-Listen streichen.
+        for tag, lst in list(self._by_tag.items()):
+            kept = [it for it in lst if it is not item]
+            if len(kept) == len(lst):
+                continue
+            if self._watch is not None:
+                self._watch[1].add(tag)
+            lst[:] = kept
+            if not lst:
+                del self._by_tag[tag]
+        for _ in range(refs):
+            self._index(item)
+
+    def _rebuild(self):
+        """Reihenfolge geändert (insert/sort/…): Schlüssel und Indizes neu."""
+        items = list(self._items)
+        for item in items:
+            item._owner = None
+        self._reset_index()
+        self._watch_all = True
+        for item in items:
+            self._attach(item, self._next_seq())
+
+    def watch(self):
+        """Schaltet das Mitschreiben berührter Templates/Tags ein (idempotent)."""
+        if self._watch is None:
+            self._watch = (set(), set())
+            self._watch_all = True
+
+    def take_changes(self) -> Optional[Tuple[set, set]]:
+        """Seit dem letzten Aufruf berührte (Templates, Tags) und Neubeginn.
+
+        None heißt "alles" — direkt nach `watch()` oder nach einem Umbau der
+        Indizes (`_rebuild`).
+        """
+        changes = self._watch
+        if changes is None:
+            return None
+        self._watch = (set(), set())
+        if self._watch_all:
+            self._watch_all = False
+            return None
+        return changes
+
+    # -- Abfragen ------------------------------------------------------------
 
     @property
     def current_weight(self) -> float:
-        return sum(i.total_weight for i in self.items)
+        """Gesamtgewicht aus der laufenden Summe — auf WEIGHT_REL_ERR genau;
+        ist die Fehlerschranke größer, wird neu summiert."""
+        if not self._items:
+            self._weight = self._weight_err = 0.0
+        elif self._weight_err > WEIGHT_REL_ERR * (abs(self._weight) + 1.0):
+            self._resum()
+        return self._weight
+
+    def _resum(self) -> float:
+        """Summiert die Gewichte neu (wie früher) und setzt die laufende Summe neu auf."""
+        weight = sum(i.total_weight for i in self._items)
+        self._weight = weight
+        self._weight_err = (len(self._items) + 4) * _EPS * (abs(weight) + 1.0)
+        return weight
+
+    def _exceeds_capacity(self, new_item: Item) -> bool:
+        """Ob `new_item` die Kapazität sprengt — entschieden wie früher über die
+        Float-Summe `sum(total_weight) + total_weight`.
+
+        Die laufende Summe entscheidet in O(1), solange sie weiter von der
+        Grenze entfernt ist als ihr eigener Fehler plus die Rundungsabweichung
+        der Float-Summe ((n+4)·2⁻⁵² relativ, Gewichte ≥ 0). Nur im Grenzband wird wie bisher
+        summiert — das hält Grenzfälle bit-gleich und setzt die laufende Summe
+        neu auf.
+        """
+        add = new_item.total_weight
+        total = self._weight + add
+        cap = self.capacity_kg
+        tol = self._weight_err + (len(self._items) + 6) * _EPS * (total + add + 1.0)
+        if total > cap + tol:
+            return True
+        if total < cap - tol:
+            return False
+        return self._resum() + add > cap
 
     def add(self, new_item: Item) -> bool:
-        if self.current_weight + new_item.total_weight > self.capacity_kg:
+        if self._exceeds_capacity(new_item):
             return False
-        for existing in self.items:
-            if existing.name == new_item.name and existing.condition == new_item.condition:
-                existing.quantity += new_item.quantity
-                return True
-        self.items.append(new_item)
+        stack = self._by_key.get((new_item.name, new_item.condition))
+        if stack:
+            stack[0].quantity += new_item.quantity
+            return True
+        self._items.append(new_item)
         return True
 
     def find_item_by_tag(self, tag: str) -> Optional[Item]:
-        for item in self.items:
-            if tag in item.tags and item.condition > 0:
+        for item in self._by_tag.get(tag, ()):
+            if item.condition > 0:
                 return item
         return None
 
+    def items_with_tag(self, tag: str) -> List[Item]:
+        """Alle Items mit `tag`, in Listen-Reihenfolge (auch zerbrochene)."""
+        return list(self._by_tag.get(tag, ()))
+
+    def stacks_of(self, template_id: str) -> List[Item]:
+        """Alle Stacks eines Templates, in Listen-Reihenfolge."""
+        return list(self._by_template.get(template_id, ()))
+
+    def count_template(self, template_id: str) -> int:
+        """Gesamtmenge eines Templates über alle Stacks."""
+        return self._template_qty.get(template_id, 0)
+
     def get_total_insulation(self) -> float:
         """Summiert die Isolationswerte aller getragenen/vorhandenen Kleidung."""
-        return sum(it.get_attr("insulation", 0.0) for it in self.items if "CLOTHING" in it.tags)
+        return sum(it.get_attr("insulation", 0.0) for it in self._by_tag.get("CLOTHING", ()))
+
+
+def _drop(index: Dict[Any, List[Item]], key, item: Item):
+    """Entfernt ein Vorkommen von `item` (Identität) aus index[key]."""
+    lst = index.get(key)
+    if lst is None:
+        return
+    for i, it in enumerate(lst):
+        if it is item:
+            del lst[i]
+            break
+    if not lst:
+        del index[key]
 
 class Player:
     def __init__(self, name: str):
@@ -2,14 +2,23 @@
 engine/core.py
 Zentrale Logik inklusive Wetter- und Temperatur-Simulation.
 """
+import functools
+import heapq
+import math
 import random
-import itertools
-from typing import List, Dict, Any
-from engine.components import Player, Item, ToolBlueprint
-from data.locations import get_all_locations
+from collections.abc import Mapping
+from enum import IntEnum
+from typing import List, Dict, Any, NamedTuple, Tuple
+from engine.components import Inventory, Player, Item, ToolBlueprint
+from engine.availability import ProcessAvailability
+from engine.climate import DAY_TICKS, climate_table
+from engine.memo import ExperimentMemo
+from engine.tags import BlueprintIndex, CompiledBlueprint, first_assignment, overlap_and_missing, tags_mask
+from data.locations import clone_locations, get_all_locations
 from data.items import create_item, TEMPLATE_DB
 from data.blueprints import get_all_blueprints
 from data.processes import get_all_processes
+from data.loader import load_content
 
 # Spielersprachliche Labels für Tags — die Brücke von internem Reason zu Text.
 # Vollständig für alle im Spiel vorkommenden Tags (Konsistenz-Wächter in Tests).
@@ -71,8 +80,8 @@ TAG_FAMILIES = {
 def _slot_satisfied(item_tags, slot_value: str) -> bool:
     """Prüft, ob die Tags eines Items einen Slot erfüllen (Familie o. Einzel-Tag).
 
-    `item_tags` ist typischerweise ein Dict (Item.tags) oder ein Set (z.B. die
-    ge-sammelte Tag-Menge in _no_match_reason). `&` zwischen set und dict wirft
+    `item_tags` ist typischerweise ein Dict (Item.tags) oder ein Set (z.B. eine
+    gesammelte Tag-Menge). `&` zwischen set und dict wirft
     einen TypeError, daher Keywords explizit auslesen.
     """
     tags = item_tags.keys() if isinstance(item_tags, dict) else item_tags
@@ -82,6 +91,18 @@ def _slot_satisfied(item_tags, slot_value: str) -> bool:
     return slot_value in tags
 
 
+# Zuletzt kompilierter Blueprint-Index (engine/tags.py). Geteilt, solange die
+# Blueprint-Objekte dieselben sind (z.B. alle Klone von from_prototype).
+_bp_index = None
+
+
+def _blueprint_index(blueprints) -> BlueprintIndex:
+    global _bp_index
+    if _bp_index is None or not _bp_index.matches_source(blueprints):
+        _bp_index = BlueprintIndex(blueprints, TAG_FAMILIES)
+    return _bp_index
+
+
 def _label_for(tag: str) -> str:
     return TAG_LABELS.get(tag, f"etwas mit der Eigenschaft {tag}")
 
@@ -94,16 +115,93 @@ def _injury_label(kind: str) -> str:
     return INJURY_LABELS.get(kind, kind)
 
 
-def _missing_tags(bp, available) -> list:
-    """Repräsentierte fehlende Single-Tags eines Blueprints bzgl. der
-    verfügbaren Tag-Menge. Familien-Slots werden auf ihren Ziel-Tag aufgelöst.
-    Gibt die *fehlenden* Member zurück (leer → Voll-Treffer)."""
-    missing = []
-    for slot_value in bp.slots.values():
-        required = set(TAG_FAMILIES.get(slot_value, {slot_value}))
-        if not (required & available):
-            missing.append(next(iter(required)))
-    return missing
+class Reason(IntEnum):
+    """Ergebnis- und Meldungs-Codes als Zahl. Der Name ist der bisherige
+    Reason-String ohne Detail — `MISSING_TAG:FIBER` wird zu
+    `Reason.MISSING_TAG` mit Detail (Payload) `"FIBER"`."""
+    SUCCESS = 0
+    UNKNOWN = 1
+    NO_MATCH = 2
+    BROKEN_ITEM = 3
+    MISSING_TAG = 4
+    TOO_FEW_ITEMS = 5
+    NOT_ENOUGH_QUANTITY = 6
+    NEAR_MISS = 7
+    DEPLETED = 8
+    NOTHING_FOUND = 9
+    NO_FIRE = 10
+    MISSING_FUEL = 11
+    MISSING_ENV = 12
+    MISSING_INPUT = 13
+    MISSING_TOOL = 14
+    UNKNOWN_PROCESS = 15
+    NO_INJURY = 16
+    INVALID_ITEM = 17
+    NOT_EDIBLE = 18
+    UNKNOWN_LOCATION = 19
+    # Reine Meldungs-Codes (Zeit-/Verletzungs-Feedback, kein Aktions-Ergebnis)
+    FIRE_OUT = 20
+    BLEEDING = 21
+    TREATED = 22
+    HEALED = 23
+    INJURED = 24
+
+
+# Reasons, deren String-Code das Detail trägt ("MISSING_TAG:FIBER").
+_CODED_REASONS = frozenset((Reason.MISSING_TAG, Reason.NEAR_MISS, Reason.MISSING_ENV,
+                            Reason.MISSING_INPUT, Reason.MISSING_TOOL))
+
+# Reason-String → (Reason, Detail); wenige verschiedene Strings, daher gecacht.
+_REASON_CACHE: Dict[str, Tuple[Reason, str]] = {}
+
+
+def _parse_reason(code: str) -> Tuple[Reason, str]:
+    parsed = _REASON_CACHE.get(code)
+    if parsed is None:
+        name, _, detail = code.partition(":")
+        parsed = _REASON_CACHE[code] = (Reason.__members__.get(name, Reason.UNKNOWN), detail)
+    return parsed
+
+
+def _reason_code(reason: Reason, detail=None) -> str:
+    """String-Code wie bisher (`res["reason"]`): Name, ggf. mit Detail."""
+    if reason in _CODED_REASONS:
+        return f"{reason.name}:{detail}"
+    return reason.name
+
+
+# Meldungen ohne Detail, je Reason.
+_REASON_TEXT = {
+    Reason.TOO_FEW_ITEMS: "Dafür brauchst du mindestens zwei Dinge.",
+    Reason.NOT_ENOUGH_QUANTITY: "Dafür brauchst du mehr von demselben Material.",
+    Reason.NO_MATCH: "Die Kombination ergibt nichts.",
+    # SPEC-003: reines Ja/nein auf die gehaltene Teilmenge — bestätigt den
+    # Weg, verrät weder das fehlende Item noch den Tag (kein Rezept-Leak).
+    Reason.NEAR_MISS: "Einige dieser Dinge scheinen zusammenzugehören, aber es fehlt noch etwas.",
+    Reason.DEPLETED: "Diese Stelle ist erschöpft. Komm später zurück.",
+    Reason.FIRE_OUT: "Dein Feuer erlischt.",
+    Reason.NO_FIRE: "Hier brennt kein Feuer.",
+    Reason.MISSING_FUEL: "Es fehlt dir Brennholz zum Nachlegen.",
+    Reason.NO_INJURY: "Du bist nicht verletzt.",
+    # Generisch, kein Rezept-Leak: sagt nur, dass eine Behandlung fehlt,
+    # nicht welche Kombination sie herstellt.
+    Reason.BLEEDING: "Du blutest — die Wunde muss behandelt und du musst rasten.",
+    Reason.TREATED: "Die Wunde ist behandelt.",
+    Reason.HEALED: "Deine Wunde heilt.",
+}
+
+
+def _reason_text(reason: Reason, detail=None) -> str:
+    """Spielersprachliche Meldung zu Reason + Detail (Tag bzw. Item-Namen)."""
+    if reason == Reason.MISSING_TAG:
+        return f"Es fehlt dir {_label_for(detail)}."
+    if reason == Reason.MISSING_ENV:
+        return f"Hier fehlt {_label_for(detail)} in der Umgebung."
+    if reason == Reason.BROKEN_ITEM:
+        names = ", ".join(detail or [])
+        return f"{names} ist zerbrochen und kann nicht verwendet werden."
+    # UNKNOWN-Fallback — nie eine generische Leer-Meldung
+    return _REASON_TEXT.get(reason, "Das geht so nicht.")
 
 
 def _feedback_message(reason: str, broken_names: "List[str] | None" = None) -> str:
@@ -112,55 +210,363 @@ def _feedback_message(reason: str, broken_names: "List[str] | None" = None) -> s
     Verrät niemals mehr als der Reason hergibt — kein Rezept-Leaking. Wird der
     Code unkenntlich, gibt es eine generische (aber nicht lügende) Antwort.
     """
-    if reason.startswith("MISSING_TAG:"):
-        tag = reason.split(":", 1)[1]
-        return f"Es fehlt dir {_label_for(tag)}."
-    if reason == "TOO_FEW_ITEMS":
-        return "Dafür brauchst du mindestens zwei Dinge."
-    if reason == "NOT_ENOUGH_QUANTITY":
-        return "Dafür brauchst du mehr von demselben Material."
-    if reason == "BROKEN_ITEM":
-        names = ", ".join(broken_names or [])
-        return f"{names} ist zerbrochen und kann nicht verwendet werden."
-    if reason == "NO_MATCH":
-        return "Die Kombination ergibt nichts."
-    if reason.startswith("NEAR_MISS:"):
-        # SPEC-003: reines Ja/nein auf die gehaltene Teilmenge — bestätigt den
-        # Weg, verrät weder das fehlende Item noch den Tag (kein Rezept-Leak).
-        return "Einige dieser Dinge scheinen zusammenzugehören, aber es fehlt noch etwas."
-    if reason == "DEPLETED":
-        return "Diese Stelle ist erschöpft. Komm später zurück."
-    if reason == "FIRE_OUT":
-        return "Dein Feuer erlischt."
-    if reason == "NO_FIRE":
-        return "Hier brennt kein Feuer."
-    if reason == "MISSING_FUEL":
-        return "Es fehlt dir Brennholz zum Nachlegen."
-    if reason.startswith("MISSING_ENV:"):
-        tag = reason.split(":", 1)[1]
-        return f"Hier fehlt {_label_for(tag)} in der Umgebung."
-    if reason == "NO_INJURY":
-        return "Du bist nicht verletzt."
-    if reason == "BLEEDING":
-        # Generisch, kein Rezept-Leak: sagt nur, dass eine Behandlung fehlt,
-        # nicht welche Kombination sie herstellt.
-        return "Du blutest — die Wunde muss behandelt und du musst rasten."
-    if reason == "TREATED":
-        return "Die Wunde ist behandelt."
-    if reason == "HEALED":
-        return "Deine Wunde heilt."
-    return "Das geht so nicht."  # UNKNOWN-Fallback — nie eine generische Leer-Meldung
+    code, detail = _parse_reason(reason)
+    return _reason_text(code, broken_names if code == Reason.BROKEN_ITEM else detail)
+
+
+def _action_text(op: str, reason: Reason, payload=None, log=None) -> str:
+    """Meldung einer Aktion `op` (Methodenname) zu Reason + Payload; `log` sind
+    die Zeit-Meldungen, die an die Erfolgsmeldung angehängt werden."""
+    if reason == Reason.SUCCESS:
+        if op == "execute_experiment":
+            return f"Hergestellt: {payload}"
+        if op == "execute_process":
+            return f"Prozess ausgeführt: {payload}"
+        if op == "stoke_fire":
+            return (f"Du legst {payload} nach. " + (log or "")).strip()
+        if op == "eat":
+            return f"Du isst {payload[0]} und regenerierst {payload[1]} Energie."
+        if op == "travel":
+            return f"Gereist nach {payload}."
+        return ""
+    if reason == Reason.INVALID_ITEM:
+        return "Ungültiges Item."
+    if reason == Reason.NOT_EDIBLE:
+        return f"{payload} ist nicht essbar!"
+    if reason == Reason.UNKNOWN_LOCATION:
+        return "Unbekannt."
+    if reason == Reason.UNKNOWN_PROCESS:
+        return "Unbekannter Prozess."
+    if reason == Reason.MISSING_INPUT:
+        return f"Es fehlt dir {_template_name(payload)}."
+    if reason == Reason.MISSING_TOOL:
+        return f"Es fehlt dir {_label_for(payload)} als Werkzeug."
+    return _reason_text(reason, payload)
+
+
+# Zeit-Meldungen eines Simulationsschritts (_advance_time; wait() erzeugt pro
+# Tick exakt dieselben Zeilen).
+MSG_HUNGER = "!!! HUNGER-SCHADEN !!!"
+MSG_FIRE_OUT = "!!! FIRE_OUT: " + _reason_text(Reason.FIRE_OUT) + " !!!"
+MSG_HYPOTHERMIA = "!!! UNTERKÜHLUNG !!!"
+MSG_HEATSTROKE = "!!! HITZSCHLAG !!!"
+MSG_BLEEDING = "!!! " + _reason_text(Reason.BLEEDING) + " !!!"
+MSG_INJURED = "!!! " + _reason_text(Reason.INJURED) + " !!!"
+MSG_DEPLETED = _reason_text(Reason.DEPLETED)
+MSG_TOOL_BROKEN = "!!! {} zerbrochen !!!"
+
+
+def _healed_message(healed: List[str]) -> str:
+    return ("!!! " + _reason_text(Reason.HEALED)
+            + f" ({', '.join(map(_injury_label, healed))}) !!!")
+
+
+# Schlüssel der Dict-Sicht eines ActionResult, je Ergebnis-Art — in der
+# Reihenfolge der früheren Ergebnis-Dicts.
+_BASE_KEYS = ("success", "message", "reason")
+_EXPERIMENT_KEYS = _BASE_KEYS + ("blueprint_id", "result_template_id")
+_PROCESS_KEYS = _BASE_KEYS + ("process_id",)
+
+
+class ActionResult(Mapping):
+    """Ergebnis von execute_experiment, execute_process und stoke_fire.
+
+    `reason` ist ein Reason, das Detail steht separat in `payload` (Tag,
+    Blueprint- oder Item-ID, Item-Namen, Name des Hergestellten). Der
+    Meldungstext wird erst beim Lesen gebaut. Als Mapping liest sich das
+    Ergebnis wie das frühere Dict: `res["reason"]` ist der String-Code
+    ("MISSING_TAG:FIBER"), `res["message"]` der Text, `dict(res)` und
+    `repr(res)` sind unverändert.
+    """
+    __slots__ = ("op", "success", "reason", "payload", "blueprint_id", "process_id",
+                 "log", "_message")
+
+    def __init__(self, op: str, success: bool, reason: Reason, payload=None,
+                 blueprint_id=None, process_id=None, log=None):
+        self.op = op
+        self.success = success
+        self.reason = reason
+        self.payload = payload
+        self.blueprint_id = blueprint_id
+        self.process_id = process_id
+        self.log = log
+        self._message = None
 
+    @property
+    def message(self) -> str:
+        msg = self._message
+        if msg is None:
+            msg = self._message = _action_text(self.op, self.reason, self.payload, self.log)
+        return msg
+
+    @property
+    def code(self) -> str:
+        """Reason als String-Code wie im früheren Dict."""
+        return _reason_code(self.reason, self.payload)
+
+    def _keys(self) -> tuple:
+        if self.op == "execute_experiment":
+            return _EXPERIMENT_KEYS
+        if self.process_id is not None:
+            return _PROCESS_KEYS
+        return _BASE_KEYS
+
+    def __getitem__(self, key):
+        if key == "success":
+            return self.success
+        if key == "reason":
+            return self.code
+        if key == "message":
+            return self.message
+        if key in self._keys():
+            return self.process_id if key == "process_id" else self.blueprint_id
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class StepResult(NamedTuple):
+    """Kompaktes Ergebnis einer Aktion aus `GameEngine.step()`.
+
+    `ids` nennt die beteiligten Content-IDs (gefundene Templates, Blueprint,
+    Prozess, Ort, gegessenes Template), `amounts` die Mengen dazu; die Deltas
+    sind Zustand nachher minus vorher. Bei gather hält `detail` die Folge aller
+    Ereignisse (Funde, Erschöpfung, Verletzung, zerbrochenes Werkzeug), sobald
+    mehr als nur Funde passiert sind. Text entsteht erst auf Anfrage
+    (`message()`) — ohne die Zeit-Meldungen (Hunger, Kälte), die stecken in
+    den Deltas.
+    """
+    op: str
+    reason: Reason
+    detail: str = ""
+    ids: Tuple[str, ...] = ()
+    amounts: Tuple[float, ...] = ()
+    energy: float = 0.0
+    hp: float = 0.0
+    body_temp: float = 0.0
+    ticks: int = 0
+
+    @property
+    def success(self) -> bool:
+        return self.reason == Reason.SUCCESS
+
+    def message(self) -> str:
+        """Spielersprachlicher Text wie bei der jeweiligen Einzel-Aktion."""
+        op, reason = self.op, self.reason
+        if op == "gather":
+            return "\n".join(_gather_lines(self.ids, self.amounts, self.detail))
+        if reason == Reason.BROKEN_ITEM:
+            return _reason_text(reason, self.ids)
+        if op == "eat" and reason == Reason.SUCCESS:
+            return _action_text(op, reason, (self.detail, self.amounts[0]))
+        return _action_text(op, reason, self.detail)
+
+
+def _gather_lines(ids, amounts, events: str) -> List[str]:
+    """Meldungszeilen eines Gather aus Funden und Ereignisfolge (`_gather_events`)."""
+    found = [f"Gefunden: {q}x {_template_name(t)}" for t, q in zip(ids, amounts)]
+    if not events:
+        return found
+    codes, *broken = events.split("\n")
+    found, broken = iter(found), iter(broken)
+    lines = []
+    for code in codes:
+        if code == "f":
+            lines.append(next(found))
+        elif code == "d":
+            lines.append(MSG_DEPLETED)
+        elif code == "i":
+            lines.append(MSG_INJURED)
+        else:
+            lines.append(MSG_TOOL_BROKEN.format(next(broken)))
+    return lines
+
+
+def _template_name(template_id: str) -> str:
+    t = TEMPLATE_DB.get(template_id)
+    return t.name if t else template_id
+
+
+def _light_run(tick: int) -> int:
+    """Anzahl aufeinanderfolgender Ticks ab `tick` (inklusive) mit demselben
+    Tag/Nacht-Zustand. Nacht: hour < 6 oder hour > 20, also tick % 144 < 36
+    oder > 120 (vgl. _get_ambient_temp)."""
+    m = tick % 144
+    if m < 36:
+        return 36 - m
+    if m <= 120:
+        return 121 - m
+    return 144 - m + 36
+
+
+class EventQueue:
+    """Zeitgesteuerte Welt-Ereignisse, nach Fälligkeits-Tick geordnet (Heap).
+
+    Ein Ereignis hat einen Schlüssel (z.B. `("WEATHER",)`); erneutes Einplanen
+    desselben Schlüssels ersetzt den alten Termin. Der überholte Heap-Eintrag
+    bleibt liegen und wird beim Poppen übersprungen (Lazy Deletion), bis der
+    Heap zu viele tote Einträge hat und neu aufgebaut wird.
+    """
 
-class GameEngine:
     def __init__(self):
-        self.player = Player("Survivor")
+        self._heap: List[tuple] = []    # (due, seq, key)
+        self._live: Dict[tuple, tuple] = {}  # key -> (due, seq) des gültigen Termins
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __contains__(self, key) -> bool:
+        return key in self._live
+
+    def schedule(self, key: tuple, due: int):
+        """Plant `key` für Tick `due` ein (ersetzt einen bestehenden Termin)."""
+        self._seq += 1
+        self._live[key] = (due, self._seq)
+        heapq.heappush(self._heap, (due, self._seq, key))
+        if len(self._heap) > 2 * len(self._live) + 16:
+            self._heap = [(d, q, k) for k, (d, q) in self._live.items()]
+            heapq.heapify(self._heap)
+
+    def cancel(self, key: tuple):
+        self._live.pop(key, None)
+
+    def due_of(self, key: tuple):
+        """Fälligkeits-Tick von `key` oder None, wenn nicht eingeplant."""
+        entry = self._live.get(key)
+        return entry[0] if entry else None
+
+    def _drop_stale(self):
+        heap = self._heap
+        while heap and self._live.get(heap[0][2]) != heap[0][:2]:
+            heapq.heappop(heap)
+
+    def next_due(self, skip: tuple = None):
+        """Tick des nächsten fälligen Ereignisses oder None (leer); mit `skip`
+        ohne den Termin dieses Schlüssels (die Queue hält nur wenige)."""
+        if skip is not None:
+            return min((due for key, (due, _) in self._live.items() if key != skip),
+                       default=None)
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def state(self) -> tuple:
+        """Gültige Termine samt Zähler — genug, um die Queue nachzubauen."""
+        return (self._seq, tuple(self._live.items()))
+
+    @classmethod
+    def from_state(cls, state: tuple) -> "EventQueue":
+        queue = cls()
+        queue._seq, live = state
+        queue._live = dict(live)
+        queue._heap = [(d, q, k) for k, (d, q) in live]
+        heapq.heapify(queue._heap)
+        return queue
+
+    def pop_due(self, tick: int) -> List[tuple]:
+        """Entnimmt alle bis einschließlich `tick` fälligen Schlüssel, in
+        Fälligkeits- und Einplan-Reihenfolge."""
+        heap = self._heap
+        if not heap or heap[0][0] > tick:
+            return []
+        due = []
+        while True:
+            self._drop_stale()
+            if not heap or heap[0][0] > tick:
+                return due
+            _, _, key = heapq.heappop(heap)
+            del self._live[key]
+            due.append(key)
+
+
+# Schlüssel des Wetter-Ereignisses: gewürfelt wird auf jedem vollen 12er-Tick.
+WEATHER_EVENT = ("WEATHER",)
+WEATHER_PERIOD = 12
+# Feuer-Aus am aktuellen Ort (nur dort brennt Brennstoff ab) und Heil-Abschluss
+# je Verletzungsart (Schlüssel ("HEAL", kind)). Termine, keine Auslöser:
+# Feuer und Heilung rechnet weiterhin der Zeitschritt; ein fälliger Termin
+# wird nach dem Schritt gegen den Zustand geprüft und ggf. neu eingeplant.
+FIRE_EVENT = ("FIRE",)
+HEAL_EVENT = "HEAL"
+# Einträge im Regen-Log, ab denen alle Orte abgerechnet und das Log geleert wird.
+REGEN_LOG_LIMIT = 256
+
+
+def _next_weather_tick(tick: int) -> int:
+    """Nächster Wetter-Tick ab `tick` (inklusive) — Vielfaches von 12."""
+    return -(-tick // WEATHER_PERIOD) * WEATHER_PERIOD
+
+
+class EngineSnapshot(NamedTuple):
+    """Veränderlicher Spielzustand einer Engine (GameEngine.snapshot()).
+
+    Nur unveränderliche Werte (Tupel, frozensets, RNG-Zustände) — ein Snapshot
+    lässt sich beliebig oft wiederherstellen oder forken. Content (Blueprints,
+    Prozesse, Orts-Definitionen) gehört nicht dazu, er wird geteilt.
+    """
+    tick: int
+    weather: str
+    location_id: str
+    events: tuple
+    rng_states: tuple        # (weather, gather, injuries)
+    vitals: tuple            # (name, energy, max_energy, hp, max_hp, body_temp)
+    stats: tuple             # ((stat, wert), ...)
+    known: tuple             # (blueprints, processes, near_misses) als frozensets
+    injuries: tuple          # ((art, ((feld, wert), ...)), ...)
+    inventory: tuple         # Inventory.snapshot()
+    world: tuple             # ((ort, fire_active, fire_fuel, ((stock, depleted), ...)), ...)
+
+
+# Prototyp-Welt für GameEngine.from_prototype(): (content_hash, engine). Wird
+# nie selbst gespielt, nur geklont — ändert sich der Content, wird neu gebaut.
+_prototype = None
+
+
+def _rng_stream(seed, name: str) -> random.Random:
+    """Benannter, unabhängiger RNG-Strom einer geseedeten Engine. Der Seed-String
+    wird per SHA-512 abgeleitet — stabil über Prozesse und PYTHONHASHSEED."""
+    return random.Random(f"{seed}/{name}")
+
+
+def _blank_rng() -> random.Random:
+    """Ungeseedeter RNG, der gleich per setstate() befüllt wird — spart das
+    Seeden aus os.urandom."""
+    return random.Random.__new__(random.Random)
+
+
+def _journaled(method):
+    """Öffentliche Aktion, die ein angehängtes Journal (engine/journal.py)
+    mitschreibt. Ohne Journal nur ein Attribut-Test; verschachtelte Aufrufe
+    werden nicht doppelt verbucht (das Journal führt die Tiefe)."""
+    op = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        journal = self.journal
+        if journal is None:
+            return method(self, *args, **kwargs)
+        return journal.call(self, op, method, args, kwargs)
+    return wrapper
+
+
+class GameEngine:
+    # Aktions-Journal (engine.journal.Journal.record); None = aus.
+    journal = None
+    # Headless (nur während step()): Aktionen liefern Rohdaten statt Text.
+    _headless = False
+
+    def __init__(self, seed=None):
         self.locations = {loc.id: loc for loc in get_all_locations()}
         self.blueprints = {bp.id: bp for bp in get_all_blueprints()}
         self.processes = {p.id: p for p in get_all_processes()}
-        self.current_location_id = "forest_edge"
-        self.tick_counter = 36  # 6 Uhr morgens (36 Ticks), Tagesstart statt Mitternacht
-        
+
         # Wettersystem
         self.weather_types = {
             "CLEAR": {"temp_mod": 0, "exposure_mod": 1.0},
@@ -168,53 +574,330 @@ class GameEngine:
             "STORM": {"temp_mod": -10, "exposure_mod": 2.5},
             "SNOW": {"temp_mod": -15, "exposure_mod": 2.0}
         }
+        self.climate = climate_table(self.locations.values(), self.weather_types)
+        self._init_state(seed)
+
+    @classmethod
+    def from_prototype(cls, seed=None) -> "GameEngine":
+        """Frische Engine als Klon einer einmal gebauten Prototyp-Welt.
+
+        Gleichwertig zu `GameEngine()`, aber ohne Content-Aufbau pro Instanz:
+        Blueprint- und Prozess-Definitionen (unveränderlich) werden geteilt,
+        geklont wird nur veränderlicher Zustand — Locations samt Node-Vorrat
+        und Feuer; Spieler, Uhr, Wetter und Verletzungs-RNG kommen frisch aus
+        `_init_state()`. Für Mess-Läufe, die pro Seed eine Engine brauchen;
+        `seed` wie bei `GameEngine(seed=...)`.
+        """
+        global _prototype
+        digest = load_content().content_hash
+        if _prototype is None or _prototype[0] != digest:
+            _prototype = (digest, GameEngine())
+        proto = _prototype[1]
+        game = cls.__new__(cls)
+        game.locations = clone_locations(proto.locations)
+        # Eigene Dicts (Tests/Tools tauschen Einträge aus), geteilte Definitionen.
+        game.blueprints = dict(proto.blueprints)
+        game.processes = dict(proto.processes)
+        game.weather_types = proto.weather_types
+        game.climate = proto.climate
+        game._init_state(seed)
+        return game
+
+    def _init_state(self, seed=None):
+        """Veränderlicher Spielzustand einer frischen Session (ohne Content)."""
+        # Zufall: geseedet besitzt die Engine eigene, benannte Ströme — zwei
+        # Engines im selben Prozess (Threads, parallele Seeds) stören sich
+        # nicht. Ohne Seed (Kompatibilität) würfeln Wetter und Gather wie
+        # bisher auf dem globalen `random`-Strom (das Modul selbst dient als
+        # RNG), damit die Sequenzen nach `random.seed(...)` bit-gleich bleiben.
+        self.seed = seed
+        if seed is None:
+            self.weather_rng = random
+            self.gather_rng = random
+        else:
+            self.weather_rng = _rng_stream(seed, "weather")
+            self.gather_rng = _rng_stream(seed, "gather")
+        # Zeitgesteuerte Ereignisse (Wetter) — vor der Uhr, da das Setzen von
+        # tick_counter den Wetter-Termin einplant.
+        self._events = EventQueue()
+        self.player = Player("Survivor")
+        self.current_location_id = "forest_edge"
+        self.tick_counter = 36  # 6 Uhr morgens (36 Ticks), Tagesstart statt Mitternacht
         self.current_weather = "CLEAR"
+        # Zeitschritte der _advance_time-Aufrufe seit der letzten Verdichtung,
+        # in Reihenfolge. Jeder Ort merkt sich in `regen_mark`, bis wohin er
+        # abgerechnet ist; höchstens REGEN_LOG_LIMIT Einträge (_compact_regen_log).
+        self._regen_log: List[int] = []
+        # Experiment-Ausgänge je Wissensstand (engine/memo.py).
+        self._memo = ExperimentMemo()
+        # Prozess-Verfügbarkeit, inkrementell (engine/availability.py).
+        self._avail = ProcessAvailability()
 
         # Verletzungs-RNG (SPEC-009): EIGENER Strom, damit die Verletzungswürfe
         # die Ressourcen-RNG-Sequenz (Fund-Items/Erschöpfung) NICHT verschieben.
         # Würde gather() dafür das gemeinsame `random` benutzen, änderten sich
         # für alle bestehenden Mess-Bots (Reachability, Session-Depth, guided)
         # deterministisch die Ausbeuten — der Verletzungs-Wurf gehört nicht auf
-        # denselben Kanal. Aus dem aktuellen (deterministisch geseedeten) Zustand
-        # kopiert → pro Lauf reproduzierbar, aber unabhängig vom Hauptstrom.
-        self.injuries_rng = random.Random()
-        self.injuries_rng.setstate(random.getstate())
+        # denselben Kanal. Ohne Seed aus dem aktuellen (deterministisch
+        # geseedeten) globalen Zustand kopiert → pro Lauf reproduzierbar, aber
+        # unabhängig vom Hauptstrom.
+        if seed is None:
+            self.injuries_rng = random.Random()
+            self.injuries_rng.setstate(random.getstate())
+        else:
+            self.injuries_rng = _rng_stream(seed, "injury")
+
+    # -- Snapshot / Fork -----------------------------------------------------
+
+    def snapshot(self) -> EngineSnapshot:
+        """Kompakter Abzug des veränderlichen Zustands (siehe EngineSnapshot).
+
+        Rechnet vorher die Regeneration aller Orte ab, damit der Abzug ohne
+        Regen-Log auskommt (an den Vorräten ändert das nichts).
+        """
+        for loc in self.locations.values():
+            self._settle_nodes(loc)
+        p = self.player
+        return EngineSnapshot(
+            tick=self._tick,
+            weather=self.current_weather,
+            location_id=self.current_location_id,
+            events=self._events.state(),
+            rng_states=(self.weather_rng.getstate(), self.gather_rng.getstate(),
+                        self.injuries_rng.getstate()),
+            vitals=(p.name, p.energy, p.max_energy, p.hp, p.max_hp, p.body_temp),
+            stats=tuple(p.stats.items()),
+            known=(frozenset(p.known_blueprints), frozenset(p.known_processes),
+                   frozenset(p.near_misses)),
+            injuries=tuple((kind, tuple(inj.items())) for kind, inj in p.injuries.items()),
+            inventory=p.inventory.snapshot(),
+            world=tuple((lid, loc.fire_active, loc.fire_fuel,
+                         tuple((n.stock, n.depleted) for n in loc.nodes))
+                        for lid, loc in self.locations.items()),
+        )
+
+    def restore(self, snap: EngineSnapshot):
+        """Setzt den Zustand auf `snap` zurück (Spieler-Objekt bleibt dasselbe).
+
+        Ohne Seed würfelt die Engine auf dem globalen `random`-Strom — dessen
+        Zustand wird dann ebenfalls zurückgesetzt.
+        """
+        self._tick = snap.tick
+        self.current_weather = snap.weather
+        self.current_location_id = snap.location_id
+        self._events = EventQueue.from_state(snap.events)
+        weather, gather, injuries = snap.rng_states
+        self.weather_rng.setstate(weather)
+        self.gather_rng.setstate(gather)
+        self.injuries_rng.setstate(injuries)
+        p = self.player
+        p.name, p.energy, p.max_energy, p.hp, p.max_hp, p.body_temp = snap.vitals
+        p.stats = dict(snap.stats)
+        p.known_blueprints, p.known_processes, p.near_misses = (set(k) for k in snap.known)
+        p.injuries = {kind: dict(fields) for kind, fields in snap.injuries}
+        p.inventory = Inventory.from_snapshot(snap.inventory)
+        # Vorräte sind im Snapshot abgerechnet — das Regen-Log beginnt neu.
+        self._regen_log = []
+        for lid, fire_active, fire_fuel, nodes in snap.world:
+            loc = self.locations[lid]
+            loc.fire_active = fire_active
+            loc.fire_fuel = fire_fuel
+            loc.regen_mark = 0
+            for node, (stock, depleted) in zip(loc.nodes, nodes):
+                node.stock = stock
+                node.depleted = depleted
+
+    def fork(self) -> "GameEngine":
+        """Unabhängige Kopie im aktuellen Zustand — für Verzweigungs-Suche
+        ("sammeln oder reisen?") ohne Neu-Abspielen ab Tick 0.
+
+        Content wird geteilt wie bei `from_prototype()`. Ein Fork hat stets
+        eigene RNG-Ströme; ohne Seed starten sie beim aktuellen Zustand des
+        globalen Stroms (Wetter und Gather weiterhin auf einem Strom), d.h. der
+        Fork würfelt, was das Original als Nächstes würfeln würde.
+        """
+        snap = self.snapshot()
+        game = self.__class__.__new__(self.__class__)
+        game.locations = clone_locations(self.locations)
+        game.blueprints = dict(self.blueprints)
+        game.processes = dict(self.processes)
+        game.weather_types = self.weather_types
+        game.climate = self.climate
+        game._memo = ExperimentMemo()
+        game._avail = ProcessAvailability()
+        game.seed = self.seed
+        game.player = Player(snap.vitals[0])
+        if self.weather_rng is self.gather_rng:
+            game.weather_rng = game.gather_rng = _blank_rng()
+        else:
+            game.weather_rng, game.gather_rng = _blank_rng(), _blank_rng()
+        game.injuries_rng = _blank_rng()
+        game.restore(snap)
+        return game
+
+    @property
+    def tick_counter(self) -> int:
+        return self._tick
+
+    @tick_counter.setter
+    def tick_counter(self, value: int):
+        # Direktes Setzen der Uhr (Tests, Mess-Szenarien) verschiebt den
+        # Wetter-Termin mit — sonst würfelte das Wetter zum alten Raster.
+        self._tick = value
+        self._events.schedule(WEATHER_EVENT, _next_weather_tick(value))
 
     @property
     def current_location(self):
-        return self.locations[self.current_location_id]
+        loc = self.locations[self.current_location_id]
+        if loc.regen_mark != len(self._regen_log):
+            self._settle_nodes(loc)
+        return loc
+
+    def _settle_nodes(self, loc):
+        """Holt die Regeneration eines Orts bis zum aktuellen Tick nach.
+
+        Spielt die seit `loc.regen_mark` geloggten Zeitschritte einzeln nach —
+        exakt dieselben Float-Operationen wie die frühere Eager-Schleife über
+        alle Orte pro `_advance_time`, also bit-identische Vorräte. Ein voller,
+        nicht erschöpfter Node ändert sich durch weitere Schritte nicht mehr;
+        solange seitdem nichts in den Store geschrieben wurde, rechnet der Ort
+        nur die noch regenerierenden Nodes ab (`loc.regen_rest`).
+        """
+        log = self._regen_log
+        mark = loc.regen_mark
+        if mark == len(log):
+            return
+        loc.regen_mark = len(log)
+        store, all_ids = loc.node_view()
+        if store is None:
+            # Nodes aus fremden Stores (z.B. in Tests eingesetzte) einzeln.
+            pending = log[mark:]
+            for node in loc.nodes:
+                node._store.settle((node._id,), pending)
+            loc.regen_rest = None
+            return
+        ids = all_ids
+        rest = loc.regen_rest
+        if rest is not None and rest[0] is all_ids and rest[1] == store.version:
+            ids = rest[2]
+            if not ids:
+                return
+        loc.regen_rest = (all_ids, store.version, store.settle(ids, log[mark:]))
+
+    def _compact_regen_log(self):
+        """Rechnet alle Orte ab und leert das Regen-Log.
+
+        Hält das Log (und damit den Speicher einer langen Sitzung) klein; ein
+        nie besuchter Ort wird dabei in Blöcken von REGEN_LOG_LIMIT Schritten
+        nachgeführt — dieselben Schritte in derselben Reihenfolge, also
+        bit-identisch zum Abrechnen am Stück.
+        """
+        for loc in self.locations.values():
+            self._settle_nodes(loc)
+        self._regen_log = []
+        for loc in self.locations.values():
+            loc.regen_mark = 0
 
     def _update_weather(self):
         """Bestimmt alle 12 Ticks (2 Stunden) das Wetter neu."""
-        if self.tick_counter % 12 == 0:
-            self.current_weather = random.choice(list(self.weather_types.keys()))
+        if self.tick_counter % WEATHER_PERIOD == 0:
+            self.current_weather = self.weather_rng.choice(list(self.weather_types.keys()))
+
+    def _dispatch_events(self) -> List[tuple]:
+        """Arbeitet die bis zum aktuellen Tick fälligen Ereignisse ab.
+
+        Nur fällige Ereignisse kosten etwas; ein Zeitschritt ohne Termin im
+        Fenster prüft lediglich den Heap-Kopf. Handler validieren gegen den
+        echten Zustand und planen sich selbst neu ein. Fällige Feuer- und
+        Heil-Termine kommen zurück — sie prüft `_recheck_events` nach dem
+        Zeitschritt, der Feuer und Wunden fortschreibt.
+        """
+        after = []
+        for key in self._events.pop_due(self._tick):
+            if key == WEATHER_EVENT:
+                # Gewürfelt wird nur, wenn die Uhr genau auf dem 12er-Tick
+                # landet; ein übersprungener Termin verfällt (wie bisher).
+                self._update_weather()
+                self._events.schedule(WEATHER_EVENT, _next_weather_tick(self._tick))
+            else:
+                after.append(key)
+        return after
+
+    def _recheck_events(self, keys: List[tuple]):
+        """Plant fällig gewordene Feuer-/Heil-Termine aus dem aktuellen Zustand
+        neu ein — oder verwirft sie (Feuer aus, Wunde verheilt)."""
+        for key in keys:
+            if key == FIRE_EVENT:
+                self._schedule_fire()
+            else:
+                self._schedule_heal(key[1])
+
+    def _schedule_fire(self):
+        """Feuer-Aus-Termin des aktuellen Orts: `tick + ceil(fire_fuel)` —
+        der Tick, in dem der Brennstoff bei 1 pro Tick auf 0 fällt."""
+        loc = self.locations[self.current_location_id]
+        if loc.fire_active and loc.fire_fuel > 0:
+            self._events.schedule(FIRE_EVENT, self._tick + math.ceil(loc.fire_fuel))
+        else:
+            self._events.cancel(FIRE_EVENT)
+
+    def _schedule_heal(self, kind: str):
+        """Heil-Termin einer behandelten Wunde: frühester Tick, an dem sie bei
+        durchgehender Ruhe verheilt ist (Schritte wie im Zeitschritt gezählt).
+        Ohne Ruhe heilt sie später; der fällige Termin plant sich dann neu ein."""
+        inj = self.player.injuries.get(kind)
+        key = (HEAL_EVENT, kind)
+        if not inj or not inj["treated"]:
+            self._events.cancel(key)
+            return
+        severity, n = inj["severity"], 0
+        while severity > INJ_HEAL_THRESHOLD:
+            severity -= INJ_HEAL_RATE
+            n += 1
+        self._events.schedule(key, self._tick + max(1, n))
+
+    def ambient_at(self, location_id: str, tick: int, weather: str) -> float:
+        """Umgebungstemperatur (ohne Feuer) an `location_id` zur Uhrzeit `tick`
+        bei Wetter `weather` — reine Abfrage der Klimatabelle, ändert nichts.
+        Für Planer, die Kälte vorausschauen (z.B. "wird es nachts zu kalt?")."""
+        return self._climate_for(location_id, weather).ambient[location_id][weather][
+            tick % DAY_TICKS]
+
+    def _climate_for(self, location_id: str, weather: str):
+        """Die Klimatabelle, geprüft für `location_id` × `weather`.
+
+        Einzige Quelle für Umgebungstemperatur und Exposition (auch die
+        Ortsexposition der Ruhe- und Zerrungs-Schwellen): wurden Ort oder
+        Wettertyp an Ort und Stelle geändert, wird die Tabelle neu gebaut.
+        """
+        table = self.climate
+        if not table.is_current(self.locations[location_id], weather,
+                                self.weather_types[weather]):
+            table = self.climate = climate_table(self.locations.values(), self.weather_types)
+        return table
 
     def _get_ambient_temp(self) -> float:
         """Berechnet die aktuelle Temperatur basierend auf Ort und Wetter."""
-        loc = self.current_location
-        weather_mod = self.weather_types[self.current_weather]["temp_mod"]
-        # Simuliere Tag/Nacht-Zyklus (Nachts kälter)
-        hour = (self.tick_counter % 144) / 6 # 144 Ticks = 24h
-        night_mod = -10 if (hour < 6 or hour > 20) else 0
-        return loc.base_temp + weather_mod + night_mod
+        lid, weather = self.current_location_id, self.current_weather
+        return self._climate_for(lid, weather).ambient[lid][weather][self._tick % DAY_TICKS]
 
     def _advance_time(self, ticks: int, effort_multiplier: float = 1.0):
         """Simuliert Zeit, Hunger und Thermodynamik."""
-        self.tick_counter += ticks
-        self._update_weather()
+        tick = self._tick = self._tick + ticks
+        heap = self._events._heap
+        due = self._dispatch_events() if heap and heap[0][0] <= tick else None
 
         # 0. Ressourcen-Regeneration (SPEC-004): Vorrat wächst über die
         # verstrichene Spielzeit, nicht über Aktionen. Dadurch regenerieren
         # sich auch andere Orte, während man unterwegs handelt — die Zeit
-        # zwischen zwei Besuchen bestimmt den Füllstand.
-        for loc in self.locations.values():
-            for node in loc.nodes:
-                node.stock = min(node.max_stock, node.stock
-                                 + node.regen_per_tick * ticks)
-                # Ein erschöpfter Node erholt sich erst, wenn genug Zeit
-                # vergangen ist, um mindestens eine Ernte-Portion aufzufüllen.
-                if node.depleted and node.stock >= node.harvest_cost:
-                    node.depleted = False
+        # zwischen zwei Besuchen bestimmt den Füllstand. Verbucht wird lazy:
+        # der Zeitschritt landet im Regen-Log, abgerechnet wird nur der
+        # aktuelle Ort (andere Orte beim nächsten Lesen, s. _settle_nodes).
+        log = self._regen_log
+        log.append(ticks)
+        if len(log) >= REGEN_LOG_LIMIT:
+            self._compact_regen_log()
+        self._settle_nodes(self.locations[self.current_location_id])
 
         logs = []
         
@@ -223,22 +906,24 @@ class GameEngine:
         self.player.energy = max(0, self.player.energy - drain)
         if self.player.energy <= 0:
             self.player.hp -= 2.0 * ticks
-            logs.append("!!! HUNGER-SCHADEN !!!")
+            logs.append(MSG_HUNGER)
 
         # 2. Thermodynamik (SPEC-007: aktives Location-Feuer hebt die effektive
         # Umgebungstemperatur, verbraucht aber Brennstoff, der über Zeit brennt.
         # Bei Brennstoff 0 erlischt das Feuer mit einer ehrlichen Meldung — nie
         # still. Das macht Kälte abwendbar statt unvermeidbar.)
-        ambient_temp = self._get_ambient_temp()
+        lid, weather = self.current_location_id, self.current_weather
+        climate = self._climate_for(lid, weather)
+        ambient_temp = climate.ambient[lid][weather][tick % DAY_TICKS]
         fire_warmth = 0.0
-        loc = self.current_location
+        loc = self.locations[self.current_location_id]   # nur Feuer, keine Nodes
         if loc.fire_active and loc.fire_fuel > 0:
             fire_warmth = FIRE_HEAT
             loc.fire_fuel = max(0.0, loc.fire_fuel - ticks)
             if loc.fire_fuel <= 0:
                 loc.fire_active = False
-                logs.append("!!! FIRE_OUT: " + _feedback_message("FIRE_OUT") + " !!!")
-        exposure = loc.exposure * self.weather_types[self.current_weather]["exposure_mod"]
+                logs.append(MSG_FIRE_OUT)
+        exposure = climate.exposure[lid][weather]
         insulation = self.player.inventory.get_total_insulation()
         effective_ambient = ambient_temp + fire_warmth
 
@@ -249,10 +934,10 @@ class GameEngine:
         # Auswirkungen der Körpertemperatur
         if self.player.body_temp < 35.0:
             self.player.hp -= 1.0 * ticks
-            logs.append("!!! UNTERKÜHLUNG !!!")
+            logs.append(MSG_HYPOTHERMIA)
         elif self.player.body_temp > 40.0:
             self.player.hp -= 1.0 * ticks
-            logs.append("!!! HITZSCHLAG !!!")
+            logs.append(MSG_HEATSTROKE)
 
         # 3. Verletzung & Heilung (SPEC-009): Bluten + Behandlung+Ruhe-Heilung.
         # Eine unbehandelte Schnittwunde zieht über Zeit (HP-Drain), bis sie
@@ -263,7 +948,7 @@ class GameEngine:
             cut["ticks"] += ticks
             if not cut["treated"]:
                 self.player.hp -= CUT_BLEED_PER_TICK * ticks
-                logs.append("!!! " + _feedback_message("BLEEDING") + " !!!")
+                logs.append(MSG_BLEEDING)
 
         healed = []
         for kind in list(self.player.injuries.keys()):
@@ -275,11 +960,184 @@ class GameEngine:
                     del self.player.injuries[kind]
                     healed.append(kind)
         if healed:
-            logs.append("!!! " + _feedback_message("HEALED")
-                        + f" ({', '.join(map(_injury_label, healed))}) !!!")
+            logs.append(_healed_message(healed))
+        if due:
+            self._recheck_events(due)
+
+        return "\n".join(logs) if logs and not self._headless else None
+
+    @_journaled
+    def wait(self, ticks: int, effort_multiplier: float = 1.0) -> List[str]:
+        """Lässt `ticks` Ticks am Stück verstreichen (Rasten, Warten).
+
+        Gleichwertig zu `ticks` Einzelaufrufen `_advance_time(1, …)`: dieselben
+        RNG-Züge, derselbe Endzustand, und pro Tick mit Meldung genau ein
+        Eintrag in der Rückgabe. Günstig wird es über Segmente zwischen den
+        bekannten Bruchstellen: Feuer-Aus- und Heil-Termine der Event-Queue
+        und Tag/Nacht-Wechsel begrenzen ein Segment, Wetter-Termine würfelt
+        es selbst; ein ohne Termin gesetztes Feuer oder eine Wunde beendet es
+        spätestens nach dem Tick, in dem es erlischt bzw. sie verheilt. Ticks
+        mit fälligem Feuer-/Heil-Termin laufen über den Einzelschritt.
+        """
+        logs: List[str] = []
+        remaining = ticks
+        events = self._events
+        while remaining > 0:
+            n = min(remaining, _light_run(self._tick + 1))
+            due = events.next_due(skip=WEATHER_EVENT)
+            if due is not None:
+                n = min(n, due - self._tick - 1)
+            if n <= 0:
+                msg = self._advance_time(1, effort_multiplier)
+                if msg:
+                    logs.append(msg)
+                remaining -= 1
+            else:
+                remaining -= self._advance_segment(n, effort_multiplier, logs)
+        return logs
 
-        return "\n".join(logs) if logs else None
+    def _advance_segment(self, n: int, effort_multiplier: float, logs: List[str]) -> int:
+        """Bis zu `n` Einzel-Ticks ohne Feuer-/Heil-Termin am Stück; gibt die
+        Anzahl zurück.
+
+        Im Segment sind Ort, Tageszeit, Isolation und Feuer-Wärme konstant;
+        fällige Wetter-Termine würfelt es selbst und teilt sich dort in Läufe
+        mit konstanter Umgebung. Lineare Größen gehen in geschlossener Form:
+        Brennstoff (− 1 pro Tick, exakt) bestimmt vorab den Feuer-Aus-Tick,
+        Energie (− drain pro Tick) den Hunger-Einsatz, solange drain ein
+        Vielfaches der Float-Auflösung der Energie ist — dann ist jede
+        Einzel-Subtraktion exakt und `energy − k·drain` bit-gleich. Die
+        Körpertemperatur folgt einer geometrischen Rekursion, deren Rundung
+        sich nicht geschlossen nachbilden lässt; sie läuft (mit HP und
+        Meldungen) als enge Schleife pro Tick. Wunden und nicht exakte Energie
+        laufen pro Tick wie `_advance_time(1)`. Heilt eine Wunde, endet das
+        Segment nach diesem Tick.
+        """
+        p = self.player
+        lid = self.current_location_id
+        loc = self.locations[lid]
+        events = self._events
+        start = self._tick
+        ins_factor = 1.0 - min(0.9, p.inventory.get_total_insulation())
+        drain = 5.0 * effort_multiplier * 1
+        fuel = loc.fire_fuel
+        fire_on = bool(loc.fire_active and fuel > 0)
+        fire_end = 0
+        if fire_on:
+            # Brennstoff − 1 pro Tick ist exakt: erlischt im Tick ceil(fuel).
+            fire_end = math.ceil(fuel)
+            n = min(n, fire_end)
+        heat = FIRE_HEAT if fire_on else 0.0
+        sheltered = self._climate_for(lid, self.current_weather).site_exposure[lid] <= REST_EXPOSURE
+
+        energy, hp, body_temp = p.energy, p.hp, p.body_temp
+        injuries = p.injuries
+        cut = injuries.get("cut")
+        weather_due = events.due_of(WEATHER_EVENT)
+        healed: List[str] = []
+        done = 0
+        while done < n and not healed:
+            tick = start + done + 1
+            if weather_due is not None and weather_due <= tick:
+                self._tick = tick
+                self._dispatch_events()
+                weather_due = events.due_of(WEATHER_EVENT)
+            # Lauf bis vor den nächsten Wetter-Termin: Umgebung konstant. Nach
+            # dem Würfeln steht der Termin noch auf diesem Tick und wird im
+            # nächsten neu gesetzt (wie im Einzelschritt) — Lauf von einem Tick.
+            m = n - done
+            if weather_due is not None and weather_due - tick < m:
+                m = max(1, weather_due - tick)
+            weather = self.current_weather
+            climate = self._climate_for(lid, weather)
+            effective_ambient = climate.ambient[lid][weather][tick % DAY_TICKS] + heat
+            exposure = climate.exposure[lid][weather]
+
+            if not injuries and drain > 0 and energy >= 0 and math.fmod(drain, math.ulp(energy)) == 0:
+                # Hunger ab Tick `hungry` des Laufs (Energie dann 0).
+                if energy <= 0:
+                    hungry = 1
+                else:
+                    hungry = max(1, math.ceil(energy / drain))
+                    while hungry > 1 and energy - (hungry - 1) * drain <= 0:
+                        hungry -= 1
+                    while energy - hungry * drain > 0:
+                        hungry += 1
+                for j in range(1, m + 1):
+                    out = None
+                    if j >= hungry:
+                        hp -= 2.0
+                        out = [MSG_HUNGER]
+                    if done + j == fire_end:
+                        out = (out or []) + [MSG_FIRE_OUT]
+                    body_temp -= (body_temp - effective_ambient) * 0.01 * exposure * ins_factor
+                    if body_temp < 35.0:
+                        hp -= 1.0
+                        out = (out or []) + [MSG_HYPOTHERMIA]
+                    elif body_temp > 40.0:
+                        hp -= 1.0
+                        out = (out or []) + [MSG_HEATSTROKE]
+                    if out:
+                        logs.append("\n".join(out))
+                energy = energy - m * drain if m < hungry else 0
+                done += m
+                continue
 
+            for _ in range(m):
+                done += 1
+                out = []
+                energy = max(0, energy - drain)
+                if energy <= 0:
+                    hp -= 2.0
+                    out.append(MSG_HUNGER)
+                fire_out = done == fire_end
+                if fire_out:
+                    out.append(MSG_FIRE_OUT)
+                temp_loss = (body_temp - effective_ambient) * 0.01 * exposure * ins_factor
+                body_temp -= temp_loss
+                if body_temp < 35.0:
+                    hp -= 1.0
+                    out.append(MSG_HYPOTHERMIA)
+                elif body_temp > 40.0:
+                    hp -= 1.0
+                    out.append(MSG_HEATSTROKE)
+                if cut:
+                    cut["ticks"] += 1
+                    if not cut["treated"]:
+                        hp -= CUT_BLEED_PER_TICK
+                        out.append(MSG_BLEEDING)
+                if injuries:
+                    # _resting_warm() nach dem Feuer-Update dieses Ticks
+                    resting = (fire_on and not fire_out) or sheltered
+                    for kind in list(injuries):
+                        inj = injuries[kind]
+                        inj["ticks"] += 1
+                        if inj["treated"] and resting:
+                            inj["severity"] -= INJ_HEAL_RATE
+                            if inj["severity"] <= INJ_HEAL_THRESHOLD:
+                                del injuries[kind]
+                                healed.append(kind)
+                    if healed:
+                        out.append(_healed_message(healed))
+                if out:
+                    logs.append("\n".join(out))
+                if healed:
+                    break
+
+        p.energy, p.hp, p.body_temp = energy, hp, body_temp
+        if fire_on:
+            loc.fire_fuel = max(0.0, fuel - done)
+            if done == fire_end:
+                loc.fire_active = False
+        self._tick = start + done
+        log = self._regen_log
+        log.extend([1] * done)
+        if len(log) >= REGEN_LOG_LIMIT:
+            self._compact_regen_log()
+        self._settle_nodes(loc)
+        return done
+
+    @_journaled
     def gather(self) -> List[str]:
         logs = []
         # Sammeln ist anstrengend (Effort 2.0), plus Malus durch eine
@@ -287,64 +1145,91 @@ class GameEngine:
         effort = 2.0 + self._injury_effort_malus()
         time_msg = self._advance_time(1, effort_multiplier=effort)
         if time_msg: logs.append(time_msg)
-
-        for node in self.current_location.nodes:
-            if self.player.stats["perception"] < node.req_perception: continue
+        # Headless: Funde als (template_id, Menge), Erschöpfung und Verletzung
+        # als Reason-Marker, ein zerbrochenes Werkzeug als sein Name.
+        headless = self._headless
+        loc = self.current_location
+        player = self.player
+        inventory = player.inventory
+        perception = player.stats["perception"]
+        rng = self.gather_rng
+
+        for node in loc.nodes:
+            # Node-Felder direkt aus den Spalten seines NodeStores.
+            st, j = node._store, node._id
+            if perception < st.req_perception[j]: continue
             
             used_tool = None
-            if node.req_tool_tag:
-                used_tool = self.player.inventory.find_item_by_tag(node.req_tool_tag)
+            tool_tag = st.req_tool_tag[j]
+            if tool_tag:
+                used_tool = inventory.find_item_by_tag(tool_tag)
                 if not used_tool: continue
 
             # Vorratsbasierter Node (SPEC-004): erschöpft → ehrliche Meldung,
             # nie stilles "nichts". Bleibt erschöpft, bis Regeneration ihn
             # über die Zeit wieder auf mindestens eine Ernte-Portion hebt.
-            if node.stock <= 0 or node.depleted:
-                logs.append(_feedback_message("DEPLETED"))
+            stock = st.stock[j]
+            if stock <= 0 or st.depleted[j]:
+                logs.append(_DEPLETED if headless else MSG_DEPLETED)
                 continue
 
             # Erfolgswahrscheinlichkeit skaliert mit dem Vorratsanteil:
             # voller Vorrat = node.chance, geleerter = 0.
-            eff_chance = node.chance * (node.stock / node.max_stock)
-            if random.random() <= eff_chance:
-                qty = random.randint(node.min_qty, node.max_qty)
-                item = create_item(node.result_template_id, qty)
-                if self.player.inventory.add(item):
-                    logs.append(f"Gefunden: {qty}x {item.name}")
-                    node.stock = max(0.0, node.stock - node.harvest_cost)
-                    if node.stock < node.harvest_cost:
-                        node.depleted = True
+            eff_chance = st.chance[j] * (stock / st.max_stock[j])
+            if rng.random() <= eff_chance:
+                qty = rng.randint(st.min_qty[j], st.max_qty[j])
+                item = create_item(st.result_template_id[j], qty)
+                if inventory.add(item):
+                    logs.append((item.template_id, qty) if headless
+                                else f"Gefunden: {qty}x {item.name}")
+                    cost = st.harvest_cost[j]
+                    stock = st.stock[j] = max(0.0, stock - cost)
+                    if stock < cost:
+                        st.depleted[j] = 1
+                    st.version += 1
+                    # Der Ort ist abgerechnet: statt alle Nodes neu zu prüfen,
+                    # kommt nur dieser Node auf die Regenerier-Liste.
+                    rest = loc.regen_rest
+                    if rest is not None and rest[1] == st.version - 1:
+                        active = rest[2] if j in rest[2] else rest[2] + [j]
+                        loc.regen_rest = (rest[0], st.version, active)
                     # Verletzungsrisiko (SPEC-009) — aus eigenem Handeln, nicht
                     # globalem Timer: scharfe Funde → Schnitt; exponierter Ort →
                     # Zerrung. Frequenz niedrig (abwendbar), nicht vermeidbar.
                     # Eigener RNG-Strom (injuries_rng), damit diese Würfe die
                     # Ressourcen-Sequenz der Mess-Bots nicht verschieben.
-                    if "SHARP" in item.tags and self.injuries_rng.random() < INJURE_CUT_CHANCE:
+                    if "SHARP" in item.tag_data() and self.injuries_rng.random() < INJURE_CUT_CHANCE:
                         if self._inflict("cut"):
-                            logs.append("!!! " + _feedback_message("INJURED") + " !!!")
-                    if (self.current_location.exposure >= 0.8
+                            logs.append(_INJURED if headless else MSG_INJURED)
+                    # Ortsexposition aus der Klimatabelle (von _advance_time geprüft).
+                    if (self.climate.site_exposure[loc.id] >= 0.8
                             and self.injuries_rng.random() < INJURE_STRAIN_CHANCE):
                         if self._inflict("strain"):
-                            logs.append("!!! " + _feedback_message("INJURED") + " !!!")
+                            logs.append(_INJURED if headless else MSG_INJURED)
                     if used_tool:
                         wear = 0.05 / used_tool.get_attr("durability", 0.5)
                         used_tool.condition = max(0, used_tool.condition - round(wear, 2))
                         if used_tool.condition <= 0:
-                            self.player.inventory.items.remove(used_tool)
-                            logs.append(f"!!! {used_tool.name} zerbrochen !!!")
+                            inventory.items.remove(used_tool)
+                            logs.append(used_tool.name if headless
+                                        else MSG_TOOL_BROKEN.format(used_tool.name))
         return logs
 
+    @_journaled
     def eat(self, item_index: int) -> str:
         """Versucht ein Item aus dem Inventar zu essen."""
         items = self.player.inventory.items
         if item_index < 0 or item_index >= len(items):
-            return "Ungültiges Item."
+            return (Reason.INVALID_ITEM,) if self._headless else "Ungültiges Item."
         
         item = items[item_index]
-        if "EDIBLE" not in item.tags:
+        tags = item.tag_data()
+        if "EDIBLE" not in tags:
+            if self._headless:
+                return (Reason.NOT_EDIBLE, item.name, (item.template_id,))
             return f"{item.name} ist nicht essbar!"
         
-        kcal = item.tags["EDIBLE"]
+        kcal = tags["EDIBLE"]
         self.player.energy = min(self.player.max_energy, self.player.energy + kcal)
         
         # Wenn man isst, regeneriert man etwas HP
@@ -354,21 +1239,21 @@ class GameEngine:
         if item.quantity > 1: item.quantity -= 1
         else: items.remove(item)
         
+        if self._headless:
+            return (Reason.SUCCESS, name, (item.template_id,), (kcal,))
         return f"Du isst {name} und regenerierst {kcal} Energie."
 
-    def _result(self, success, message, reason, blueprint_id=None,
-                result_template_id=None):
-        """Strukturiertes Ergebnis mit Reason-Code (kein Verhaltensunterschied)."""
-        return {
-            "success": success,
-            "message": message,
-            "reason": reason,                 # SUCCESS/NO_MATCH/BROKEN_ITEM/MISSING_TAG:<T>/TOO_FEW_ITEMS/UNKNOWN
-            "blueprint_id": blueprint_id,
-            "result_template_id": result_template_id,
-        }
+    @staticmethod
+    def _failed(reason: Reason, payload=None) -> ActionResult:
+        """Fehlgeschlagenes Experiment (NO_MATCH/BROKEN_ITEM/MISSING_TAG/…)."""
+        return ActionResult("execute_experiment", False, reason, payload)
+
+    def _no_match_reason(self, selected_items) -> str:
+        """`_no_match` als String-Code ("MISSING_TAG:FIBER", "NO_MATCH", …)."""
+        return _reason_code(*self._no_match(selected_items))
 
-    def _no_match_reason(self, selected_items):
-        """Bestimmt den konkretesten Reason für einen Fehlschlag.
+    def _no_match(self, selected_items) -> Tuple[Reason, Any]:
+        """Bestimmt den konkretesten Reason für einen Fehlschlag (+ Detail).
 
         Priorität (SPEC-003 / SPEC-002):
         1. Bekannter Blueprint (SPEC-002): Wer das Ziel bereits entdeckt hat,
@@ -382,71 +1267,63 @@ class GameEngine:
            nur, solange noch gar kein Beinahe-Treffer gelaufen ist — danach
            bleibt es still statt jeden Richtungsversuch erneut zu befeuern.
         """
-        available = set()
+        # Masken-Form (engine/tags.py): Überdeckung und erster fehlender Slot
+        # per Bit-Schnitt statt pro Blueprint neu gebauter Familien-Sets.
+        index = _blueprint_index(self.blueprints)
+        available = 0
         for it in selected_items:
-            available.update(it.tags)
-
-        def _overlap(bp) -> int:
-            n = 0
-            for slot_value in bp.slots.values():
-                required = set(TAG_FAMILIES.get(slot_value, {slot_value}))
-                if required & available:
-                    n += 1
-            return n
+            available |= tags_mask(it.tag_data())
+        known = self.player.known_blueprints
+        same_size = index.buckets.get(len(selected_items), ())
 
         # 1. Bekannte Blueprints → konkretes Merkmal (SPEC-002). Vorrang, weil
         #    entdecktes Wissen beim Wieder-Herstellen mehr wert ist als ein
         #    neuer Entdeckungs-Hinweis auf ein anderes Ziel.
         best_score, best_tag = -1, None
-        for bp in self.blueprints.values():
-            if bp.id not in self.player.known_blueprints:
-                continue
-            if len(bp.slots) != len(selected_items):
+        for entry in same_size:
+            if entry.bp.id not in known:
                 continue
-            missing = _missing_tags(bp, available)
-            if not missing:
+            score, missing = overlap_and_missing(entry, available)
+            if missing is None:
                 continue
-            score = len(bp.slots) - len(missing)
             if score > best_score:
-                best_score, best_tag = score, missing[0]
+                best_score, best_tag = score, missing
         if best_tag:
-            return f"MISSING_TAG:{best_tag}"
+            return Reason.MISSING_TAG, best_tag
 
         # 2. Unbekannte Blueprints → Beinahe-Treffer (SPEC-003). Einmalig: der
         #    Blueprint wandert in near_misses und feuert nicht erneut.
+        near_misses = self.player.near_misses
         near, near_overlap = None, 1  # muss ≥2 sein
-        for bp in self.blueprints.values():
-            if bp.id in self.player.known_blueprints:
+        for entry in index.entries:
+            bp_id = entry.bp.id
+            if bp_id in known or bp_id in near_misses:
                 continue
-            if bp.id in self.player.near_misses:
-                continue
-            o = _overlap(bp)
-            if 2 <= o < len(bp.slots) and o > near_overlap:
-                near_overlap, near = o, bp
+            o, _ = overlap_and_missing(entry, available)
+            if 2 <= o < len(entry.slot_masks) and o > near_overlap:
+                near_overlap, near = o, entry.bp
         if near is not None:
-            self.player.near_misses.add(near.id)
-            return f"NEAR_MISS:{near.id}"
+            near_misses.add(near.id)
+            return Reason.NEAR_MISS, near.id
 
         # 3. Generisch — konkretes Merkmal nur, solange kein Beinahe-Treffer
         #    lief (danach genügt der eine Hinweis; kein Dauer-Leak derselben
         #    Materialrichtung).
-        if not self.player.near_misses:
+        if not near_misses:
             best_score, best_tag = -1, None
-            for bp in self.blueprints.values():
-                if bp.id in self.player.known_blueprints:
-                    continue
-                if len(bp.slots) != len(selected_items):
+            for entry in same_size:
+                if entry.bp.id in known:
                     continue
-                missing = _missing_tags(bp, available)
-                if not missing:
+                score, missing = overlap_and_missing(entry, available)
+                if missing is None:
                     continue
-                score = len(bp.slots) - len(missing)
                 if score > best_score:
-                    best_score, best_tag = score, missing[0]
+                    best_score, best_tag = score, missing
             if best_tag:
-                return f"MISSING_TAG:{best_tag}"
-        return "NO_MATCH"
+                return Reason.MISSING_TAG, best_tag
+        return Reason.NO_MATCH, None
 
+    @_journaled
     def execute_experiment(self, selected_items: List[Item]) -> Dict[str, Any]:
         # Crafting ist sehr anstrengend (Effort 3.0)
         self._advance_time(2, effort_multiplier=3.0)
@@ -454,17 +1331,12 @@ class GameEngine:
         # Zerbrochene Items (condition=0) sind nicht craftbar → verständliches Feedback
         broken = [it.name for it in selected_items if it.condition <= 0]
         if broken:
-            return self._result(
-                False,
-                _feedback_message("BROKEN_ITEM", broken),
-                "BROKEN_ITEM")
+            return self._failed(Reason.BROKEN_ITEM, broken)
 
         # Zu wenige Items für den kleinsten Blueprint → nicht einmal ein Versuch
-        slot_counts = [len(bp.slots) for bp in self.blueprints.values()]
-        min_count = min(slot_counts) if slot_counts else 0
-        if len(selected_items) < min_count:
-            return self._result(False, _feedback_message("TOO_FEW_ITEMS"),
-                                "TOO_FEW_ITEMS")
+        index = _blueprint_index(self.blueprints)
+        if len(selected_items) < index.min_slots:
+            return self._failed(Reason.TOO_FEW_ITEMS)
 
         # Menge-Validierung (SPEC-005): Derselbe Stack kann N identische Slots
         # füllen, aber nur solange quantity >= N. Taucht ein Stack-Objekt mehrfach
@@ -477,29 +1349,54 @@ class GameEngine:
             n = seen.get(id(it), 0) + 1
             seen[id(it)] = n
             if n > it.quantity:
-                return self._result(False,
-                                    _feedback_message("NOT_ENOUGH_QUANTITY"),
-                                    "NOT_ENOUGH_QUANTITY")
-
-        for bp_id, bp in self.blueprints.items():
-            if len(selected_items) != len(bp.slots): continue
-            if self.player.stats["survival"] < bp.min_survival_req: continue
-
-            for p in itertools.permutations(selected_items):
-                mapping = {}
-                match = True
-                for i, slot in enumerate(bp.slots.keys()):
-                    if not _slot_satisfied(p[i].tags, bp.slots[slot]):
-                        match = False; break
-                    mapping[slot] = p[i]
-                
-                if match:
-                    if bp_id not in self.player.known_blueprints:
-                        self.player.known_blueprints.add(bp_id)
-                        self.player.stats["survival"] += 0.2
-                    return self._create_tool(bp, mapping)
-        reason = self._no_match_reason(selected_items)
-        return self._result(False, _feedback_message(reason), reason)
+                return self._failed(Reason.NOT_ENOUGH_QUANTITY)
+
+        # Memo (engine/memo.py): bei unverändertem Wissensstand entscheidet die
+        # Multimenge der Masken über Blueprint bzw. Reason — Matching und
+        # _no_match laufen nur beim ersten Mal.
+        player = self.player
+        item_masks = [tags_mask(it.tag_data()) for it in selected_items]
+        memo = self._memo
+        memo.validate(index, player.known_blueprints, player.near_misses,
+                      player.stats["survival"])
+        key = tuple(sorted(item_masks))
+        outcome = memo.get(key)
+        if outcome is None:
+            outcome = self._match(index, item_masks)
+            if outcome is None:
+                outcome = self._no_match(selected_items)
+                # NEAR_MISS verbucht den Hinweis in near_misses — nicht wiederholbar.
+                if outcome[0] is not Reason.NEAR_MISS:
+                    memo.put(key, outcome)
+            elif outcome.key in player.known_blueprints:
+                memo.put(key, outcome)
+        if not isinstance(outcome, CompiledBlueprint):
+            return self._failed(*outcome)
+        entry = outcome
+        assignment = first_assignment(entry.slot_masks, item_masks)
+        mapping = {slot: selected_items[j] for slot, j in zip(entry.slot_keys, assignment)}
+        if entry.key not in player.known_blueprints:
+            player.known_blueprints.add(entry.key)
+            player.stats["survival"] += 0.2
+        return self._create_tool(entry.bp, mapping)
+
+    def _match(self, index: BlueprintIndex, item_masks: List[int]):
+        """Erster Blueprint (Dict-Reihenfolge) mit gültiger Slot-Belegung für
+        die Masken — oder None."""
+        # Slot-Zuordnung über Tag-Bitmasken + Matching (engine/tags.py): nur
+        # Blueprints passender Slot-Anzahl, in Dict-Reihenfolge; je Blueprint
+        # die lexikographisch erste Belegung — dieselbe, die die frühere
+        # Permutations-Suche zuerst gefunden hätte.
+        available = 0
+        for m in item_masks:
+            available |= m
+        survival = self.player.stats["survival"]
+        for entry in index.buckets.get(len(item_masks), ()):
+            if survival < entry.bp.min_survival_req: continue
+            if not all(m & available for m in entry.slot_masks): continue
+            if first_assignment(entry.slot_masks, item_masks) is not None:
+                return entry
+        return None
 
     def _create_tool(self, bp: ToolBlueprint, comp: Dict[str, Item]) -> Dict[str, Any]:
         dur_attr = min(c.get_attr("durability", 0.5) for c in comp.values())
@@ -523,11 +1420,12 @@ class GameEngine:
             name = f"{main.name}-{bp.result_name} ({comp_list[1].name})"
         else:
             name = f"{main.name}-{bp.result_name}"
+        tags = {"DURABILITY": dur_attr}
+        for t in bp.tool_tags:
+            tags[t] = power
         new_tool = Item(name=name, base_weight=sum(c.base_weight for c in comp.values()),
-                        tags={"DURABILITY": dur_attr}, attributes={"durability": dur_attr, "power": power},
+                        tags=tags, attributes={"durability": dur_attr, "power": power},
                         template_id=bp.id)
-        for t in bp.tool_tags:
-            new_tool.tags[t] = power
         for c in comp.values():
             # Robust: verbrauche nur Stacks, die wirklich im Inventar liegen. Ein
             # Item-Objekt kann mehrfach selektiert (derselbe Stack) oder in einem
@@ -540,9 +1438,8 @@ class GameEngine:
             else:
                 self.player.inventory.items.remove(c)
         self.player.inventory.add(new_tool)
-        return {"success": True, "message": f"Hergestellt: {name}",
-                "reason": "SUCCESS", "blueprint_id": bp.id,
-                "result_template_id": bp.id}
+        return ActionResult("execute_experiment", True, Reason.SUCCESS, name,
+                            blueprint_id=bp.id)
 
     # ------------------------------------------------------------------
     # Prozess-System — Transformationen mit Umgebungs-/Werkzeug-Kontext
@@ -550,15 +1447,14 @@ class GameEngine:
 
     def _count_template(self, template_id: str) -> int:
         """Gesamtmenge eines Items über alle Stacks (nach template_id)."""
-        return sum(it.quantity for it in self.player.inventory.items
-                   if it.template_id == template_id)
+        return self.player.inventory.count_template(template_id)
 
     def _consume_template(self, template_id: str, qty: int):
         """Entfernt qty eines Items (über mehrere Stacks, falls nötig)."""
         remaining = qty
-        for it in list(self.player.inventory.items):
-            if it.template_id != template_id or remaining <= 0:
-                continue
+        for it in self.player.inventory.stacks_of(template_id):
+            if remaining <= 0:
+                break
             take = min(it.quantity, remaining)
             it.quantity -= take
             remaining -= take
@@ -567,8 +1463,7 @@ class GameEngine:
         return remaining == 0
 
     def _item_name(self, template_id: str) -> str:
-        t = TEMPLATE_DB.get(template_id)
-        return t.name if t else template_id
+        return _template_name(template_id)
 
     # ------------------------------------------------------------------
     # Wärmemanagement (SPEC-007) — Feuer entzünden, hüten, nachlegen
@@ -584,6 +1479,7 @@ class GameEngine:
         loc = self.current_location
         loc.fire_active = True
         loc.fire_fuel = START_FIRE_FUEL
+        self._schedule_fire()
 
     def _fire_lit(self) -> bool:
         """Ein aktives Feuer mit Brennstoff brennt an der aktuellen Location."""
@@ -607,7 +1503,9 @@ class GameEngine:
         geringer Exposition (z.B. die Höhle). Nur HIER heilt eine behandelte
         Wunde über Zeit — behandelt aber unterwegs heilt nicht (SPEC-009).
         """
-        return self._fire_lit() or self.current_location.exposure <= REST_EXPOSURE
+        lid = self.current_location_id
+        return (self._fire_lit()
+                or self._climate_for(lid, self.current_weather).site_exposure[lid] <= REST_EXPOSURE)
 
     def _inflict(self, kind: str) -> bool:
         """Setzt eine Verletzung, falls nicht schon aktiv. True, wenn neu.
@@ -618,6 +1516,7 @@ class GameEngine:
         if kind in self.player.injuries:
             return False
         self.player.injuries[kind] = {"severity": 1.0, "ticks": 0, "treated": False}
+        self._events.cancel((HEAL_EVENT, kind))
         return True
 
     def _injury_effort_malus(self) -> float:
@@ -630,15 +1529,16 @@ class GameEngine:
     def _find_fuel_item(self):
         """Brennstoff-Item fürs Nachlegen: Holz (WOOD) bevorzugt, sonst Zunder/
         Reisig (KINDLING) — aber nie die Feuergrube selbst."""
-        for it in self.player.inventory.items:
-            if "WOOD" in it.tags and it.condition > 0:
-                return it
-        for it in self.player.inventory.items:
-            if ("KINDLING" in it.tags and it.template_id != "fire_pit"
-                    and it.condition > 0):
+        inv = self.player.inventory
+        wood = inv.find_item_by_tag("WOOD")
+        if wood is not None:
+            return wood
+        for it in inv.items_with_tag("KINDLING"):
+            if it.template_id != "fire_pit" and it.condition > 0:
                 return it
         return None
 
+    @_journaled
     def stoke_fire(self) -> Dict[str, Any]:
         """Legt Brennstoff nach: erhöht fire_fuel, kostet Zeit (Long-Dark-Zyklus).
 
@@ -647,37 +1547,31 @@ class GameEngine:
         """
         loc = self.current_location
         if not loc.fire_active:
-            return {"success": False, "message": _feedback_message("NO_FIRE"),
-                    "reason": "NO_FIRE"}
+            return ActionResult("stoke_fire", False, Reason.NO_FIRE)
         fuel = self._find_fuel_item()
         if fuel is None:
-            return {"success": False, "message": _feedback_message("MISSING_FUEL"),
-                    "reason": "MISSING_FUEL"}
+            return ActionResult("stoke_fire", False, Reason.MISSING_FUEL)
         name = fuel.name
         if fuel.quantity > 1:
             fuel.quantity -= 1
         else:
             self.player.inventory.items.remove(fuel)
         loc.fire_fuel += STOKE_FUEL
+        self._schedule_fire()
         # Nachlegen ist Arbeit und vergeht Zeit — Brennstoff brennt weiter.
         time_msg = self._advance_time(1, effort_multiplier=1.0)
-        msg = f"Du legst {name} nach. "
-        msg += (time_msg if time_msg else "")
-        return {"success": True, "message": msg.strip(), "reason": "SUCCESS"}
+        return ActionResult("stoke_fire", True, Reason.SUCCESS, name, log=time_msg)
 
     def available_processes(self) -> List[str]:
-        """Prozesse, deren Inputs, Werkzeug- und Umgebungs-Anforderungen erfüllt sind."""
-        avail = []
-        for pid, proc in self.processes.items():
-            if any(self._count_template(i) < q for i, q in proc.inputs.items()):
-                continue
-            if any(not self.player.inventory.find_item_by_tag(t) for t in proc.tools):
-                continue
-            if proc.required_tag_in_env and not self._env_satisfied(proc.required_tag_in_env):
-                continue
-            avail.append(pid)
-        return avail
+        """Prozesse, deren Inputs, Werkzeug- und Umgebungs-Anforderungen erfüllt sind.
 
+        Nachgeführt statt neu geprüft: nur Prozesse, deren Input-Templates,
+        Werkzeug-Tags oder Umgebung sich seit der letzten Abfrage geändert
+        haben, werden neu bewertet (engine/availability.py).
+        """
+        return self._avail.query(self)
+
+    @_journaled
     def execute_process(self, process_id: str) -> Dict[str, Any]:
         """Führt einen Prozess aus: konsumiert Inputs, nutzt Werkzeuge, erzeugt Outputs.
 
@@ -688,25 +1582,19 @@ class GameEngine:
         """
         proc = self.processes.get(process_id)
         if not proc:
-            return {"success": False, "message": "Unbekannter Prozess.",
-                    "reason": "UNKNOWN_PROCESS"}
+            return ActionResult("execute_process", False, Reason.UNKNOWN_PROCESS)
 
         for item_id, qty in proc.inputs.items():
             if self._count_template(item_id) < qty:
-                return {"success": False,
-                        "message": f"Es fehlt dir {self._item_name(item_id)}.",
-                        "reason": f"MISSING_INPUT:{item_id}"}
+                return ActionResult("execute_process", False, Reason.MISSING_INPUT, item_id)
 
         for tag in proc.tools:
             if not self.player.inventory.find_item_by_tag(tag):
-                return {"success": False,
-                        "message": f"Es fehlt dir {_label_for(tag)} als Werkzeug.",
-                        "reason": f"MISSING_TOOL:{tag}"}
+                return ActionResult("execute_process", False, Reason.MISSING_TOOL, tag)
 
         if proc.required_tag_in_env and not self._env_satisfied(proc.required_tag_in_env):
-            return {"success": False,
-                    "message": _feedback_message(f"MISSING_ENV:{proc.required_tag_in_env}"),
-                    "reason": f"MISSING_ENV:{proc.required_tag_in_env}"}
+            return ActionResult("execute_process", False, Reason.MISSING_ENV,
+                                proc.required_tag_in_env)
 
         # SPEC-007: start_fire entzündet das Location-Feuer, BEVOR die
         # Entzündungsdauer vergeht — ein frisch gebautes Feuer wärmt schon
@@ -720,14 +1608,14 @@ class GameEngine:
         # Die eigentliche Heilung braucht danach zusätzlich Ruhe am warmen Ort.
         if process_id == "treat_cut":
             if "cut" not in self.player.injuries:
-                return {"success": False, "message": _feedback_message("NO_INJURY"),
-                        "reason": "NO_INJURY"}
+                return ActionResult("execute_process", False, Reason.NO_INJURY)
             self.player.injuries["cut"]["treated"] = True
+            self._schedule_heal("cut")
         if process_id == "treat_strain":
             if "strain" not in self.player.injuries:
-                return {"success": False, "message": _feedback_message("NO_INJURY"),
-                        "reason": "NO_INJURY"}
+                return ActionResult("execute_process", False, Reason.NO_INJURY)
             self.player.injuries["strain"]["treated"] = True
+            self._schedule_heal("strain")
 
         # Inputs verbrauchen, dann Zeit/Energie kosten (wie Crafting anstrengend)
         for item_id, qty in proc.inputs.items():
@@ -741,11 +1629,117 @@ class GameEngine:
             self.player.known_processes.add(process_id)
             self.player.stats["survival"] += 0.1
 
-        return {"success": True, "message": f"Prozess ausgeführt: {proc.name}",
-                "reason": "SUCCESS", "process_id": process_id}
+        return ActionResult("execute_process", True, Reason.SUCCESS, proc.name,
+                            process_id=process_id)
 
+    @_journaled
     def travel(self, tid: str):
-        if tid not in self.locations: return "Unbekannt."
+        if tid not in self.locations:
+            return (Reason.UNKNOWN_LOCATION, tid) if self._headless else "Unbekannt."
         self.current_location_id = tid
+        self._schedule_fire()
         msg = self._advance_time(3, effort_multiplier=1.5)
-        return f"Gereist nach {self.locations[tid].name}. " + (msg if msg else "")
\ No newline at end of file
+        if self._headless:
+            return (Reason.SUCCESS, self.locations[tid].name, (tid,))
+        return f"Gereist nach {self.locations[tid].name}. " + (msg if msg else "")
+
+    # -- Headless-Aktionen ---------------------------------------------------
+
+    def step(self, actions) -> List[StepResult]:
+        """Führt `actions` nacheinander aus, ohne Meldungstexte zu bauen.
+
+        Eine Aktion ist ein Tupel `(op, *args)` mit `op` aus gather, eat,
+        travel, execute_experiment, execute_process, stoke_fire, wait —
+        z.B. `("travel", "cave")` oder `("execute_experiment", [a, b])`. Der
+        Spielverlauf ist derselbe wie bei den Einzelaufrufen (auch im
+        Journal); zurück kommt je Aktion ein StepResult mit Reason-Code, IDs
+        und Deltas, Text erst über `StepResult.message()`.
+        """
+        p = self.player
+        out = []
+        new = tuple.__new__   # StepResult ohne NamedTuple-__new__ (heißer Pfad)
+        convert_of = _STEP_OPS.get
+        self._headless = True
+        try:
+            for action in actions:
+                op = action[0]
+                convert = convert_of(op)
+                if convert is None:
+                    raise ValueError(f"Unbekannte Aktion: {op}")
+                # Gebunden aufgelöst: Instanz-Hooks (Profiler) und Journal greifen.
+                method = getattr(self, op)
+                energy, hp, body_temp, tick = p.energy, p.hp, p.body_temp, self._tick
+                raw = method(*action[1:]) if len(action) > 1 else method()
+                reason, detail, ids, amounts = convert(raw)
+                out.append(new(StepResult, (op, reason, detail, ids, amounts,
+                                            p.energy - energy, p.hp - hp,
+                                            p.body_temp - body_temp, self._tick - tick)))
+        finally:
+            self._headless = False
+        return out
+
+
+# Enum-Mitglieder als Modul-Konstanten: der Attribut-Zugriff über die
+# Enum-Klasse ist auf den heißen Pfaden spürbar.
+_SUCCESS = Reason.SUCCESS
+_DEPLETED = Reason.DEPLETED
+_INJURED = Reason.INJURED
+_NOTHING_FOUND = Reason.NOTHING_FOUND
+
+
+def _gather_events(logs) -> str:
+    """Ereignisfolge eines Gather für `StepResult.detail`: je Zeile ein
+    Zeichen (f = Fund, d = erschöpft, i = verletzt, b = Werkzeug zerbrochen),
+    danach die Namen der zerbrochenen Werkzeuge, durch Zeilenumbrüche getrennt."""
+    codes = "".join("f" if e.__class__ is tuple else "d" if e is _DEPLETED
+                    else "i" if e is _INJURED else "b" for e in logs)
+    return "\n".join([codes] + [e for e in logs if e.__class__ is str])
+
+
+def _gather_outcome(logs) -> tuple:
+    if not logs:
+        return _NOTHING_FOUND, "", (), ()
+    found = [entry for entry in logs if entry.__class__ is tuple]
+    # Nur Funde (der Normalfall): die Reihenfolge steckt schon in `ids`.
+    events = "" if len(found) == len(logs) else _gather_events(logs)
+    if found:
+        ids, amounts = zip(*found)
+        return _SUCCESS, events, ids, amounts
+    return (_DEPLETED if _DEPLETED in logs else _NOTHING_FOUND), events, (), ()
+
+
+def _result_outcome(res: ActionResult) -> tuple:
+    reason, payload = res.reason, res.payload
+    if reason == _SUCCESS:
+        if res.process_id is not None:
+            return reason, payload, (res.process_id,), ()
+        return reason, payload, (res.blueprint_id,) if res.blueprint_id else (), ()
+    if reason == Reason.BROKEN_ITEM:
+        return reason, "", tuple(payload), ()
+    return reason, payload or "", (), ()
+
+
+_NO_DETAIL = ("", (), ())
+_WAIT_OUTCOME = (_SUCCESS,) + _NO_DETAIL
+
+
+def _tuple_outcome(raw) -> tuple:
+    # eat/travel liefern headless (Reason[, Detail[, IDs[, Mengen]]]).
+    return raw + _NO_DETAIL[len(raw) - 1:]
+
+
+def _wait_outcome(logs) -> tuple:
+    return _WAIT_OUTCOME
+
+
+# step(): Aktion (Methodenname) → Umwandlung ihres Headless-Rückgabewerts in
+# StepResult-Felder.
+_STEP_OPS = {
+    "gather": _gather_outcome,
+    "eat": _tuple_outcome,
+    "travel": _tuple_outcome,
+    "execute_experiment": _result_outcome,
+    "execute_process": _result_outcome,
+    "stoke_fire": _result_outcome,
+    "wait": _wait_outcome,
+}
@@ -0,0 +1,266 @@
+"""
+engine/journal.py
+Aktions-Journal und deterministisches Replay.
+
+Ein Journal hängt an einer Engine (`Journal.record(engine)`) und schreibt jeden
+öffentlichen Aufruf mit — `gather`, `eat`, `travel`, `execute_experiment`,
+`execute_process`, `stoke_fire`, `wait` — samt Argumenten, Uhr und den
+Positionen der drei RNG-Ströme davor. Items einer Experiment-Auswahl stehen als
+Index ins Inventar (zum Zeitpunkt des Aufrufs) im Journal, inventarfremde Items
+mit ihren Feldern. Alle `check_every` Ticks kommt eine Prüfsumme über den
+Spielzustand dazu.
+
+Gespeichert wird als JSONL: Kopfzeile (Content-Hash, Seed, Start-Uhr und der
+komplette Startzustand als JSON-Form von `snapshot()`), dann ein Objekt pro
+Aufruf bzw. Prüfpunkt. `replay()` stellt den Startzustand auf einer Engine aus
+dem Prototyp wieder her und spielt das Journal darauf nach — ohne Journal und
+headless wie `GameEngine.step()`, Meldungstexte werden gar nicht erst gebaut —
+und bricht beim ersten Abweichen ab. Aufzeichnen lässt sich damit auch mitten
+in einer Partie.
+"""
+import json
+import zlib
+from array import array
+from typing import Any, Dict, List, Optional
+
+from engine.components import Item
+from engine.core import EngineSnapshot, GameEngine, _blank_rng
+from data.items import create_item
+from data.loader import load_content
+
+JOURNAL_VERSION = 2
+CHECK_EVERY = 144   # Prüfsumme einmal pro Spieltag
+
+
+def _rng_mark(rng) -> int:
+    """Kurzer Fingerabdruck eines RNG-Zustands (CRC der Mersenne-Twister-Worte)."""
+    return zlib.crc32(array("I", rng.getstate()[1]).tobytes())
+
+
+def _rng_marks(engine: GameEngine) -> List[int]:
+    return [_rng_mark(engine.weather_rng), _rng_mark(engine.gather_rng),
+            _rng_mark(engine.injuries_rng)]
+
+
+def state_checksum(engine: GameEngine) -> int:
+    """CRC über den veränderlichen Spielzustand (Basis: `snapshot()`), unabhängig
+    von PYTHONHASHSEED — Mengen gehen sortiert ein. Von der Event-Queue zählen
+    nur Termine und ihre Reihenfolge, nicht der interne Einplan-Zähler."""
+    snap = engine.snapshot()
+    inventory = tuple(
+        (it.name, it.base_weight, it.quantity, it.condition, it.template_id,
+         tuple(it.tags.items()), tuple(it.attributes.items()))
+        for it in engine.player.inventory.items)
+    canon = (snap.tick, snap.weather, snap.location_id, _event_order(snap.events), snap.vitals,
+             snap.stats, tuple(tuple(sorted(k)) for k in snap.known), snap.injuries,
+             snap.inventory[0], inventory, snap.world, _rng_marks(engine))
+    return zlib.crc32(repr(canon).encode())
+
+
+def _event_order(events: tuple) -> tuple:
+    """Event-Queue-Zustand → ((Schlüssel, Termin), ...) in Abarbeitungs-Reihenfolge."""
+    return tuple((key, due) for key, (due, _) in sorted(events[1], key=lambda e: e[1]))
+
+
+def _encode_state(snap: EngineSnapshot) -> Dict[str, Any]:
+    """`snapshot()` → JSON-Objekt für die Kopfzeile. Item-Protos werden über die
+    Template-ID wiedergefunden, die Event-Queue zählt beim Laden neu durch."""
+    capacity, records = snap.inventory
+    return {
+        "tick": snap.tick,
+        "weather": snap.weather,
+        "location": snap.location_id,
+        "events": [[list(key), due] for key, due in _event_order(snap.events)],
+        "rng": [[st[0], list(st[1]), st[2]] for st in snap.rng_states],
+        "vitals": list(snap.vitals),
+        "stats": [list(kv) for kv in snap.stats],
+        "known": [sorted(k) for k in snap.known],
+        "injuries": [[kind, [list(kv) for kv in fields]] for kind, fields in snap.injuries],
+        "inventory": [capacity, [[name, weight, qty, cond, tid, tags, attrs]
+                                 for name, weight, qty, cond, tid, _, tags, attrs in records]],
+        "world": [[lid, active, fuel, [list(node) for node in nodes]]
+                  for lid, active, fuel, nodes in snap.world],
+    }
+
+
+def _decode_state(state: Dict[str, Any]) -> EngineSnapshot:
+    events = tuple((tuple(key), (due, seq))
+                   for seq, (key, due) in enumerate(state["events"], 1))
+    records = []
+    for name, weight, qty, cond, tid, tags, attrs in state["inventory"][1]:
+        proto = create_item(tid)._proto if tags is None or attrs is None else None
+        records.append((name, weight, qty, cond, tid, proto, tags, attrs))
+    return EngineSnapshot(
+        tick=state["tick"],
+        weather=state["weather"],
+        location_id=state["location"],
+        events=(len(events), events),
+        rng_states=tuple((version, tuple(internal), gauss)
+                         for version, internal, gauss in state["rng"]),
+        vitals=tuple(state["vitals"]),
+        stats=tuple(tuple(kv) for kv in state["stats"]),
+        known=tuple(frozenset(k) for k in state["known"]),
+        injuries=tuple((kind, tuple(tuple(kv) for kv in fields))
+                       for kind, fields in state["injuries"]),
+        inventory=(state["inventory"][0], tuple(records)),
+        world=tuple((lid, active, fuel, tuple(tuple(node) for node in nodes))
+                    for lid, active, fuel, nodes in state["world"]),
+    )
+
+
+def _encode_items(engine: GameEngine, items) -> list:
+    """Experiment-Auswahl → Inventar-Indizes (Identität), fremde Items als Felder."""
+    index = {id(it): i for i, it in enumerate(engine.player.inventory.items)}
+    out = []
+    for it in items:
+        i = index.get(id(it))
+        out.append(i if i is not None else {
+            "item": [it.name, it.base_weight, dict(it.tags), it.quantity,
+                     it.condition, dict(it.attributes), it.template_id]})
+    return out
+
+
+def _decode_items(engine: GameEngine, handles: list) -> List[Item]:
+    items = engine.player.inventory.items
+    return [items[h] if isinstance(h, int) else Item(*h["item"]) for h in handles]
+
+
+class Journal:
+    """Mitschrift der Aufrufe einer Engine (siehe Modul-Docstring).
+
+    `header` ist die Kopfzeile, `entries` die Aufrufe (`{"op": …}`) und
+    Prüfpunkte (`{"check": tick, "sum": …}`) in Reihenfolge.
+    """
+
+    def __init__(self, header: Dict[str, Any], entries: Optional[List[dict]] = None):
+        self.header = header
+        self.entries: List[dict] = list(entries or ())
+        self._depth = 0
+        self._next_check = 0
+
+    @classmethod
+    def record(cls, engine: GameEngine, check_every: int = CHECK_EVERY) -> "Journal":
+        """Hängt ein neues Journal an `engine` und schreibt den ersten Prüfpunkt.
+
+        Die Kopfzeile enthält den Startzustand (`snapshot()`), die Engine muss
+        also nicht frisch sein.
+        """
+        header = {
+            "journal": JOURNAL_VERSION,
+            "content": load_content().content_hash,
+            "seed": engine.seed,
+            "tick": engine.tick_counter,
+            "check_every": check_every,
+            "shared_rng": engine.weather_rng is engine.gather_rng,
+            "start": _encode_state(engine.snapshot()),
+        }
+        journal = cls(header)
+        engine.journal = journal
+        journal.checkpoint(engine)
+        return journal
+
+    def call(self, engine: GameEngine, op: str, method, args: tuple, kwargs: dict):
+        """Führt eine Aktion aus und verbucht sie (Hook von `_journaled`)."""
+        if self._depth:
+            return method(engine, *args, **kwargs)
+        entry: Dict[str, Any] = {"op": op, "tick": engine.tick_counter,
+                                 "rng": _rng_marks(engine)}
+        rec_args, rec_kwargs = args, kwargs
+        if op == "execute_experiment":
+            if args:
+                rec_args = (_encode_items(engine, args[0]),) + args[1:]
+            elif "selected_items" in kwargs:
+                rec_kwargs = dict(kwargs, selected_items=_encode_items(
+                    engine, kwargs["selected_items"]))
+        if rec_args:
+            entry["args"] = list(rec_args)
+        if rec_kwargs:
+            entry["kwargs"] = rec_kwargs
+        self.entries.append(entry)
+        self._depth += 1
+        try:
+            result = method(engine, *args, **kwargs)
+        finally:
+            self._depth -= 1
+        if engine.tick_counter >= self._next_check:
+            self.checkpoint(engine)
+        return result
+
+    def checkpoint(self, engine: GameEngine):
+        """Schreibt einen Prüfpunkt (Uhr + Zustands-Prüfsumme)."""
+        tick = engine.tick_counter
+        self.entries.append({"check": tick, "sum": state_checksum(engine)})
+        every = self.header["check_every"]
+        self._next_check = (tick // every + 1) * every
+
+    def close(self, engine: GameEngine):
+        """Letzter Prüfpunkt und Abhängen von der Engine."""
+        self.checkpoint(engine)
+        engine.journal = None
+
+    # -- JSONL ---------------------------------------------------------------
+
+    def dumps(self) -> str:
+        lines = [json.dumps(e, separators=(",", ":")) for e in [self.header] + self.entries]
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def loads(cls, text: str) -> "Journal":
+        lines = [json.loads(line) for line in text.splitlines() if line.strip()]
+        if not lines or lines[0].get("journal") != JOURNAL_VERSION:
+            raise ValueError("Kein Journal (oder unbekannte Version)")
+        return cls(lines[0], lines[1:])
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.dumps())
+
+    @classmethod
+    def load(cls, path: str) -> "Journal":
+        with open(path, encoding="utf-8") as f:
+            return cls.loads(f.read())
+
+
+def replay(journal: Journal, strict: bool = False) -> GameEngine:
+    """Stellt den Startzustand von `journal` auf einer Engine aus dem Prototyp
+    wieder her, spielt die Aufrufe darauf nach und gibt die Engine zurück.
+
+    Vor jedem Aufruf wird die Uhr verglichen, an jedem Prüfpunkt die
+    Zustands-Prüfsumme (samt RNG-Positionen); die erste Abweichung wirft
+    ValueError mit der Eintragsnummer. `strict` prüft die RNG-Positionen schon
+    vor jedem Aufruf — langsamer, benennt aber die erste abweichende Aktion.
+    """
+    header = journal.header
+    if header["content"] != load_content().content_hash:
+        raise ValueError("Journal wurde mit anderem Content aufgezeichnet")
+    engine = GameEngine.from_prototype(seed=header["seed"])
+    if header["shared_rng"]:
+        engine.weather_rng = engine.gather_rng = _blank_rng()
+    else:
+        engine.weather_rng, engine.gather_rng = _blank_rng(), _blank_rng()
+    engine.injuries_rng = _blank_rng()
+    engine.restore(_decode_state(header["start"]))
+
+    engine._headless = True       # Rohdaten statt Meldungstexten, wie in step()
+    try:
+        for n, entry in enumerate(journal.entries):
+            op = entry.get("op")
+            if op is None:
+                if engine.tick_counter != entry["check"] or state_checksum(engine) != entry["sum"]:
+                    raise ValueError(f"Replay weicht ab: Prüfpunkt bei Tick {entry['check']} "
+                                     f"(Eintrag {n})")
+                continue
+            if engine.tick_counter != entry["tick"] or (strict and _rng_marks(engine) != entry["rng"]):
+                raise ValueError(f"Replay weicht ab: vor Eintrag {n} ({op})")
+            args = entry.get("args", ())
+            kwargs = entry.get("kwargs", {})
+            if op == "execute_experiment":
+                if args:
+                    args = [_decode_items(engine, args[0])] + list(args[1:])
+                else:
+                    kwargs = dict(kwargs, selected_items=_decode_items(
+                        engine, kwargs["selected_items"]))
+            getattr(engine, op)(*args, **kwargs)
+    finally:
+        engine._headless = False
+    return engine
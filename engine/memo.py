@@ -0,0 +1,100 @@
+"""
+engine/memo.py
+LRU-Memo für Experiment-Ausgänge.
+
+Bei festem Wissensstand des Spielers (`known_blueprints`, `near_misses`,
+Survival-Stufe) hängt der Ausgang von `execute_experiment` nur noch von der
+Multimenge der Tag-Masken der gewählten Items ab: welcher Blueprint passt
+(Existenz einer Slot-Belegung ist reihenfolgeunabhängig) bzw. welcher
+Reason + Detail beim Fehlschlag. Das Memo merkt sich diese Ausgänge pro Engine
+und verwirft alles, sobald sich der Wissensstand ändert. Was vorher geprüft
+wird — zerbrochene Items, zu wenige Items, Stack-Mengen — hängt an Zustand und
+Identität der Items und geht nicht durchs Memo.
+
+Die Survival-Stufe ist die Anzahl der `min_survival_req`-Schwellen, die der
+Survival-Wert erreicht; nur ein Stufenwechsel ändert, welche Blueprints
+freigeschaltet sind.
+"""
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Dict
+
+MEMO_SIZE = 256   # Einträge pro Engine (Multimengen je Wissensstand)
+
+# Prozessweite Zähler über alle Memos (Scorecard-Läufe bauen Hunderte Engines).
+TOTALS: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+
+def memo_totals() -> Dict[str, float]:
+    """Prozessweite Zähler samt Trefferquote."""
+    lookups = TOTALS["hits"] + TOTALS["misses"]
+    return dict(TOTALS, hit_rate=round(TOTALS["hits"] / lookups, 4) if lookups else 0.0)
+
+
+def reset_totals():
+    for key in TOTALS:
+        TOTALS[key] = 0
+
+
+class ExperimentMemo:
+    """LRU aus Masken-Multimenge → Ausgang, gültig für einen Wissensstand.
+
+    Ausgang ist der passende `CompiledBlueprint` oder ein `(Reason, Detail)`-
+    Paar. `validate()` vergleicht vor jeder Abfrage den Stand (Blueprint-Index,
+    bekannte Blueprints, Beinahe-Treffer, Survival-Stufe) mit dem gemerkten und
+    leert das Memo bei Abweichung — auch wenn Tests oder Tools die Mengen direkt
+    austauschen.
+    """
+
+    __slots__ = ("size", "entries", "hits", "misses", "evictions", "invalidations",
+                 "_index", "_thresholds", "_known", "_near", "_tier")
+
+    def __init__(self, size: int = MEMO_SIZE):
+        self.size = size
+        self.entries: "OrderedDict[tuple, object]" = OrderedDict()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+        self._index = None
+        self._thresholds = ()
+        self._known = self._near = frozenset()
+        self._tier = 0
+
+    def validate(self, index, known, near_misses, survival: float):
+        """Leert das Memo, falls sich der Wissensstand seit dem Befüllen geändert hat."""
+        if index is not self._index:
+            self._index = index
+            self._thresholds = tuple(sorted({e.bp.min_survival_req for e in index.entries}))
+        elif (known == self._known and near_misses == self._near
+              and bisect_right(self._thresholds, survival) == self._tier):
+            return
+        if self.entries:
+            self.entries.clear()
+            self.invalidations += 1
+            TOTALS["invalidations"] += 1
+        self._known = frozenset(known)
+        self._near = frozenset(near_misses)
+        self._tier = bisect_right(self._thresholds, survival)
+
+    def get(self, key: tuple):
+        """Gemerkter Ausgang (und LRU-Auffrischung) oder None."""
+        outcome = self.entries.get(key)
+        if outcome is None:
+            self.misses += 1
+            TOTALS["misses"] += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        TOTALS["hits"] += 1
+        return outcome
+
+    def put(self, key: tuple, outcome):
+        self.entries[key] = outcome
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+            TOTALS["evictions"] += 1
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0}
@@ -0,0 +1,204 @@
+"""
+engine/profiling.py
+Zähler und Zeitmesser für die heißen Pfade einer Engine.
+
+Ein Profiler hängt sich wie das Journal an einzelne Engines
+(`Profiler.attach(engine)`) und misst dort `step`, `gather`,
+`execute_experiment` mit seinen beiden Zweigen `_match` (Blueprint-Suche) und
+`_no_match` (Fehlschlag-Reason), `execute_process`, `available_processes`,
+`wait` und die Zeitschritte `_advance_time` und `_advance_segment` (die
+ereignisfreien Strecken von `wait`). Die Messung sitzt in Instanz-Attributen,
+die die Methoden der Klasse überdecken — eine Engine ohne Profiler läuft
+unverändert, ohne jede Prüfung im Aufrufpfad; `step()` löst seine Aktionen
+gebunden auf und läuft so ebenfalls durch die Messung. `detach()` entfernt
+sie wieder; ein `fork()` startet ohne.
+
+Pro Abschnitt zählt der Profiler Aufrufe, Gesamtzeit und Eigenzeit (ohne die
+Zeit gemessener Unter-Abschnitte) samt Aufrufer, dazu benannte Zähler:
+`ticks` (simulierte Zeit) und `<methode>.<REASON>` je Aktions-Ergebnis.
+Ausgabe als Dict (`as_dict`), Prometheus-Textformat (`prometheus`,
+`write_prometheus` für den Textfile-Collector) oder im Format von cProfile:
+`pstats.Stats(profiler)`, `dump_stats(path)` und `summary()`.
+"""
+import io
+import marshal
+import pstats
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+from engine.core import ActionResult, GameEngine
+
+# Gemessene Methoden in Aufruf-Hierarchie (Aktionen vor ihren Unter-Schritten).
+SECTIONS = ("step", "gather", "execute_experiment", "_match", "_no_match", "execute_process",
+            "available_processes", "wait", "_advance_time", "_advance_segment")
+# Prefix der Prometheus-Metriken.
+METRIC_PREFIX = "primal_engine"
+
+
+def _code_key(name: str) -> Tuple[str, int, str]:
+    """(Datei, Zeile, Funktion) der Methode wie in cProfile — bei
+    `_journaled`-Aktionen die eigentliche Methode, nicht der Hook."""
+    func = getattr(GameEngine, name)
+    code = getattr(func, "__wrapped__", func).__code__
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+class Section:
+    """Messwerte eines Abschnitts; `callers` je aufrufendem Abschnitt
+    (None = Aufruf von außen) als [Aufrufe, Eigenzeit, Gesamtzeit]."""
+
+    __slots__ = ("name", "calls", "total", "own", "callers")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.total = 0.0
+        self.own = 0.0
+        self.callers: Dict[Optional[str], List[float]] = {}
+
+    def as_dict(self) -> dict:
+        return {"calls": self.calls, "total_s": self.total, "own_s": self.own}
+
+
+class Profiler:
+    """Sammelt Abschnitte und Zähler über alle angehängten Engines."""
+
+    def __init__(self):
+        self.sections: Dict[str, Section] = {name: Section(name) for name in SECTIONS}
+        self.counters: Dict[str, int] = {}
+        self.stats: dict = {}
+        self._stack: List[list] = []      # [Abschnitt, Zeit gemessener Unter-Abschnitte]
+        self._engines: List[GameEngine] = []
+
+    @classmethod
+    def attach(cls, engine: GameEngine, profiler: Optional["Profiler"] = None) -> "Profiler":
+        """Misst die Abschnitte von `engine` (in einem neuen oder dem
+        übergebenen Profiler, z.B. um mehrere Engines zusammenzufassen)."""
+        profiler = profiler or cls()
+        if any(e is engine for e in profiler._engines):
+            return profiler
+        for name in SECTIONS:
+            setattr(engine, name, profiler._timed(name, getattr(engine, name)))
+        profiler._engines.append(engine)
+        return profiler
+
+    def detach(self, engine: Optional[GameEngine] = None):
+        """Nimmt die Messung von `engine` (Default: allen) wieder ab."""
+        for e in [e for e in self._engines if engine is None or e is engine]:
+            for name in SECTIONS:
+                e.__dict__.pop(name, None)
+            self._engines.remove(e)
+
+    def reset(self):
+        """Verwirft alle Messwerte; angehängte Engines bleiben gemessen."""
+        for name, sec in self.sections.items():
+            sec.__init__(name)
+        self.counters.clear()
+
+    def count(self, name: str, n: int = 1):
+        """Eigener benannter Zähler (erscheint in allen Ausgaben)."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def _timed(self, name: str, bound):
+        sec = self.sections[name]
+        stack = self._stack
+        counters = self.counters
+
+        def timed(*args, **kwargs):
+            frame = [sec, 0.0]
+            stack.append(frame)
+            start = perf_counter()
+            try:
+                result = bound(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                stack.pop()
+                own = elapsed - frame[1]
+                sec.calls += 1
+                sec.total += elapsed
+                sec.own += own
+                caller = None
+                if stack:
+                    parent = stack[-1]
+                    parent[1] += elapsed
+                    caller = parent[0].name
+                entry = sec.callers.get(caller)
+                if entry is None:
+                    entry = sec.callers[caller] = [0, 0.0, 0.0]
+                entry[0] += 1
+                entry[1] += own
+                entry[2] += elapsed
+            if name == "_advance_time":
+                ticks = args[0] if args else kwargs["ticks"]
+                counters["ticks"] = counters.get("ticks", 0) + ticks
+            elif name == "_advance_segment":
+                # Ein Segment liefert die Zahl der tatsächlich simulierten Ticks.
+                counters["ticks"] = counters.get("ticks", 0) + result
+            elif type(result) is ActionResult:
+                key = f"{name}.{result.reason.name}"
+                counters[key] = counters.get(key, 0) + 1
+            return result
+
+        return timed
+
+    # -- Export --------------------------------------------------------------
+
+    def as_dict(self) -> dict:
+        """Aufgerufene Abschnitte (`calls`, `total_s`, `own_s`) und Zähler."""
+        return {
+            "sections": {name: sec.as_dict() for name, sec in self.sections.items()
+                         if sec.calls},
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def prometheus(self) -> str:
+        """Messwerte im Prometheus-Textformat (alles monoton wachsende Counter)."""
+        p = METRIC_PREFIX
+        lines = []
+        for metric, help_text, field in (
+                ("calls_total", "Aufrufe je Engine-Abschnitt", "calls"),
+                ("seconds_total", "Gesamtzeit je Engine-Abschnitt", "total"),
+                ("own_seconds_total", "Eigenzeit je Engine-Abschnitt", "own")):
+            lines += [f"# HELP {p}_{metric} {help_text}", f"# TYPE {p}_{metric} counter"]
+            for name, sec in self.sections.items():
+                if sec.calls:
+                    lines.append(f'{p}_{metric}{{section="{name}"}} {getattr(sec, field)!r}')
+        lines += [f"# HELP {p}_events_total Benannte Zähler (ticks, <methode>.<REASON>)",
+                  f"# TYPE {p}_events_total counter"]
+        for name, n in sorted(self.counters.items()):
+            lines.append(f'{p}_events_total{{name="{name}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """Schreibt `prometheus()` atomar (Textfile-Collector liest sonst halbe Dateien)."""
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(self.prometheus(), encoding="utf-8")
+        tmp.replace(path)
+
+    def create_stats(self):
+        """Füllt `stats` im Format von `cProfile.Profile.stats` — damit liest
+        `pstats.Stats(profiler)` den Profiler wie ein cProfile-Ergebnis."""
+        keys = {name: _code_key(name) for name in SECTIONS}
+        stats = {}
+        for name, sec in self.sections.items():
+            if not sec.calls:
+                continue
+            callers = {keys[c] if c else ("~", 0, "<session>"): (n, n, own, total)
+                       for c, (n, own, total) in sec.callers.items()}
+            stats[keys[name]] = (sec.calls, sec.calls, sec.own, sec.total, callers)
+        self.stats = stats
+
+    def dump_stats(self, path):
+        """Wie `cProfile.Profile.dump_stats`: marshal-Datei für pstats/snakeviz."""
+        self.create_stats()
+        with open(path, "wb") as f:
+            marshal.dump(self.stats, f)
+
+    def summary(self, sort: str = "cumulative") -> str:
+        """pstats-Tabelle (ncalls, tottime, cumtime, …) als Text."""
+        out = io.StringIO()
+        if any(sec.calls for sec in self.sections.values()):
+            pstats.Stats(self, stream=out).sort_stats(sort).print_stats()
+        return out.getvalue()
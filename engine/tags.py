@@ -0,0 +1,156 @@
+"""
+engine/tags.py
+Tag-Bitmasken und Slot-Zuordnung für execute_experiment.
+
+Tags werden auf Bit-Positionen interniert, Familien (TAG_FAMILIES) zu Masken
+vorkompiliert. Ein Item erfüllt einen Slot genau dann, wenn sich Item-Maske und
+Slot-Maske schneiden — dieselbe Aussage wie `_slot_satisfied`, ohne pro Prüfung
+Sets zu bauen. Die Slot-Zuordnung ist ein bipartites Matching (Slots × Items);
+gesucht wird das lexikographisch erste, also genau die Permutation, die
+`itertools.permutations` zuerst geliefert hätte.
+"""
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Tag → Bit. Wächst bei Bedarf (Tests/Prozesse können neue Tags setzen); die
+# Bits sind prozessweit stabil, Masken bleiben also über Engines hinweg gültig.
+_TAG_BITS: Dict[str, int] = {}
+
+
+def tag_bit(tag: str) -> int:
+    """Bit (als Maske) eines Tags; neue Tags bekommen die nächste Position."""
+    bit = _TAG_BITS.get(tag)
+    if bit is None:
+        bit = _TAG_BITS[tag] = 1 << len(_TAG_BITS)
+    return bit
+
+
+def tags_mask(tags: Iterable[str]) -> int:
+    """Maske einer Tag-Menge (Dict-Keys oder Set)."""
+    mask = 0
+    for tag in tags:
+        mask |= _TAG_BITS.get(tag) or tag_bit(tag)
+    return mask
+
+
+def slot_mask(slot_value: str, families: Dict[str, set]) -> int:
+    """Maske einer Slot-Anforderung: Familie → alle Mitglieder, sonst der Tag."""
+    return tags_mask(families.get(slot_value, (slot_value,)))
+
+
+class CompiledBlueprint(NamedTuple):
+    """Ein Blueprint in Masken-Form (Reihenfolge = Slot-Reihenfolge)."""
+    key: str                   # Dict-Schlüssel in GameEngine.blueprints
+    bp: object                 # das ToolBlueprint selbst
+    slot_keys: Tuple[str, ...]
+    slot_masks: Tuple[int, ...]
+    # Repräsentativer Tag je Slot, wie ihn ein MISSING_TAG-Feedback nennt:
+    # bei Familien das erste Mitglied der Set-Iteration — exakt der Ausdruck,
+    # den die frühere `_missing_tags`-Schleife pro Aufruf auswertete.
+    missing_tags: Tuple[str, ...]
+
+
+class BlueprintIndex:
+    """Vorkompilierte Blueprints: in Dict-Reihenfolge (`entries`) und nach
+    Slot-Anzahl gebucketet (`buckets`).
+
+    Die Slot-Masken dienen zugleich als Vorfilter: jede muss die vereinigte
+    Item-Maske schneiden, sonst lohnt kein Matching.
+    """
+
+    def __init__(self, blueprints: Dict[str, object], families: Dict[str, set]):
+        self.source = tuple(blueprints.items())
+        # Kopie der fürs Matching gelesenen Felder: auch an Ort und Stelle
+        # geänderte Blueprints (bp.slots[...] = …) invalidieren den Index.
+        self.shape = tuple((dict(bp.slots), bp.min_survival_req) for bp in blueprints.values())
+        self.entries: List[CompiledBlueprint] = []
+        self.buckets: Dict[int, List[CompiledBlueprint]] = {}
+        for bp_id, bp in blueprints.items():
+            keys = tuple(bp.slots.keys())
+            entry = CompiledBlueprint(
+                key=bp_id, bp=bp, slot_keys=keys,
+                slot_masks=tuple(slot_mask(bp.slots[k], families) for k in keys),
+                missing_tags=tuple(next(iter(set(families.get(bp.slots[k], {bp.slots[k]}))))
+                                   for k in keys),
+            )
+            self.entries.append(entry)
+            self.buckets.setdefault(len(keys), []).append(entry)
+        self.min_slots = min(self.buckets) if self.buckets else 0
+
+    def matches_source(self, blueprints: Dict[str, object]) -> bool:
+        """Ob der Index noch zu `blueprints` passt (gleiche Schlüssel und
+        Objekte in gleicher Reihenfolge, unveränderte Slots und Survival-
+        Schwellen) — ausgetauschte, entfernte oder editierte Einträge
+        invalidieren."""
+        src = self.source
+        if len(src) != len(blueprints):
+            return False
+        for (key, bp), (k, b), (slots, req) in zip(src, blueprints.items(), self.shape):
+            if bp is not b or key != k or b.slots != slots or b.min_survival_req != req:
+                return False
+        return True
+
+
+def overlap_and_missing(entry: CompiledBlueprint, available: int) -> Tuple[int, Optional[str]]:
+    """Wie viele Slots die Tag-Maske `available` abdeckt, und der erste
+    fehlende Slot als repräsentativer Tag (None bei Voll-Treffer)."""
+    overlap = 0
+    first_missing = None
+    for mask, tag in zip(entry.slot_masks, entry.missing_tags):
+        if mask & available:
+            overlap += 1
+        elif first_missing is None:
+            first_missing = tag
+    return overlap, first_missing
+
+
+def _augment(slot: int, slot_masks: Sequence[int], item_masks: Sequence[int],
+             free: int, owner: Dict[int, int], seen: List[int]) -> bool:
+    """Kuhn-Augmentierung: findet für `slot` ein Item aus `free` (Bitmenge)."""
+    sm = slot_masks[slot]
+    for j, im in enumerate(item_masks):
+        bit = 1 << j
+        if not (free & bit) or not (im & sm) or (seen[0] & bit):
+            continue
+        seen[0] |= bit
+        if j not in owner or _augment(owner[j], slot_masks, item_masks, free, owner, seen):
+            owner[j] = slot
+            return True
+    return False
+
+
+def _perfect(slots: Sequence[int], slot_masks: Sequence[int],
+             item_masks: Sequence[int], free: int) -> bool:
+    """Ob sich die Slots `slots` vollständig mit Items aus `free` belegen lassen."""
+    owner: Dict[int, int] = {}
+    for slot in slots:
+        if not _augment(slot, slot_masks, item_masks, free, owner, [0]):
+            return False
+    return True
+
+
+def first_assignment(slot_masks: Sequence[int],
+                     item_masks: Sequence[int]) -> Optional[Tuple[int, ...]]:
+    """Lexikographisch erste Zuordnung Slot i → Item-Index, oder None.
+
+    Entspricht der ersten passenden Permutation von `itertools.permutations`
+    über die Items: Slot für Slot wird das kleinste Item gewählt, mit dem die
+    restlichen Slots noch perfekt belegbar sind (Matching-Probe statt n!).
+    """
+    n = len(slot_masks)
+    if n != len(item_masks):
+        return None
+    free = (1 << n) - 1
+    if not _perfect(range(n), slot_masks, item_masks, free):
+        return None
+    chosen = []
+    for i in range(n):
+        sm = slot_masks[i]
+        rest = range(i + 1, n)
+        for j in range(n):
+            bit = 1 << j
+            if (free & bit) and (item_masks[j] & sm) and _perfect(
+                    rest, slot_masks, item_masks, free & ~bit):
+                chosen.append(j)
+                free &= ~bit
+                break
+    return tuple(chosen)
@@ -16,7 +16,7 @@ def main():
         print(f"Umgebung: {amb_temp:.1f}°C | Körper: {p.body_temp:.1f}°C")
         print(f"HP: {int(p.hp)}/100 | ENERGIE: {int(p.energy)}/1000 | Survival: {p.stats['survival']:.1f}")
         print("-" * 50)
-        print("[g]ather, [e]xperiment, [p]rocess, [f]eed, [k]nowledge, [i]nventory, [t]ravel, [w]ärmen, [q]uit")
+        print("[g]ather, [e]xperiment, [p]rocess, [f]eed, [k]nowledge, [i]nventory, [t]ravel, [w]ärmen, [r]asten, [q]uit")
 
         if p.hp <= 0:
             print("\n!!! DU BIST VERHUNGERT. GAME OVER !!!")
@@ -70,6 +70,13 @@ def main():
             print(f"\n{res['message']}")
             input("\nWeiter...")
 
+        elif cmd == 'r':
+            try:
+                n = int(input("Wie viele Ticks rasten? > "))
+                for line in game.wait(max(0, n)): print(f"  {line}")
+            except ValueError: print("Ungültig.")
+            input("\nWeiter...")
+
         elif cmd == 'p':
             print("\n--- VERFÜGBARE PROZESSE ---")
             procs = game.available_processes()
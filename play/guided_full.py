@@ -15,6 +15,8 @@ from data.items import TEMPLATE_DB
 from data.blueprints import get_all_blueprints
 _T = TEMPLATE_DB
 
+# Headless-Sammeln (GameEngine.step): der Bot liest das Inventar, nicht die Meldungen.
+GATHER = (("gather",),)
 WARM = "forest_edge"       # base_temp 15 — warmster erreichbarer Ort; Höhle ist kälter
 def FAM(slot):
     f = TAG_FAMILIES.get(slot); return set(f) if f else {slot}
@@ -41,11 +43,11 @@ def eat(game):
             if best is None or it.tags["EDIBLE"] > best[1]:
                 best = (i, it.tags["EDIBLE"])
         if best:
-            game.eat(best[0]); return
+            game.step((("eat", best[0]),)); return
         # Notration: nur noch rohes Fleisch übrig
         for i, it in enumerate(game.player.inventory.items):
             if it.template_id == "raw_meat" and "EDIBLE" in it.tags:
-                game.eat(i); return
+                game.step((("eat", i),)); return
 
 def _treat_if_injured(game):
     """SPEC-009: Verletzungen behandeln, damit der Mess-Bot nicht verblutet (sonst
@@ -74,7 +76,7 @@ def _treat_if_injured(game):
 
 def _go(game, loc):
     if game.current_location_id != loc:
-        game.travel(loc)
+        game.step((("travel", loc),))
 
 def _fire_at(game):
     """Sichert am aktuellen Ort ein aktives Feuer (nachlegen/entzünden)."""
@@ -114,7 +116,7 @@ def gather_tag(game, tags, n=25, min_mode=True):
             _go(game, loc.id)
             for _ in range(n):
                 _warm_here(game)
-                game.gather()
+                game.step(GATHER)
                 got = item_with(game, tags)
                 if got and got not in game.player.inventory.items:
                     return got
@@ -127,7 +129,7 @@ def gather_at(game, loc, n):
     _go(game, loc)
     for _ in range(n):
         _warm_here(game)
-        game.gather()
+        game.step(GATHER)
 
 def _warmup(game):
     """Wärme-Infrastruktur sicherstellen: Messer → Zunder → Feuer → Fell-Umhang."""
@@ -159,7 +161,7 @@ def _warmup(game):
         if pb is None:
             _go(game, "mountain_peak")
             for _ in range(6):
-                game.gather()
+                game.step(GATHER)
                 pb = item_with(game, {"PROJECTILE"})
                 if pb: break
             _go(game, WARM)
@@ -167,7 +169,7 @@ def _warmup(game):
             # rohes Fleisch jagen (PROJECTILE am Waldrand)
             _go(game, WARM)
             for _ in range(8):
-                game.gather()
+                game.step(GATHER)
                 if have_qty(game, "raw_meat", 1): break
             # Fell-Umhang zuerst (braucht 1 rohes Fleisch)
             game.execute_process("make_fur_cloak")
@@ -178,7 +180,7 @@ def _warmup(game):
         _go(game, WARM)
         _fire_at(game)
         for _ in range(8):
-            game.gather()
+            game.step(GATHER)
             if have_qty(game, "raw_meat", 1):
                 game.execute_process("cook_meat")
                 break
@@ -187,7 +189,7 @@ def _warmup(game):
 class G:
     def __init__(s, seed):
         random.seed(seed); s.rng = random.Random(seed)
-        s.game = GameEngine(); s.game._rng = s.rng
+        s.game = GameEngine.from_prototype(); s.game._rng = s.rng
         s.known = set(); s.timeline = []; s.actions = 0; s.last_new = 0
     def nov(s):
         g = s.game
@@ -241,7 +243,7 @@ def guided_full(seed, max_actions=400):
             hunted = False
             for _ in range(8):
                 _warm_here(game)
-                game.gather()
+                game.step(GATHER)
                 if have_qty(game, "raw_meat", 1):
                     hunted = True; break
             if hunted:
@@ -0,0 +1,138 @@
+"""Tests for engine/availability.py — inkrementelle Prozess-Verfügbarkeit."""
+import random
+
+import pytest
+
+from engine.core import GameEngine
+from data.items import create_item
+
+
+def _legacy_available(game):
+    """Frühere Voll-Prüfung aus available_processes (Referenz)."""
+    avail = []
+    for pid, proc in game.processes.items():
+        if any(game._count_template(i) < q for i, q in proc.inputs.items()):
+            continue
+        if any(not game.player.inventory.find_item_by_tag(t) for t in proc.tools):
+            continue
+        if proc.required_tag_in_env and not game._env_satisfied(proc.required_tag_in_env):
+            continue
+        avail.append(pid)
+    return avail
+
+
+MATERIALS = ["pebble", "reeds", "tinder", "stick", "raw_meat", "plant_fiber",
+             "mushroom", "clay_lump", "bandage", "poultice", "flint_shard"]
+
+
+class TestProcessAvailability:
+    def test_fire_burnout_during_wait(self):
+        game = GameEngine(seed=1)
+        game.player.inventory.add(create_item("raw_meat"))
+        assert "cook_meat" not in game.available_processes()
+        game._light_fire()
+        assert "cook_meat" in game.available_processes()
+        game.wait(30)                                  # Brennstoff (24 Ticks) verbraucht
+        assert not game._fire_lit()
+        assert "cook_meat" not in game.available_processes()
+
+    def test_travel_away_from_fire(self):
+        game = GameEngine(seed=1)
+        game.player.inventory.add(create_item("raw_meat"))
+        game._light_fire()
+        assert "cook_meat" in game.available_processes()
+        other = next(lid for lid in game.locations if lid != game.current_location_id)
+        game.current_location_id = other
+        assert "cook_meat" not in game.available_processes()
+
+    def test_only_touched_processes_rechecked(self, monkeypatch):
+        game = GameEngine(seed=1)
+        game.available_processes()
+        checked = []
+        original = type(game._avail)._check
+        monkeypatch.setattr(type(game._avail), "_check",
+                            lambda self, proc, inv: checked.append(proc.id) or original(self, proc, inv))
+        assert game.available_processes() == []
+        assert checked == []
+        game.player.inventory.add(create_item("pebble", 2))
+        assert game.available_processes() == ["make_sharp_stone"]
+        assert checked == ["make_sharp_stone"]
+
+    def test_tool_breaking_updates(self):
+        game = GameEngine(seed=1)
+        inv = game.player.inventory
+        inv.add(create_item("reeds", 2))
+        knife = create_item("flint_shard")
+        knife.set_tag("CUTTING", 1.0)
+        inv.add(knife)
+        assert "create_tinder" in game.available_processes()
+        knife.condition = 0
+        assert "create_tinder" not in game.available_processes()
+
+    def test_replaced_inventory_and_restore(self):
+        game = GameEngine(seed=1)
+        game.player.inventory.add(create_item("plant_fiber", 2))
+        snap = game.snapshot()
+        assert "make_bandage" in game.available_processes()
+        game.player.inventory.items.clear()
+        assert game.available_processes() == []
+        game.restore(snap)
+        assert game.available_processes() == ["make_bandage"]
+        assert game.fork().available_processes() == ["make_bandage"]
+
+    def test_swapped_process_definition(self):
+        import copy
+        game = GameEngine(seed=1)
+        game.player.inventory.add(create_item("plant_fiber", 2))
+        assert "make_bandage" in game.available_processes()
+        proc = copy.copy(game.processes["make_bandage"])
+        proc.inputs = {"plant_fiber": 3}
+        game.processes["make_bandage"] = proc
+        assert "make_bandage" not in game.available_processes()
+
+    def test_process_edited_in_place(self):
+        game = GameEngine(seed=1)
+        game.player.inventory.add(create_item("plant_fiber", 2))
+        assert "make_bandage" in game.available_processes()
+        proc = game.processes["make_bandage"]
+        proc.inputs["plant_fiber"] = 3                            # im Dict selbst
+        assert "make_bandage" not in game.available_processes()
+        assert game.available_processes() == _legacy_available(game)
+        proc.inputs["plant_fiber"] = 2
+        proc.tools.append("CUTTING")
+        assert "make_bandage" not in game.available_processes()
+        proc.tools.pop()
+        proc.required_tag_in_env = "HEAT_SOURCE"
+        assert "make_bandage" not in game.available_processes()
+        proc.required_tag_in_env = None
+        assert "make_bandage" in game.available_processes()
+
+    @pytest.mark.parametrize("seed", range(6))
+    def test_matches_full_check_in_random_session(self, seed):
+        rng = random.Random(seed)
+        game = GameEngine(seed=seed)
+        locs = list(game.locations)
+        for _ in range(250):
+            r = rng.random()
+            inv = game.player.inventory
+            if r < 0.3:
+                inv.add(create_item(rng.choice(MATERIALS), rng.randint(1, 2)))
+            elif r < 0.45:
+                game.execute_process(rng.choice(list(game.processes)))
+            elif r < 0.55:
+                game.wait(rng.randint(1, 12))
+            elif r < 0.6:
+                game.travel(rng.choice(locs))
+            elif r < 0.65:
+                game._light_fire()
+            elif r < 0.7:
+                game.stoke_fire()
+            elif r < 0.8 and inv.items:
+                inv.items.remove(rng.choice(list(inv.items)))
+            elif r < 0.85 and inv.items:
+                rng.choice(list(inv.items)).condition = rng.choice([0, 1.0])
+            else:
+                game.gather()
+            game.player.energy = game.player.max_energy
+            game.player.hp = game.player.max_hp
+            assert game.available_processes() == _legacy_available(game)
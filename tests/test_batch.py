@@ -0,0 +1,138 @@
+"""Tests for engine/batch.py — BatchEngine gegen GameEngine(seed=...)."""
+import random
+
+import pytest
+
+from engine.batch import BatchEngine
+from engine.climate import climate_table
+from engine.core import GameEngine
+
+
+def _eat_best(game):
+    eds = [it for it in game.player.inventory.items if "EDIBLE" in it.tags]
+    if not eds:
+        return
+    eds.sort(key=lambda it: it.tags["EDIBLE"], reverse=True)
+    game.eat(game.player.inventory.items.index(eds[0]))
+
+
+def _engine_state(game):
+    p = game.player
+    for loc in game.locations.values():
+        game._settle_nodes(loc)
+    return (p.energy, p.hp, p.body_temp, game.tick_counter, game.current_weather,
+            game.current_location_id,
+            [(it.template_id, it.quantity, it.condition) for it in p.inventory.items],
+            sorted(p.injuries),
+            [n.stock for loc in game.locations.values() for n in loc.nodes])
+
+
+def _batch_state(batch, i):
+    k = batch._k
+    injuries = [kind for kind, flag in (("cut", batch.cut[i]), ("strain", batch.strain[i])) if flag]
+    return (batch.energy[i], batch.hp[i], batch.body_temp[i], batch.tick[i],
+            batch._weather_keys[batch.weather[i]], batch._loc_ids[batch.location[i]],
+            [(batch._templates[s[0]], s[1], s[2]) for s in batch.stacks[i]],
+            sorted(injuries), list(batch.stock[i * k:(i + 1) * k]))
+
+
+SEEDS = list(range(16))
+STEPS = 250
+
+
+@pytest.fixture(scope="module")
+def runs():
+    """Gemischte Policy (Sammeln, Reisen, Warten, Essen) auf Engines und Batch;
+    pro Schritt die Zustände beider Seiten."""
+    plan_rng = random.Random(3)
+    plan = [[plan_rng.random() for _ in range(STEPS)] for _ in SEEDS]
+    engines = [GameEngine.from_prototype(seed=s) for s in SEEDS]
+    locs = list(engines[0].locations)
+    batch = BatchEngine(SEEDS)
+    per_tick = []
+    for step in range(STEPS):
+        rolls = [p[step] for p in plan]
+        dests = [locs[int(r * 100) % len(locs)] for r in rolls]
+        for game, r, dest in zip(engines, rolls, dests):
+            if game.player.energy < 300:
+                _eat_best(game)
+            if r < 0.15:
+                game.travel(dest)
+            elif r < 0.2:
+                game._advance_time(2, effort_multiplier=1.0)
+            else:
+                game.gather()
+        batch.eat_best([e < 300 for e in batch.energy])
+        batch.travel(dests, mask=[r < 0.15 for r in rolls])
+        batch.advance(2, 1.0, mask=[0.15 <= r < 0.2 for r in rolls])
+        batch.gather(mask=[r >= 0.2 for r in rolls])
+        per_tick.append(([_engine_state(g) for g in engines],
+                         [_batch_state(batch, i) for i in range(batch.n)],
+                         batch.aggregates()))
+    return per_tick
+
+
+class TestConformance:
+    """Welt i ≡ GameEngine(seed=i): gleiche Würfe, gleiche Float-Operationen."""
+
+    def test_worlds_match_engines_every_step(self, runs):
+        for engine_states, batch_states, _ in runs:
+            assert batch_states == engine_states
+
+    def test_per_tick_aggregates_match(self, runs):
+        n = len(SEEDS)
+        for engine_states, _, agg in runs:
+            assert agg["energy"] == pytest.approx(sum(s[0] for s in engine_states) / n)
+            assert agg["hp"] == pytest.approx(sum(s[1] for s in engine_states) / n)
+            assert agg["body_temp"] == pytest.approx(sum(s[2] for s in engine_states) / n)
+            assert agg["alive"] == sum(1 for s in engine_states if s[1] > 0)
+
+    def test_run_exercises_injuries_and_travel(self, runs):
+        final = runs[-1][0]
+        assert any(state[7] for state in final)
+        assert len({state[5] for state in final}) > 1
+
+
+class TestBatchEngine:
+    def test_fire_warms_like_engine(self):
+        game = GameEngine.from_prototype(seed=1)
+        game.travel("mountain_peak")
+        game._light_fire()
+        fuel = game.current_location.fire_fuel
+        batch = BatchEngine([1])
+        batch.travel("mountain_peak")
+        batch.light_fire(fuel)
+        for _ in range(30):
+            game._advance_time(1)
+            batch.advance(1)
+        assert batch.body_temp[0] == game.player.body_temp
+        assert batch.fire_active[batch._loc_index["mountain_peak"]] == \
+            game.current_location.fire_active
+
+    def test_mask_leaves_other_worlds_untouched(self):
+        batch = BatchEngine([1, 2, 3])
+        batch.gather(mask=[True, False, True])
+        assert list(batch.tick) == [37, 36, 37]
+        assert batch.stacks[1] == []
+
+    def test_unknown_location_raises(self):
+        with pytest.raises(KeyError):
+            BatchEngine([1]).travel("atlantis")
+
+    def test_more_than_127_locations(self):
+        template = GameEngine.from_prototype(seed=1)
+        for k in range(200):
+            loc = template.locations["mountain_peak"].clone()
+            loc.id = f"peak_{k}"
+            template.locations[loc.id] = loc
+        template.climate = climate_table(template.locations.values(), template.weather_types)
+        batch = BatchEngine([1], template)
+        batch.travel("peak_199")
+        assert batch._loc_ids[batch.location[0]] == "peak_199"
+        game = template.fork()
+        game.travel("peak_199")
+        for _ in range(5):
+            game.gather()
+            batch.gather()
+        assert batch.tick[0] == game.tick_counter
+        assert batch.body_temp[0] == game.player.body_temp
@@ -0,0 +1,120 @@
+"""Tests for benchmarks/bench_engine.py — Benchmark-Suite und Regressions-Gate."""
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import bench_engine as be  # noqa: E402
+
+
+def _result(calibration, **results):
+    return {"version": be.BASELINE_VERSION, "python": "3",
+            "calibration_us": {name: calibration for name in results}, "results": results}
+
+
+class TestCompare:
+    def test_threshold(self):
+        rows = be.compare(_result(100.0, a=130.0, b=120.0, c=50.0),
+                          _result(100.0, a=100.0, b=100.0), max_slowdown=25)
+        by_name = {r["name"]: r for r in rows}
+        assert by_name["a"]["change"] == 30.0 and by_name["a"]["regression"]
+        assert by_name["b"]["change"] == 20.0 and not by_name["b"]["regression"]
+        assert by_name["c"]["change"] is None and not by_name["c"]["regression"]
+
+    def test_calibration_scales_machines(self):
+        # Doppelt so langsamer Rechner: doppelte Zeiten sind keine Regression.
+        rows = be.compare(_result(200.0, a=200.0), _result(100.0, a=100.0), max_slowdown=5)
+        assert rows[0]["change"] == 0.0 and not rows[0]["regression"]
+
+
+class TestGate:
+    def test_outlier_cleared_by_retry(self, monkeypatch):
+        retried = []
+
+        def fake_run(names, repeat):
+            retried.append(names)
+            return _result(100.0, **{n: 105.0 for n in names})
+        monkeypatch.setattr(be, "run", fake_run)
+        rows = be.gate(_result(100.0, a=150.0, b=110.0), _result(100.0, a=100.0, b=100.0))
+        assert retried == [["a"]] and not any(r["regression"] for r in rows)
+        assert rows[0]["change"] == 5.0
+
+    def test_persistent_regression_fails(self, monkeypatch):
+        monkeypatch.setattr(be, "run", lambda names, repeat: _result(100.0, a=160.0))
+        rows = be.gate(_result(100.0, a=150.0), _result(100.0, a=100.0), retries=2)
+        assert rows[0]["regression"] and rows[0]["change"] == 50.0
+
+    def test_update_stores_median_run(self):
+        runs = [_result(100.0, a=a) for a in (90.0, 300.0, 100.0)]
+        assert be._median_run(runs)["results"] == {"a": 100.0}
+
+
+class TestSuite:
+    def test_every_bench_runs(self):
+        names = {b.name for b in be.BENCHES}
+        assert {"engine_init", "gather_full", "gather_depleted", "no_match_reason",
+                "advance_time_10k", "session_depth_seed"} <= names
+        assert {f"experiment_{n}slot_{k}" for n in (2, 3, 4, 5) for k in ("hit", "miss")} <= names
+        assert {b.name for b in be.MACRO_BENCHES} <= names
+        for bench in be.BENCHES:
+            assert be.measure(bench, repeat=1, number=1) > 0
+
+    def test_cases_repeat_the_same_work(self):
+        for bench in be.BENCHES:
+            if not bench.name.startswith(("experiment", "gather", "available", "inventory")):
+                continue
+            op, prepare = bench.setup()
+            first, again = op(*prepare()), op(*prepare())
+            assert first == again if isinstance(first, list) else dict(first) == dict(again)
+            if bench.name.startswith("experiment"):
+                assert first["success"] == bench.name.endswith("hit")
+
+    def test_gather_loop_repeats_the_same_work(self):
+        bench = next(b for b in be.MACRO_BENCHES if b.name == "macro_gather_loop")
+        op, prepare = bench.setup()
+        game = prepare()[0]
+        start = game.tick_counter
+        first = op(game)
+        assert first == start + be.GATHER_LOOP == op(*prepare())
+
+    def test_touched_availability_keeps_inventory_size(self):
+        bench = next(b for b in be.BENCHES if b.name == "available_processes_touched")
+        op, prepare = bench.setup()
+        items = op.__self__.player.inventory.items
+        sizes = []
+        for _ in range(5):
+            prepare()
+            sizes.append(len(items))
+            op()
+        assert len(set(sizes)) == 1
+
+    def test_stored_baseline_covers_suite(self):
+        baseline = be.load_baseline()
+        assert baseline is not None
+        assert set(baseline["results"]) == {b.name for b in be.BENCHES}
+
+
+class TestMain:
+    def test_update_then_gate(self, tmp_path, capsys):
+        path = tmp_path / "baseline.json"
+        assert be.main(["--only", "no_match", "--repeat", "1", "--baseline", str(path),
+                        "--update"]) == 0
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert list(data["results"]) == ["no_match_reason"]
+        data["results"]["no_match_reason"] /= 100          # Baseline „viel schneller“
+        path.write_text(json.dumps(data), encoding="utf-8")
+        assert be.main(["--only", "no_match", "--repeat", "1", "--retries", "0",
+                        "--baseline", str(path)]) == 1
+        assert "REGRESSION" in capsys.readouterr().out
+        assert be.main(["--only", "no_match", "--repeat", "1", "--baseline", str(path),
+                        "--max-slowdown", "1e9"]) == 0
+
+    def test_partial_update_keeps_other_results(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps(_result(1.0, engine_init=1.0, other=2.0)), encoding="utf-8")
+        be.main(["--only", "engine_init", "--repeat", "1", "--baseline", str(path), "--update"])
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["results"]["other"] == 2.0 and data["calibration_us"]["other"] == 1.0
+        assert data["results"]["engine_init"] > 1.0 and data["calibration_us"]["engine_init"] > 1.0
@@ -1,6 +1,6 @@
 """Tests for engine.components — Item, Inventory, Player, ToolBlueprint."""
 import pytest
-from engine.components import Item, Inventory, Player, ToolBlueprint
+from engine.components import Item, ItemProto, Inventory, Player, ToolBlueprint
 
 
 class TestItem:
@@ -42,6 +42,63 @@ class TestItem:
         assert item.condition == 1.0
 
 
+class TestItemProto:
+    """Flyweight: Items teilen Template-Tags/-Attribute bis zur ersten Änderung."""
+
+    PROTO = ItemProto("flint", {"HARD": True, "SHARP": True}, {"sharpness": 0.9})
+
+    def _item(self, **kw):
+        return Item(name="Feuerstein", base_weight=0.3, template_id="flint", proto=self.PROTO, **kw)
+
+    def test_equals_item_with_own_dicts(self):
+        own = Item(name="Feuerstein", base_weight=0.3, tags={"HARD": True, "SHARP": True},
+                   attributes={"sharpness": 0.9}, template_id="flint")
+        assert self._item() == own
+        assert repr(self._item()) == repr(own)
+
+    def test_set_tag_copies_on_write(self):
+        a, b = self._item(), self._item()
+        a.set_tag("WOOD")
+        a.remove_tag("HARD")
+        assert dict(a.tags) == {"SHARP": True, "WOOD": True}
+        assert dict(b.tags) == {"HARD": True, "SHARP": True}
+        assert dict(self.PROTO.tags) == {"HARD": True, "SHARP": True}
+
+    def test_set_tag_updates_inventory_index(self):
+        inv = Inventory()
+        item = self._item()
+        inv.add(item)
+        item.set_tag("WOOD")
+        assert inv.find_item_by_tag("WOOD") is item
+
+    def test_template_view_writes_copy_on_first_write(self):
+        inv = Inventory()
+        a, b = self._item(), self._item()
+        inv.add(a)
+        tags = a.tags
+        tags["WOOD"] = True
+        del tags["HARD"]
+        a.attributes["sharpness"] = 0.1
+        assert dict(a.tags) == {"SHARP": True, "WOOD": True}
+        assert a.get_attr("sharpness") == 0.1
+        assert b.tags == {"HARD": True, "SHARP": True} and b.get_attr("sharpness") == 0.9
+        assert dict(self.PROTO.tags) == {"HARD": True, "SHARP": True}
+        assert inv.find_item_by_tag("WOOD") is a and inv.find_item_by_tag("HARD") is None
+
+    def test_copy_and_pickle_keep_proto_shared(self):
+        import copy
+        import pickle
+        item = self._item(quantity=3)
+        clone = copy.deepcopy(item)
+        assert clone == item and clone.tag_data() is item.tag_data()
+        restored = pickle.loads(pickle.dumps(item))
+        assert restored == item
+
+    def test_slotted(self):
+        with pytest.raises(AttributeError):
+            self._item().colour = "grau"
+
+
 class TestInventory:
     def test_empty(self):
         inv = Inventory()
@@ -103,6 +160,179 @@ class TestInventory:
         assert stocked_inventory.get_total_insulation() == 0.0
 
 
+class TestInventoryIndex:
+    """Indizes (Gewicht, Tag, Template, Stack-Schlüssel) ≡ linearer Durchlauf."""
+
+    TAGS = ["HARD", "RIGID", "FIBER", "CLOTHING", "WOOD"]
+
+    @staticmethod
+    def _check(inv):
+        items = list(inv.items)
+        for tag in TestInventoryIndex.TAGS:
+            expected = next((i for i in items if tag in i.tags and i.condition > 0), None)
+            assert inv.find_item_by_tag(tag) is expected
+            assert inv.items_with_tag(tag) == [i for i in items if tag in i.tags]
+        for tid in ("a", "b", "c"):
+            assert inv.count_template(tid) == sum(i.quantity for i in items
+                                                  if i.template_id == tid)
+            assert [id(i) for i in inv.stacks_of(tid)] == \
+                [id(i) for i in items if i.template_id == tid]
+        assert inv.current_weight == pytest.approx(sum(i.total_weight for i in items))
+        assert inv.get_total_insulation() == sum(
+            i.get_attr("insulation", 0.0) for i in items if "CLOTHING" in i.tags)
+
+    def _random_item(self, rng):
+        tid = rng.choice("abc")
+        return Item(name=f"Ding-{tid}", base_weight=rng.choice([0.1, 0.3, 0.5, 1.7]),
+                    tags={t: True for t in rng.sample(self.TAGS, rng.randint(0, 2))},
+                    quantity=rng.randint(1, 3), condition=rng.choice([1.0, 1.0, 0.5, 0.0]),
+                    attributes={"insulation": 0.2}, template_id=tid)
+
+    @pytest.mark.parametrize("seed", range(30))
+    def test_random_operations(self, seed):
+        import random
+        rng = random.Random(seed)
+        inv = Inventory(capacity_kg=rng.choice([5.0, 20.0]))
+        for _ in range(200):
+            op = rng.random()
+            items = inv.items
+            if op < 0.35:
+                inv.add(self._random_item(rng))
+            elif op < 0.45:
+                items.append(self._random_item(rng))
+            elif op < 0.55 and items:
+                items.remove(rng.choice(list(items)))
+            elif op < 0.65 and items:
+                rng.choice(list(items)).quantity += rng.choice([-1, 1, 2])
+            elif op < 0.72 and items:
+                rng.choice(list(items)).condition = rng.choice([1.0, 0.5, 0.0])
+            elif op < 0.78 and items:
+                rng.choice(list(items)).tags = {rng.choice(self.TAGS): True}
+            elif op < 0.82 and items:
+                items.pop(rng.randrange(len(items)))
+            elif op < 0.86:
+                items.insert(rng.randint(0, len(items)), self._random_item(rng))
+            elif op < 0.88:
+                items.clear()
+            elif op < 0.92 and items:
+                items[rng.randrange(len(items))] = self._random_item(rng)
+            else:
+                items.reverse()
+            self._check(inv)
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_watch_reports_every_changed_lookup(self, seed):
+        """take_changes() deckt jede geänderte Menge / jedes geänderte
+        find_item_by_tag ab (oder meldet None = alles)."""
+        import random
+        rng = random.Random(seed)
+        inv = Inventory()
+        inv.watch()
+        assert inv.take_changes() is None
+
+        def view():
+            return ({t: inv.count_template(t) for t in "abc"},
+                    {t: inv.find_item_by_tag(t) for t in self.TAGS})
+        before = view()
+        for _ in range(150):
+            op = rng.random()
+            items = inv.items
+            if op < 0.4:
+                inv.add(self._random_item(rng))
+            elif op < 0.5 and items:
+                items.remove(rng.choice(list(items)))
+            elif op < 0.65 and items:
+                rng.choice(list(items)).quantity += rng.choice([-1, 1])
+            elif op < 0.75 and items:
+                rng.choice(list(items)).condition = rng.choice([1.0, 0.0])
+            elif op < 0.85 and items:
+                rng.choice(list(items)).tags = {rng.choice(self.TAGS): True}
+            elif op < 0.9 and items:
+                item = rng.choice(list(items))
+                item.tags.clear()
+                inv.reindex(item)
+            elif op < 0.95:
+                items.insert(0, self._random_item(rng))
+            else:
+                items.clear()
+            after = view()
+            changes = inv.take_changes()
+            if changes is not None:
+                templates, tags = changes
+                assert {t for t in "abc" if before[0][t] != after[0][t]} <= templates
+                assert {t for t in self.TAGS if before[1][t] is not after[1][t]} <= tags
+            before = after
+
+    def test_add_merges_into_first_matching_stack(self):
+        inv = Inventory()
+        first = Item(name="Stein", base_weight=1.0)
+        other = Item(name="Stein", base_weight=1.0, condition=0.5)
+        second = Item(name="Stein", base_weight=1.0)
+        inv.items.extend([first, other, second])
+        inv.add(Item(name="Stein", base_weight=1.0, quantity=2))
+        assert first.quantity == 3 and second.quantity == 1
+
+    def test_capacity_boundary_matches_float_sum(self):
+        """Grenzfälle entscheidet dieselbe Float-Summe wie früher."""
+        inv = Inventory(capacity_kg=1.0)
+        for _ in range(7):
+            inv.items.append(Item(name="Halm", base_weight=0.1, quantity=1))
+        probe = Item(name="Span", base_weight=0.3)
+        expected = sum(i.total_weight for i in inv.items) + probe.total_weight > 1.0
+        assert inv.add(probe) is not expected
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_capacity_after_churn_matches_float_sum(self, seed):
+        """Auch nach vielen Mengen-Änderungen (Drift der laufenden Summe)
+        entscheidet die Grenze wie die frisch gebildete Float-Summe."""
+        import random
+        rng = random.Random(seed)
+        inv = Inventory(capacity_kg=3.0)
+        for _ in range(6):
+            inv.items.append(Item(name="Halm", base_weight=rng.choice([0.1, 0.3, 0.7]),
+                                  quantity=rng.randint(1, 3)))
+        for _ in range(2000):
+            item = rng.choice(list(inv.items))
+            item.quantity = max(1, item.quantity + rng.choice([-1, 1]))
+            probe = Item(name="Span", base_weight=rng.choice([0.1, 0.2, 0.3]),
+                         quantity=rng.randint(1, 4))
+            expected = sum(i.total_weight for i in inv.items) + probe.total_weight > 3.0
+            assert inv._exceeds_capacity(probe) is expected
+
+    def test_current_weight_from_running_total(self, monkeypatch):
+        from engine.components import WEIGHT_REL_ERR
+        inv = Inventory(capacity_kg=1e6)
+        for k in range(200):
+            inv.add(Item(name=f"Halm{k % 7}", base_weight=0.1 * (k % 5 + 1), quantity=k % 3 + 1))
+        resums = []
+        resum = Inventory._resum
+        monkeypatch.setattr(Inventory, "_resum", lambda self: resums.append(1) or resum(self))
+        exact = sum(i.total_weight for i in inv.items)
+        assert abs(inv.current_weight - exact) <= WEIGHT_REL_ERR * (exact + 1.0)
+        assert resums == []
+        inv._weight_err = 1.0                            # Schranke überschritten
+        assert inv.current_weight == exact and resums == [1]
+        inv.items.clear()
+        assert inv.current_weight == 0.0
+
+    def test_in_place_tag_change_needs_reindex(self):
+        inv = Inventory()
+        item = Item(name="Ast", base_weight=0.5, tags={"RIGID": True})
+        inv.add(item)
+        item.tags["WOOD"] = True
+        inv.reindex(item)
+        assert inv.find_item_by_tag("WOOD") is item
+
+    def test_copy_rebuilds_index(self):
+        import copy
+        inv = Inventory()
+        inv.add(Item(name="Ast", base_weight=0.5, tags={"RIGID": True}, template_id="a"))
+        clone = copy.deepcopy(inv)
+        clone.items[0].quantity = 5
+        assert clone.count_template("a") == 5
+        assert inv.count_template("a") == 1
+
+
 class TestToolBlueprint:
     def test_create(self):
         bp = ToolBlueprint(id="axe", result_name="Axt", slots={"head": "HARD", "handle": "RIGID"}, base_efficiency=1.0)
@@ -1,7 +1,8 @@
-"""Tests for data/items.py — template creation."""
+"""Tests for data/items.py (template creation) and data/locations.py (NodeStore)."""
 import pytest
 from data.items import create_item, TEMPLATE_DB
 from engine.components import Item
+from data.locations import NodeStore, ResourceNode, clone_locations, get_all_locations
 
 
 class TestCreateItem:
@@ -76,8 +77,84 @@ class TestCreateItem:
         item1.tags["NEW_TAG"] = True
         assert "NEW_TAG" not in item2.tags
 
+    def test_items_share_template_until_written(self):
+        item1 = create_item("flint_shard")
+        item2 = create_item("flint_shard")
+        assert item1.tag_data() is item2.tag_data()
+        item1.set_attr("sharpness", 0.1)
+        assert item1.get_attr("sharpness") == 0.1
+        assert item2.get_attr("sharpness") == 0.9
+        assert item1.tag_data() is item2.tag_data()
+
     def test_all_templates_creatable(self):
         for template_id in TEMPLATE_DB:
             item = create_item(template_id)
             assert isinstance(item, Item)
-            assert item.name != "Unknown"
\ No newline at end of file
+            assert item.name != "Unknown"
+
+
+class TestNodeStore:
+    """Node-Zustand spaltenweise im NodeStore, ResourceNode als Sicht."""
+
+    def test_world_shares_one_store(self):
+        locs = get_all_locations()
+        stores = {id(n._store) for loc in locs for n in loc.nodes}
+        assert len(stores) == 1
+        store = locs[0].nodes[0]._store
+        assert len(store) == sum(len(loc.nodes) for loc in locs)
+
+    def test_view_reads_and_writes_columns(self):
+        node = ResourceNode("stick", 1, 3, chance=0.8, max_stock=5.0, stock=1.0, depleted=True)
+        assert node.stock == 5.0 and node.depleted is False  # startet voll
+        node.stock = 0.5
+        node.depleted = True
+        node.chance = 1.0
+        assert node._store.stock[node._id] == 0.5
+        assert node.depleted is True and node.chance == 1.0
+
+    def test_equality_and_repr_like_dataclass(self):
+        a = ResourceNode("stick", 1, 3, chance=0.8)
+        b = ResourceNode("stick", 1, 3, chance=0.8)
+        assert a == b
+        b.stock = 1.0
+        assert a != b
+        assert repr(a).startswith("ResourceNode(result_template_id='stick', min_qty=1")
+
+    def test_clone_copies_state_once_per_world(self):
+        locs = {loc.id: loc for loc in get_all_locations()}
+        node = locs["forest_edge"].nodes[0]
+        node.stock = 2.0
+        clones = clone_locations(locs)
+        stores = {id(n._store) for loc in clones.values() for n in loc.nodes}
+        assert len(stores) == 1 and node._store is not clones["forest_edge"].nodes[0]._store
+        clones["forest_edge"].nodes[0].stock = 7.0
+        assert node.stock == 2.0
+        assert clones["forest_edge"].nodes[0].stock == 7.0
+
+    def test_node_view_cached_per_location(self):
+        loc = get_all_locations()[0]
+        store, ids = loc.node_view()
+        assert store is loc.nodes[0]._store
+        assert ids == tuple(n._id for n in loc.nodes)
+        assert loc.node_view()[1] is ids
+        loc.nodes = loc.nodes + [ResourceNode("stick", 1, 1, 1.0)]
+        assert loc.node_view()[0] is None               # fremder Store
+
+    def test_settle_matches_per_step_replay(self):
+        store = NodeStore()
+        ids = [store.add("stick", 1, 1, 1.0, 0.0, None, 3.0, r, 1.0) for r in (0.07, 0.3, -0.1)]
+        for j in ids:
+            store.stock[j] = 0.2
+            store.depleted[j] = 1
+        pending = [1, 3, 2, 5, 1]
+        expected = []
+        for j in ids:
+            s, dep = 0.2, True
+            for t in pending:
+                s = min(3.0, s + store.regen_per_tick[j] * t)
+                if dep and s >= 1.0:
+                    dep = False
+            expected.append((s, dep))
+        store.settle(ids, pending)
+        assert [(store.stock[j], bool(store.depleted[j])) for j in ids] == expected
+
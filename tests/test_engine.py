@@ -1131,4 +1131,912 @@ class TestSpec8SurvivalGate:
         """SPEC-008 fügt nur Blueprint-Items hinzu (wie die 8 Bestands-Werkzeuge,
         NICHT in items.json) → content_reachable bleibt 1.0."""
         from tools import scorecard as sc
-        assert sc.metric_content_reachable()["value"] == 1.0
\ No newline at end of file
+        assert sc.metric_content_reachable()["value"] == 1.0
+
+
+class TestFromPrototype:
+    """GameEngine.from_prototype(): Klon einer Prototyp-Welt statt Neuaufbau."""
+
+    def test_equivalent_to_fresh_engine(self):
+        import random
+        random.seed(7)
+        fresh = GameEngine()
+        random.seed(7)
+        clone = GameEngine.from_prototype()
+        assert clone.current_location_id == fresh.current_location_id
+        assert clone.tick_counter == fresh.tick_counter == 36
+        assert clone.current_weather == fresh.current_weather
+        assert clone.injuries_rng.getstate() == fresh.injuries_rng.getstate()
+        assert clone.blueprints.keys() == fresh.blueprints.keys()
+        assert clone.processes.keys() == fresh.processes.keys()
+        for lid, loc in fresh.locations.items():
+            assert clone.locations[lid] == loc
+        assert clone.player.stats == fresh.player.stats
+        assert [i.template_id for i in clone.player.inventory.items] == \
+            [i.template_id for i in fresh.player.inventory.items]
+
+    def test_shares_immutable_definitions(self):
+        a = GameEngine.from_prototype()
+        b = GameEngine.from_prototype()
+        assert a.blueprints["axe"] is b.blueprints["axe"]
+        assert a.processes["start_fire"] is b.processes["start_fire"]
+        # eigene Dicts: Austausch in einer Engine bleibt lokal
+        a.blueprints = {}
+        a.processes.pop("start_fire")
+        assert "axe" in b.blueprints and "start_fire" in b.processes
+
+    def test_mutable_state_not_shared(self):
+        a = GameEngine.from_prototype()
+        node = a.current_location.nodes[0]
+        node.stock = 0.0
+        node.depleted = True
+        node.chance = 1.0
+        a.current_location.fire_active = True
+        a.current_location.fire_fuel = 5.0
+        a.player.inventory.add(create_item("stick"))
+        a.player.known_blueprints.add("axe")
+        a.tick_counter = 99
+        a.current_weather = "STORM"
+
+        b = GameEngine.from_prototype()
+        fresh = b.current_location.nodes[0]
+        assert fresh.stock == fresh.max_stock and fresh.depleted is False
+        assert fresh.chance != 1.0
+        assert b.current_location.fire_active is False
+        assert b.current_location.fire_fuel == 0.0
+        assert not b.player.inventory.items and not b.player.known_blueprints
+        assert b.tick_counter == 36 and b.current_weather == "CLEAR"
+
+
+class TestSeededRng:
+    """GameEngine(seed=...): eigene, benannte RNG-Ströme statt globalem `random`."""
+
+    @staticmethod
+    def _session(engine, actions=120):
+        """Deterministische Aktionsfolge; liefert Logs + Endzustand."""
+        locs = list(engine.locations)
+        out = []
+        for i in range(actions):
+            if i % 7 == 6:
+                out.append(engine.travel(locs[i % len(locs)]))
+            else:
+                out.append(engine.gather())
+            out.append((engine.current_weather, engine.tick_counter))
+        inv = [(it.template_id, it.quantity) for it in engine.player.inventory.items]
+        return out, inv, sorted(engine.player.injuries)
+
+    def test_same_seed_same_session(self):
+        import random
+        a = self._session(GameEngine(seed=11))
+        random.seed(999)  # globaler Strom spielt keine Rolle
+        b = self._session(GameEngine.from_prototype(seed=11))
+        assert a == b
+
+    def test_different_seeds_differ(self):
+        assert self._session(GameEngine(seed=1)) != self._session(GameEngine(seed=2))
+
+    def test_interleaved_engines_do_not_interfere(self):
+        solo = self._session(GameEngine(seed=5), actions=60)
+        a, b = GameEngine(seed=5), GameEngine(seed=6)
+        locs = list(a.locations)
+        logs = []
+        for i in range(60):
+            b.gather()
+            if i % 7 == 6:
+                logs.append(a.travel(locs[i % len(locs)]))
+            else:
+                logs.append(a.gather())
+            logs.append((a.current_weather, a.tick_counter))
+        inv = [(it.template_id, it.quantity) for it in a.player.inventory.items]
+        assert (logs, inv, sorted(a.player.injuries)) == solo
+
+    def test_streams_are_independent(self):
+        """Mehr Gather-Würfe verschieben das Wetter nicht."""
+        a, b = GameEngine(seed=3), GameEngine(seed=3)
+        for _ in range(10):
+            a.gather()
+        weather_a = [a.weather_rng.random() for _ in range(5)]
+        weather_b = [b.weather_rng.random() for _ in range(5)]
+        assert weather_a == weather_b
+
+    def test_threads_match_sequential(self):
+        from concurrent.futures import ThreadPoolExecutor
+        seeds = list(range(20, 28))
+        sequential = [self._session(GameEngine.from_prototype(seed=s)) for s in seeds]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            threaded = list(pool.map(
+                lambda s: self._session(GameEngine.from_prototype(seed=s)), seeds))
+        assert threaded == sequential
+
+    def test_compat_mode_uses_global_stream(self):
+        """Ohne Seed: dieselbe Sequenz wie bisher über `random.seed(...)`."""
+        import random
+        random.seed(42)
+        engine = GameEngine()
+        assert engine.seed is None and engine.gather_rng is random
+        random.seed(42)
+        expected = random.Random()
+        expected.setstate(random.getstate())
+        assert engine.injuries_rng.getstate() == expected.getstate()
+        random.seed(42)
+        first = self._session(GameEngine())
+        random.seed(42)
+        assert self._session(GameEngine.from_prototype()) == first
+
+
+class TestSnapshotFork:
+    """snapshot()/restore()/fork(): Verzweigen ohne Neu-Abspielen ab Tick 0."""
+
+    @staticmethod
+    def _state(engine):
+        p = engine.player
+        for loc in engine.locations.values():
+            engine._settle_nodes(loc)
+        return (p.hp, p.energy, p.body_temp, dict(p.stats), engine.tick_counter,
+                engine.current_weather, engine.current_location_id,
+                [(it.name, it.quantity, it.condition, dict(it.tags)) for it in p.inventory.items],
+                sorted(p.known_blueprints), sorted(p.known_processes), sorted(p.near_misses),
+                repr(sorted(p.injuries.items())),
+                [(l.fire_active, l.fire_fuel, [(n.stock, n.depleted) for n in l.nodes])
+                 for l in engine.locations.values()],
+                engine._events.due_of(("WEATHER",)))
+
+    @staticmethod
+    def _play(engine, steps, seed):
+        import random
+        rng = random.Random(seed)
+        locs = list(engine.locations)
+        out = []
+        for _ in range(steps):
+            r = rng.random()
+            if r < 0.5:
+                out.append(engine.gather())
+            elif r < 0.6:
+                out.append(engine.travel(locs[rng.randrange(len(locs))]))
+            elif r < 0.8:
+                items = list(engine.player.inventory.items)
+                out.append(engine.execute_experiment(items[:rng.randint(0, min(3, len(items)))]))
+            elif r < 0.9:
+                out.append(engine.stoke_fire())
+            else:
+                out.append(engine.wait(rng.randint(1, 30)))
+        return out
+
+    def test_restore_replays_identically(self):
+        engine = GameEngine(seed=4)
+        self._play(engine, 80, seed=1)
+        snap = engine.snapshot()
+        before = self._state(engine)
+        first = (self._play(engine, 120, seed=2), self._state(engine))
+        engine.restore(snap)
+        assert self._state(engine) == before
+        assert (self._play(engine, 120, seed=2), self._state(engine)) == first
+
+    def test_fork_continues_like_original_and_is_independent(self):
+        engine = GameEngine(seed=9)
+        self._play(engine, 60, seed=3)
+        before = self._state(engine)
+        fork = engine.fork()
+        assert self._state(fork) == before
+        branch = (self._play(fork, 150, seed=5), self._state(fork))
+        assert self._state(engine) == before
+        assert (self._play(engine, 150, seed=5), self._state(engine)) == branch
+
+    def test_snapshot_unaffected_by_later_changes(self):
+        engine = GameEngine(seed=1)
+        engine.player.inventory.add(create_item("stick", 3))
+        engine.player.injuries["cut"] = {"severity": 1.0, "ticks": 0, "treated": False}
+        snap = engine.snapshot()
+        engine.player.inventory.items[0].quantity = 1
+        engine.player.injuries["cut"]["treated"] = True
+        engine.player.known_blueprints.add("axe")
+        engine.restore(snap)
+        assert engine.player.inventory.items[0].quantity == 3
+        assert engine.player.inventory.count_template("stick") == 3
+        assert engine.player.injuries["cut"]["treated"] is False
+        assert not engine.player.known_blueprints
+
+    def test_compat_mode_restores_global_stream(self):
+        import random
+        random.seed(13)
+        engine = GameEngine()
+        snap = engine.snapshot()
+        first = self._play(engine, 40, seed=6)
+        engine.restore(snap)
+        assert self._play(engine, 40, seed=6) == first
+
+    def test_compat_fork_draws_what_original_would(self):
+        import random
+        random.seed(21)
+        engine = GameEngine()
+        self._play(engine, 30, seed=7)
+        fork = engine.fork()
+        assert fork.gather_rng is not random and fork.weather_rng is fork.gather_rng
+        branch = self._play(fork, 60, seed=8)
+        assert self._play(engine, 60, seed=8) == branch
+
+
+class TestLazyRegeneration:
+    """Regeneration wird pro Ort lazy nachgeholt — bit-identisch zur Eager-Schleife."""
+
+    @staticmethod
+    def _play(seed, eager):
+        import random
+        random.seed(seed)
+        rng = random.Random(seed)
+        engine = GameEngine()
+        locs = list(engine.locations)
+        for _ in range(400):
+            r = rng.random()
+            if r < 0.6:
+                engine.gather()
+            elif r < 0.8:
+                engine.travel(locs[rng.randrange(len(locs))])
+            else:
+                engine._advance_time(rng.randint(0, 30))
+            if eager:  # alter Zustand: nach jeder Aktion sind alle Orte aktuell
+                for loc in engine.locations.values():
+                    engine._settle_nodes(loc)
+        for loc in engine.locations.values():
+            engine._settle_nodes(loc)
+        return [(n.stock, n.depleted) for loc in engine.locations.values() for n in loc.nodes]
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_lazy_matches_eager_exactly(self, seed):
+        assert self._play(seed, eager=False) == self._play(seed, eager=True)
+
+    def test_remote_location_settles_on_arrival(self):
+        engine = GameEngine()
+        node = engine.locations["hidden_cave"].nodes[0]
+        node.stock = 0.0
+        node.depleted = True
+        engine._advance_time(200)
+        assert node.stock == 0.0  # noch nicht abgerechnet (nicht aktuell)
+        engine.travel("hidden_cave")
+        assert node.depleted is False
+        assert node.stock == min(node.max_stock, node.regen_per_tick * 200
+                                 + node.regen_per_tick * 3)
+
+    def test_only_current_location_is_touched(self):
+        engine = GameEngine()
+        engine._advance_time(5)
+        here = engine.locations[engine.current_location_id]
+        assert here.regen_mark == len(engine._regen_log)
+        others = [l for l in engine.locations.values() if l is not here]
+        assert all(l.regen_mark == 0 for l in others)
+
+    def test_resting_location_resettles_after_write(self):
+        engine = GameEngine()
+        engine._advance_time(1)
+        here = engine.locations[engine.current_location_id]
+        assert here.regen_rest is not None          # alles voll: Abrechnung entfällt
+        node = here.nodes[0]
+        node.stock = 1.0
+        engine._advance_time(2)
+        assert node.stock == min(node.max_stock, 1.0 + node.regen_per_tick * 2)
+
+    def test_only_regenerating_nodes_are_settled(self, monkeypatch):
+        from data.locations import NodeStore
+        engine = GameEngine()
+        here = engine.locations[engine.current_location_id]
+        store, ids = here.node_view()
+        here.nodes[1].stock = 0.5
+        engine._advance_time(1)
+        settled = []
+        settle = NodeStore.settle
+        monkeypatch.setattr(NodeStore, "settle",
+                            lambda self, ids, pending: settled.append(list(ids))
+                            or settle(self, ids, pending))
+        engine._advance_time(1)
+        engine._advance_time(1)
+        assert settled == [[ids[1]], [ids[1]]]
+        assert here.node_view() == (store, ids)
+
+    def test_regen_log_stays_bounded(self):
+        from engine.core import REGEN_LOG_LIMIT
+        engine = GameEngine()
+        node = engine.locations["hidden_cave"].nodes[0]
+        node.stock, node.depleted = 0.0, True
+        engine.player.energy = 1e9
+        engine.wait(3 * REGEN_LOG_LIMIT + 7)
+        for _ in range(2 * REGEN_LOG_LIMIT):
+            engine._advance_time(1)
+        assert len(engine._regen_log) < REGEN_LOG_LIMIT
+        engine._settle_nodes(engine.locations["hidden_cave"])
+        expected = 0.0
+        for _ in range(5 * REGEN_LOG_LIMIT + 7):
+            expected = min(node.max_stock, expected + node.regen_per_tick)
+        assert node.stock == expected and node.depleted is False
+
+
+class TestEventQueue:
+    """Prioritäts-Scheduler für zeitgesteuerte Welt-Ereignisse."""
+
+    def test_pop_due_in_order_and_only_due(self):
+        from engine.core import EventQueue
+        q = EventQueue()
+        q.schedule(("B",), 20)
+        q.schedule(("A",), 10)
+        q.schedule(("C",), 10)
+        assert q.next_due() == 10
+        assert q.pop_due(15) == [("A",), ("C",)]
+        assert q.pop_due(15) == []
+        assert q.pop_due(20) == [("B",)]
+        assert len(q) == 0 and q.next_due() is None
+
+    def test_reschedule_supersedes(self):
+        from engine.core import EventQueue
+        q = EventQueue()
+        q.schedule(("X",), 5)
+        q.schedule(("X",), 50)
+        assert q.due_of(("X",)) == 50
+        assert q.pop_due(10) == []
+        q.cancel(("X",))
+        assert q.pop_due(100) == [] and ("X",) not in q
+
+    def test_stale_entries_are_compacted(self):
+        from engine.core import EventQueue
+        q = EventQueue()
+        for t in range(1000):
+            q.schedule(("W",), t)
+        assert len(q._heap) < 100
+        assert q.pop_due(10**6) == [("W",)]
+
+
+class TestWeatherSchedule:
+    """Wetter über die Event-Queue — identisch zur alten 12er-Modulo-Abfrage."""
+
+    def test_weather_rolls_match_modulo_rule(self, monkeypatch):
+        import random
+        rolls = []
+        engine = GameEngine()
+        monkeypatch.setattr("engine.core.random.choice",
+                            lambda seq: rolls.append(engine.tick_counter) or "RAIN")
+        rng = random.Random(5)
+        expected = []
+        for _ in range(300):
+            engine._advance_time(rng.choice([0, 1, 1, 2, 3, 5, 12, 13]))
+            if engine.tick_counter % 12 == 0:
+                expected.append(engine.tick_counter)
+        assert rolls == expected
+
+    def test_setting_clock_reschedules_weather(self, monkeypatch):
+        engine = GameEngine()
+        engine._advance_time(100)           # Termin liegt jetzt bei 144
+        engine.tick_counter = 20            # zurückgestellt → nächster Termin 24
+        monkeypatch.setattr("engine.core.random.choice", lambda seq: "SNOW")
+        engine._advance_time(4)
+        assert engine.current_weather == "SNOW"
+
+
+class TestFireAndHealEvents:
+    """Feuer-Aus- und Heil-Termine in der Event-Queue — gegen das Polling im
+    Zeitschritt geprüft."""
+
+    @staticmethod
+    def _tick_until(engine, done):
+        while not done():
+            engine._advance_time(1)
+        return engine.tick_counter
+
+    def test_fire_out_due_matches_polled(self):
+        from engine.core import FIRE_EVENT
+        engine = GameEngine(seed=1)
+        engine._light_fire()
+        assert engine._events.due_of(FIRE_EVENT) == engine.tick_counter + 24
+        engine._advance_time(5)
+        due = engine._events.due_of(FIRE_EVENT)
+        assert self._tick_until(engine, lambda: not engine._fire_lit()) == due
+        assert FIRE_EVENT not in engine._events
+
+    def test_stoke_reschedules_fire_out(self):
+        from engine.core import FIRE_EVENT
+        engine = GameEngine(seed=1)
+        engine._light_fire()
+        before = engine._events.due_of(FIRE_EVENT)
+        engine.player.inventory.add(create_item("log_oak"))
+        assert engine.stoke_fire().success
+        assert engine._events.due_of(FIRE_EVENT) == before + 8
+        due = engine._events.due_of(FIRE_EVENT)
+        assert self._tick_until(engine, lambda: not engine._fire_lit()) == due
+
+    def test_travel_moves_fire_event_with_the_player(self):
+        from engine.core import FIRE_EVENT
+        engine = GameEngine(seed=1)
+        engine._light_fire()
+        home = engine.current_location_id
+        engine.travel("hidden_cave")
+        assert FIRE_EVENT not in engine._events       # dort brennt nichts ab
+        fuel = engine.locations[home].fire_fuel
+        engine.travel(home)
+        assert engine._events.due_of(FIRE_EVENT) == engine.tick_counter - 3 + int(fuel)
+        due = engine._events.due_of(FIRE_EVENT)
+        assert self._tick_until(engine, lambda: not engine._fire_lit()) == due
+
+    def test_heal_due_matches_polled_rest(self):
+        from engine.core import HEAL_EVENT
+        engine = GameEngine(seed=1)
+        engine.travel("hidden_cave")                    # geschützt → Ruhe heilt
+        engine._inflict("cut")
+        engine.player.inventory.add(create_item("bandage"))
+        assert engine.execute_process("treat_cut").success
+        due = engine._events.due_of((HEAL_EVENT, "cut"))
+        assert due is not None
+        healed = self._tick_until(engine, lambda: "cut" not in engine.player.injuries)
+        assert healed == due
+        assert (HEAL_EVENT, "cut") not in engine._events
+
+    def test_heal_without_rest_reschedules(self):
+        from engine.core import HEAL_EVENT
+        engine = GameEngine(seed=1)
+        engine.travel("hidden_cave")
+        engine.player.injuries["strain"] = {"severity": 0.5, "ticks": 0, "treated": True}
+        engine._schedule_heal("strain")
+        first = engine._events.due_of((HEAL_EVENT, "strain"))
+        engine.current_location_id = "forest_edge"      # exponiert: keine Heilung
+        engine._advance_time(20)
+        assert engine._events.due_of((HEAL_EVENT, "strain")) > first
+        engine.current_location_id = "hidden_cave"
+        due = engine._events.due_of((HEAL_EVENT, "strain"))
+        healed = self._tick_until(engine, lambda: "strain" not in engine.player.injuries)
+        assert healed == due
+
+    def test_reinjury_cancels_heal_event(self):
+        from engine.core import HEAL_EVENT
+        engine = GameEngine(seed=1)
+        engine.player.injuries["cut"] = {"severity": 0.1, "ticks": 0, "treated": True}
+        engine._schedule_heal("cut")
+        engine.travel("hidden_cave")
+        engine._advance_time(2)
+        assert "cut" not in engine.player.injuries
+        assert (HEAL_EVENT, "cut") not in engine._events
+        assert engine._inflict("cut")
+        assert (HEAL_EVENT, "cut") not in engine._events  # unbehandelt: kein Termin
+
+    @pytest.mark.parametrize("seed", range(8))
+    def test_random_session_against_polling(self, seed):
+        import math
+        import random
+        from engine.core import FIRE_EVENT, HEAL_EVENT
+        rng = random.Random(seed)
+        engine = GameEngine(seed=seed)
+        inv = engine.player.inventory
+        for _ in range(300):
+            r = rng.random()
+            heal_due = {}
+            for kind, inj in engine.player.injuries.items():
+                if inj["treated"]:
+                    heal_due[kind] = engine._events.due_of((HEAL_EVENT, kind))
+            if r < 0.1:
+                engine._light_fire()
+            elif r < 0.2:
+                inv.add(create_item(rng.choice(["log_oak", "tinder"])))
+                engine.stoke_fire()
+            elif r < 0.3:
+                engine.travel(rng.choice(["hidden_cave", "forest_edge"]))
+            elif r < 0.4:
+                engine._inflict(rng.choice(["cut", "strain"]))
+            elif r < 0.5:
+                inv.add(create_item(rng.choice(["bandage", "poultice"])))
+                engine.execute_process(rng.choice(["treat_cut", "treat_strain"]))
+            elif r < 0.7:
+                engine.wait(rng.randint(1, 40))
+            else:
+                engine._advance_time(1)
+            engine.player.energy = engine.player.max_energy
+            engine.player.hp = engine.player.max_hp
+            # Ein Feuer brennt genau bis zu seinem Termin.
+            if engine._fire_lit():
+                loc = engine.current_location
+                assert engine._events.due_of(FIRE_EVENT) == \
+                    engine.tick_counter + math.ceil(loc.fire_fuel)
+            else:
+                assert FIRE_EVENT not in engine._events
+            # Eine Wunde verheilt nie vor ihrem Termin.
+            for kind, due in heal_due.items():
+                if kind not in engine.player.injuries:
+                    assert due is not None and engine.tick_counter >= due
+
+    def test_wait_with_events_matches_single_ticks(self):
+        def setup():
+            engine = GameEngine(seed=3)
+            engine.travel("hidden_cave")
+            engine._light_fire()
+            engine._inflict("cut")
+            engine.player.inventory.add(create_item("bandage"))
+            engine.execute_process("treat_cut")
+            return engine
+        ref, fast = setup(), setup()
+        expected = [m for m in (ref._advance_time(1) for _ in range(120)) if m]
+        assert fast.wait(120) == expected
+        assert TestWait._state(fast) == TestWait._state(ref)
+        assert fast._events.state() == ref._events.state()
+
+
+class TestWait:
+    """wait(n) ≡ n × _advance_time(1): gleiche Meldungen, bit-gleicher Zustand."""
+
+    @staticmethod
+    def _scenario(seed):
+        import random
+        rng = random.Random(seed)
+        random.seed(seed)
+        engine = GameEngine()
+        engine.travel(rng.choice(list(engine.locations)))
+        engine.tick_counter = rng.randrange(0, 400)
+        engine.current_weather = rng.choice(list(engine.weather_types))
+        p = engine.player
+        p.energy = rng.choice([800.0, 37.5, 12.3, 0.0])
+        p.body_temp = rng.choice([37.0, 35.2, 34.0, 41.0])
+        if rng.random() < 0.5:
+            p.inventory.add(create_item("fur_cloak"))
+        loc = engine.current_location
+        if rng.random() < 0.6:
+            loc.fire_active = True
+            loc.fire_fuel = rng.choice([24.0, 8.0, 3.5, 0.7, 130.0])
+        for kind in ("cut", "strain"):
+            if rng.random() < 0.5:
+                p.injuries[kind] = {"severity": rng.choice([1.0, 0.3, 0.12]),
+                                    "ticks": 0, "treated": rng.random() < 0.6}
+        if rng.random() < 0.5:
+            for node in loc.nodes:
+                node.stock, node.depleted = 0.0, True
+        return engine
+
+    @staticmethod
+    def _state(engine):
+        import copy
+        import random
+        for loc in engine.locations.values():
+            engine._settle_nodes(loc)
+        p = engine.player
+        return (p.energy, p.hp, p.body_temp, copy.deepcopy(p.injuries),
+                engine.tick_counter, engine.current_weather, random.getstate(),
+                [(l.fire_active, l.fire_fuel, [(n.stock, n.depleted) for n in l.nodes])
+                 for l in engine.locations.values()])
+
+    @pytest.mark.parametrize("seed", range(40))
+    def test_matches_single_ticks(self, seed):
+        import random
+        n = random.Random(1000 + seed).choice([1, 7, 12, 50, 150, 400])
+        effort = [1.0, 2.0, 0.5][seed % 3]
+
+        ref = self._scenario(seed)
+        expected = [m for m in (ref._advance_time(1, effort) for _ in range(n)) if m]
+        ref_state = self._state(ref)
+
+        fast = self._scenario(seed)
+        got = fast.wait(n, effort)
+        assert got == expected
+        assert self._state(fast) == ref_state
+
+    @pytest.mark.parametrize("energy,effort", [(12.3, 1.3), (1e-9, 0.7), (250.0, 2.7),
+                                               (0, 1.0), (10.0, 1.0)])
+    def test_energy_closed_form_matches_single_ticks(self, energy, effort):
+        def setup():
+            engine = GameEngine(seed=7)
+            engine.player.energy = energy
+            return engine
+        ref, fast = setup(), setup()
+        expected = [m for m in (ref._advance_time(1, effort) for _ in range(300)) if m]
+        assert fast.wait(300, effort) == expected
+        assert repr(fast.player.energy) == repr(ref.player.energy)
+        assert self._state(fast) == self._state(ref)
+
+    def test_weather_rolled_inside_segments(self, monkeypatch):
+        engine = GameEngine(seed=7)
+        calls = []
+        single = GameEngine._advance_time
+        monkeypatch.setattr(GameEngine, "_advance_time",
+                            lambda self, *a, **k: calls.append(a) or single(self, *a, **k))
+        weather = []
+        roll = GameEngine._update_weather
+        monkeypatch.setattr(GameEngine, "_update_weather",
+                            lambda self: weather.append(self.tick_counter) or roll(self))
+        engine.wait(200)
+        assert calls == []                            # kein Einzelschritt nötig
+        assert [t for t in weather if t % 12 == 0] == list(range(48, 37 + 200, 12))
+
+    def test_long_rest_heals_and_fire_goes_out(self):
+        engine = GameEngine()
+        engine.travel("hidden_cave")  # geschützt → Ruhe heilt
+        engine.player.injuries["cut"] = {"severity": 1.0, "ticks": 0, "treated": True}
+        loc = engine.current_location
+        loc.fire_active, loc.fire_fuel = True, 5.0
+        logs = engine.wait(100)
+        assert "cut" not in engine.player.injuries
+        assert loc.fire_active is False
+        assert any("FIRE_OUT" in m for m in logs)
+        assert engine.tick_counter == 36 + 3 + 100
+
+
+class TestClimateTable:
+    """Vorberechnete Umgebungstemperatur/Exposition je Ort × Wetter × Stunde."""
+
+    @staticmethod
+    def _reference(engine, loc_id, tick, weather):
+        loc = engine.locations[loc_id]
+        hour = (tick % 144) / 6
+        night_mod = -10 if (hour < 6 or hour > 20) else 0
+        return loc.base_temp + engine.weather_types[weather]["temp_mod"] + night_mod
+
+    def test_ambient_at_matches_formula(self):
+        engine = GameEngine()
+        for loc_id in engine.locations:
+            for weather in engine.weather_types:
+                for tick in range(0, 300):
+                    assert (engine.ambient_at(loc_id, tick, weather)
+                            == self._reference(engine, loc_id, tick, weather))
+
+    def test_exposure_table(self):
+        engine = GameEngine()
+        for loc_id, loc in engine.locations.items():
+            for weather, wt in engine.weather_types.items():
+                assert (engine.climate.exposure_at(loc_id, weather)
+                        == loc.exposure * wt["exposure_mod"])
+
+    def test_ambient_at_does_not_mutate(self):
+        engine = GameEngine(seed=3)
+        before = engine.snapshot()
+        engine.ambient_at("forest_edge", 10, "SNOW")
+        assert engine.snapshot() == before
+        assert engine.ambient_at("forest_edge", 10, "SNOW") < engine.ambient_at(
+            "forest_edge", 72, "CLEAR")
+
+    def test_current_ambient_follows_state(self):
+        engine = GameEngine()
+        engine.tick_counter = 130
+        engine.current_weather = "RAIN"
+        assert engine._get_ambient_temp() == self._reference(
+            engine, engine.current_location_id, 130, "RAIN")
+
+    def test_table_shared_between_clones(self):
+        engine = GameEngine.from_prototype()
+        assert engine.fork().climate is engine.climate
+        assert GameEngine.from_prototype().climate is engine.climate
+
+    def test_table_shared_between_engines_with_same_content(self):
+        from engine.climate import climate_table
+        engine = GameEngine()
+        assert GameEngine(seed=2).climate is engine.climate
+        weather = {k: dict(v) for k, v in engine.weather_types.items()}
+        weather["RAIN"]["temp_mod"] = -7
+        table = climate_table(engine.locations.values(), weather)
+        assert table is not engine.climate
+        loc = engine.locations[engine.current_location_id]
+        assert table.ambient_at(loc.id, 72, "RAIN") == loc.base_temp - 7
+        assert GameEngine().climate is not engine.climate          # neu gebaut, gleiche Werte
+        assert GameEngine().climate.ambient == engine.climate.ambient
+
+    def test_location_edited_in_place(self):
+        engine = GameEngine()
+        engine.tick_counter = 72
+        loc = engine.locations[engine.current_location_id]
+        old = engine.climate
+        loc.base_temp += 5
+        assert engine._get_ambient_temp() == self._reference(engine, loc.id, 72, "CLEAR")
+        assert engine.ambient_at(loc.id, 10, "SNOW") == self._reference(engine, loc.id, 10, "SNOW")
+        assert engine.climate is not old
+        loc.exposure = 0.9
+        engine._advance_time(1)
+        assert engine.climate.exposure_at(loc.id, "CLEAR") == 0.9
+
+    def test_weather_type_edited_in_place(self):
+        engine = GameEngine()
+        engine.tick_counter = 72
+        engine.current_weather = "RAIN"
+        engine.weather_types["RAIN"]["temp_mod"] = -7
+        engine.weather_types["RAIN"]["exposure_mod"] = 3.0
+        loc = engine.locations[engine.current_location_id]
+        assert engine._get_ambient_temp() == loc.base_temp - 7
+        assert engine.climate.exposure_at(loc.id, "RAIN") == loc.exposure * 3.0
+
+    def test_single_exposure_source_for_rest_and_climate(self):
+        engine = GameEngine()
+        loc = engine.locations[engine.current_location_id]
+        assert not engine._resting_warm()
+        loc.exposure = 0.1                                         # jetzt windgeschützt
+        assert engine._resting_warm()
+        assert engine.climate.site_exposure[loc.id] == 0.1
+        assert engine.climate.exposure_at(loc.id, "CLEAR") == 0.1
+
+    def test_wait_after_edit_matches_single_ticks(self):
+        def setup():
+            engine = GameEngine(seed=4)
+            loc = engine.locations[engine.current_location_id]
+            engine._advance_time(5)
+            loc.base_temp, loc.exposure = -20.0, 0.1
+            engine.player.injuries["strain"] = {"severity": 0.6, "ticks": 0, "treated": True}
+            return engine
+        ref, fast = setup(), setup()
+        expected = [m for m in (ref._advance_time(1) for _ in range(60)) if m]
+        assert fast.wait(60) == expected
+        assert TestWait._state(fast) == TestWait._state(ref)
+        assert "strain" not in fast.player.injuries                # Ruhe am geschützten Ort
+
+
+class TestHeadlessStep:
+    """step(): dieselben Aktionen ohne Meldungstexte, strukturierte Ergebnisse."""
+
+    @staticmethod
+    def _actions(game, rng):
+        locs = list(game.locations)
+        for _ in range(250):
+            r = rng.random()
+            inv = game.player.inventory.items
+            if r < 0.4:
+                yield ("gather",)
+            elif r < 0.5:
+                yield ("travel", rng.choice(locs + ["nowhere"]))
+            elif r < 0.6:
+                yield ("eat", rng.randrange(len(inv) + 1))
+            elif r < 0.85:
+                sel = list(inv)
+                rng.shuffle(sel)
+                yield ("execute_experiment", sel[:rng.randint(0, min(4, len(sel)))])
+            elif r < 0.95:
+                yield ("execute_process", rng.choice(list(game.processes) + ["nope"]))
+            else:
+                yield ("stoke_fire",)
+
+    def test_same_state_and_messages_as_single_calls(self):
+        import random
+        from collections.abc import Mapping
+        from engine.core import Reason, _parse_reason
+        for seed in (1, 2, 3):
+            a, b = GameEngine(seed=seed), GameEngine(seed=seed)
+            rng_a, rng_b = random.Random(seed), random.Random(seed)
+            for act_a, act_b in zip(self._actions(a, rng_a), self._actions(b, rng_b)):
+                out = getattr(a, act_a[0])(*act_a[1:])
+                (res,) = b.step([act_b])
+                assert res.op == act_b[0]
+                if isinstance(out, Mapping):
+                    assert res.reason == _parse_reason(out["reason"])[0]
+                    assert res.success is out["success"]
+                    assert out["message"].startswith(res.message())
+                elif act_a[0] == "gather":
+                    found = [l for l in out if l.startswith("Gefunden")]
+                    lines = res.message().split("\n") if res.message() else []
+                    assert out[len(out) - len(lines):] == lines   # ohne Zeit-Meldung
+                    assert len(out) - len(lines) <= 1
+                    assert (res.reason == Reason.SUCCESS) == bool(found)
+                else:
+                    assert out.startswith(res.message())
+                assert a.snapshot() == b.snapshot()
+
+    def test_deltas_and_ids(self):
+        from engine.core import Reason
+        game = GameEngine(seed=4)
+        before = (game.player.energy, game.tick_counter)
+        res = game.step([("travel", "hidden_cave"), ("gather",), ("wait", 5)])
+        assert [r.op for r in res] == ["travel", "gather", "wait"]
+        assert res[0].reason == Reason.SUCCESS and res[0].ids == ("hidden_cave",)
+        assert sum(r.ticks for r in res) == game.tick_counter - before[1] == 9
+        assert sum(r.energy for r in res) == pytest.approx(game.player.energy - before[0])
+        assert len(res[1].ids) == len(res[1].amounts)
+        assert game.step([("travel", "nowhere")])[0].reason == Reason.UNKNOWN_LOCATION
+
+    def test_experiment_reason_detail(self):
+        from engine.core import Reason
+        game = GameEngine()
+        game.player.inventory.add(create_item("stick"))
+        game.player.inventory.add(create_item("stone"))
+        items = list(game.player.inventory.items)
+        (res,) = game.step([("execute_experiment", items[:1])])
+        assert res.reason == Reason.TOO_FEW_ITEMS and not res.success
+        items[0].condition = 0
+        (res,) = game.step([("execute_experiment", items)])
+        assert res.reason == Reason.BROKEN_ITEM and res.ids == (items[0].name,)
+        assert "zerbrochen" in res.message()
+
+    def test_gather_message_keeps_injury_and_broken_tool(self):
+        from engine import core
+        from engine.components import Item
+        game = GameEngine(seed=1)
+        game.player.stats["perception"] = 99
+        game.player.inventory.add(Item(name="Axt", base_weight=1.0, tags={"CHOPPING": True},
+                                       condition=0.01))                 # bricht beim 1. Einsatz
+        ref = game.fork()
+        for g in (game, ref):
+            g.current_location.exposure = 1.0                           # Zerrungs-Risiko
+            g.injuries_rng.random = g.gather_rng.random = lambda: 0.0   # immer Fund + Verletzung
+        out = ref.gather()
+        (res,) = game.step([("gather",)])
+        assert core.MSG_INJURED in out and "!!! Axt zerbrochen !!!" in out
+        lines = res.message().split("\n")
+        assert out[len(out) - len(lines):] == lines and len(out) - len(lines) <= 1
+        assert game.snapshot() == ref.snapshot()
+
+    def test_unknown_action_rejected_and_mode_reset(self):
+        game = GameEngine()
+        with pytest.raises(ValueError):
+            game.step([("fly",)])
+        assert game._headless is False
+        assert isinstance(game.travel("hidden_cave"), str)
+
+
+def _legacy_feedback_message(reason, broken_names=None):
+    """Frühere String-basierte `_feedback_message` (Referenz)."""
+    from engine.core import _label_for
+    if reason.startswith("MISSING_TAG:"):
+        return f"Es fehlt dir {_label_for(reason.split(':', 1)[1])}."
+    if reason == "TOO_FEW_ITEMS":
+        return "Dafür brauchst du mindestens zwei Dinge."
+    if reason == "NOT_ENOUGH_QUANTITY":
+        return "Dafür brauchst du mehr von demselben Material."
+    if reason == "BROKEN_ITEM":
+        return f"{', '.join(broken_names or [])} ist zerbrochen und kann nicht verwendet werden."
+    if reason == "NO_MATCH":
+        return "Die Kombination ergibt nichts."
+    if reason.startswith("NEAR_MISS:"):
+        return "Einige dieser Dinge scheinen zusammenzugehören, aber es fehlt noch etwas."
+    if reason == "DEPLETED":
+        return "Diese Stelle ist erschöpft. Komm später zurück."
+    if reason == "FIRE_OUT":
+        return "Dein Feuer erlischt."
+    if reason == "NO_FIRE":
+        return "Hier brennt kein Feuer."
+    if reason == "MISSING_FUEL":
+        return "Es fehlt dir Brennholz zum Nachlegen."
+    if reason.startswith("MISSING_ENV:"):
+        return f"Hier fehlt {_label_for(reason.split(':', 1)[1])} in der Umgebung."
+    if reason == "NO_INJURY":
+        return "Du bist nicht verletzt."
+    if reason == "BLEEDING":
+        return "Du blutest — die Wunde muss behandelt und du musst rasten."
+    if reason == "TREATED":
+        return "Die Wunde ist behandelt."
+    if reason == "HEALED":
+        return "Deine Wunde heilt."
+    return "Das geht so nicht."
+
+
+class TestActionResult:
+    """Slotted ActionResult mit Reason-Enum, Payload und Dict-Sicht."""
+
+    def test_feedback_message_matches_legacy(self):
+        from engine.core import _feedback_message
+        codes = ["MISSING_TAG:SHARP", "MISSING_TAG:FOO", "TOO_FEW_ITEMS", "NOT_ENOUGH_QUANTITY",
+                 "BROKEN_ITEM", "NO_MATCH", "NEAR_MISS:axe", "DEPLETED", "FIRE_OUT", "NO_FIRE",
+                 "MISSING_FUEL", "MISSING_ENV:HEAT_SOURCE", "NO_INJURY", "BLEEDING", "TREATED",
+                 "HEALED", "INJURED", "UNKNOWN", "WHATEVER:X"]
+        for code in codes:
+            assert _feedback_message(code, ["Stein"]) == _legacy_feedback_message(code, ["Stein"])
+
+    def test_dict_view_of_experiment_failure(self):
+        from engine.core import ActionResult, Reason
+        engine = GameEngine()
+        engine.player.inventory.add(create_item("stick"))
+        res = engine.execute_experiment(list(engine.player.inventory.items))
+        assert isinstance(res, ActionResult) and not hasattr(res, "__dict__")
+        assert res.reason == Reason.TOO_FEW_ITEMS and res["reason"] == "TOO_FEW_ITEMS"
+        assert dict(res) == {"success": False, "message": res.message,
+                             "reason": "TOO_FEW_ITEMS", "blueprint_id": None,
+                             "result_template_id": None}
+        assert repr(res) == repr(dict(res))
+        assert res.get("process_id") is None and "process_id" not in res
+        with pytest.raises(KeyError):
+            res["process_id"]
+
+    def test_payload_carries_detail(self):
+        from engine.core import Reason
+        engine = GameEngine()
+        res = engine.execute_process("cook_meat")
+        assert res.reason == Reason.MISSING_INPUT and res.payload == "raw_meat"
+        assert res["reason"] == "MISSING_INPUT:raw_meat"
+        assert res["message"] == "Es fehlt dir " + create_item("raw_meat").name + "."
+        res = engine.stoke_fire()
+        assert res.reason == Reason.NO_FIRE and res.payload is None
+        assert list(res) == ["success", "message", "reason"]
+
+    def test_success_keys_and_lazy_message(self):
+        from engine.core import Reason
+        engine = GameEngine()
+        for tid in ("flint_shard", "stick", "plant_fiber"):
+            engine.player.inventory.add(create_item(tid))
+        res = engine.execute_experiment(list(engine.player.inventory.items))
+        assert res._message is None            # noch nicht gerendert
+        assert res["success"] is True and res.reason == Reason.SUCCESS
+        assert res["blueprint_id"] == res["result_template_id"] == res.blueprint_id
+        assert res["message"] == f"Hergestellt: {res.payload}"
+        assert res._message is not None
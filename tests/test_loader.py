@@ -1,4 +1,6 @@
 """Tests for data/loader.py — JSON loading and validation."""
+import json
+
 import pytest
 from pathlib import Path
 
@@ -236,4 +238,71 @@ class TestLoaderRoundtrip:
     def test_locations_have_three_nodes(self):
         locs = load_locations()
         assert len(locs) == 3
-        assert all(hasattr(loc, "nodes") for loc in locs)
\ No newline at end of file
+        assert all(hasattr(loc, "nodes") for loc in locs)
+
+
+class TestCompiledContentCache:
+    """Kompilierter Content-Cache: einmal validieren, frische Instanzen ausgeben."""
+
+    @pytest.fixture
+    def data_copy(self, tmp_path, monkeypatch):
+        """Isolierte Kopie der vier Content-Dateien + leerer Prozess-Memo."""
+        import data.loader as loader
+        src = Path(loader.__file__).parent
+        for name in loader.CONTENT_FILES:
+            (tmp_path / name).write_bytes((src / name).read_bytes())
+        monkeypatch.setattr(loader, "DATA_DIR", tmp_path)
+        monkeypatch.setattr(loader, "CACHE_DIR", tmp_path / "__contentcache__")
+        monkeypatch.setattr(loader, "_compiled", None)
+        return tmp_path
+
+    def test_compiles_once_and_persists(self, data_copy, monkeypatch):
+        import data.loader as loader
+        content = loader.load_content()
+        assert loader._cache_path(content.content_hash).exists()
+        assert loader.load_content() is content  # Prozess-Memo, kein Re-Read
+
+        # Neuer Prozess (Memo leer): liest das Pickle, validiert NICHT erneut
+        monkeypatch.setattr(loader, "_compiled", None)
+        monkeypatch.setattr(loader, "_compile", lambda digest: pytest.fail("revalidated"))
+        again = loader.load_content()
+        assert again == content
+
+    def test_content_change_invalidates(self, data_copy):
+        import data.loader as loader
+        before = loader.load_content()
+        items = json.loads((data_copy / "items.json").read_text())
+        items["stick"]["weight"] = 0.75
+        (data_copy / "items.json").write_text(json.dumps(items))
+        after = loader.load_content()
+        assert after.content_hash != before.content_hash
+        assert after.items["stick"]["weight"] == 0.75
+
+    def test_invalid_content_still_raises(self, data_copy):
+        import data.loader as loader
+        (data_copy / "blueprints.json").write_text('{"not": "a list"}')
+        with pytest.raises(ValueError):
+            loader.load_content()
+
+    def test_compiled_matches_validated_loaders(self):
+        from data.loader import load_content
+        content = load_content()
+        assert content.items == {tid: t.model_dump() for tid, t in load_items().items()}
+        assert [b["id"] for b in content.blueprints] == [b.id for b in load_blueprints()]
+        assert [l["id"] for l in content.locations] == [l.id for l in load_locations()]
+
+    def test_fresh_mutable_state_per_call(self):
+        """Kein Cross-Session-Bleed: Stock/Feuer/Slots sind pro Aufruf frisch."""
+        from data.locations import get_all_locations
+        from data.blueprints import get_all_blueprints
+        from data.processes import get_all_processes
+        a = get_all_locations()
+        a[0].nodes[0].stock = 0.0
+        a[0].fire_active = True
+        b = get_all_locations()
+        assert b[0].nodes[0].stock == b[0].nodes[0].max_stock
+        assert b[0].fire_active is False
+        bp1, bp2 = get_all_blueprints()[0], get_all_blueprints()[0]
+        assert bp1.slots == bp2.slots and bp1.slots is not bp2.slots
+        p1, p2 = get_all_processes()[0], get_all_processes()[0]
+        assert p1.inputs is not p2.inputs
@@ -0,0 +1,130 @@
+"""Tests for engine/memo.py — LRU-Memo der Experiment-Ausgänge."""
+import random
+
+from engine.core import GameEngine
+from engine.journal import state_checksum
+from engine.memo import ExperimentMemo, TOTALS, memo_totals, reset_totals
+from data.items import create_item
+
+
+def _engine(*templates, seed=1):
+    game = GameEngine(seed=seed)
+    for tid in templates:
+        game.player.inventory.add(create_item(tid))
+    return game
+
+
+def _experiment_session(game, rng, steps=300):
+    """Naiver Bot: sammelt, reist und probiert zufällige Kombinationen."""
+    out = []
+    locs = list(game.locations)
+    for _ in range(steps):
+        r = rng.random()
+        inv = game.player.inventory.items
+        if r < 0.3:
+            game.gather()
+        elif r < 0.35:
+            game.travel(rng.choice(locs))
+        elif r < 0.4:
+            game.execute_process(rng.choice(list(game.processes)))
+        else:
+            sel = list(inv)
+            rng.shuffle(sel)
+            out.append(repr(game.execute_experiment(sel[:rng.randint(1, min(4, len(sel) or 1))])))
+        game.player.energy = game.player.max_energy
+        game.player.hp = game.player.max_hp
+    return out
+
+
+class TestExperimentMemo:
+    def test_repeat_hits(self):
+        game = _engine("stone", "bone")
+        sel = list(game.player.inventory.items)
+        first = game.execute_experiment(sel)
+        again = game.execute_experiment(sel[::-1])   # Multimenge, nicht Reihenfolge
+        assert dict(again) == dict(first)
+        assert game._memo.stats()["hits"] == 1 and game._memo.misses == 1
+
+    def test_near_miss_not_memoized(self):
+        game = _engine("stone", "plant_fiber", "bone")
+        sel = list(game.player.inventory.items)
+        assert game.execute_experiment(sel).reason.name == "NEAR_MISS"
+        assert not game._memo.entries
+        # Hinweis ist verbucht → zweiter Versuch liefert den Rückfall-Reason
+        assert game.execute_experiment(sel).reason.name != "NEAR_MISS"
+        assert len(game._memo.entries) == 1
+
+    def test_invalidated_on_knowledge_change(self):
+        game = _engine("stone", "bone")
+        sel = list(game.player.inventory.items)
+        game.execute_experiment(sel)
+        game.player.known_blueprints.add("spear")       # direkt gestochert
+        game.execute_experiment(sel)
+        assert game._memo.invalidations == 1 and game._memo.hits == 0
+        game.player.near_misses = {"axe_bone"}          # Menge ausgetauscht
+        game.execute_experiment(sel)
+        assert game._memo.invalidations == 2
+
+    def test_invalidated_only_on_survival_tier_change(self):
+        game = _engine("stone", "bone")
+        sel = list(game.player.inventory.items)
+        game.player.stats["survival"] = 0.0
+        game.execute_experiment(sel)
+        game.player.stats["survival"] = 0.1             # gleiche Stufe
+        game.execute_experiment(sel)
+        assert game._memo.hits == 1 and game._memo.invalidations == 0
+        game.player.stats["survival"] = 0.5             # über die 0.4-Schwelle
+        game.execute_experiment(sel)
+        assert game._memo.invalidations == 1
+
+    def test_known_success_memoized_with_order_mapping(self):
+        materials = ("flint_shard", "stick", "plant_fiber") * 3
+        reference = _engine(*materials)
+        reference._memo = ExperimentMemo(0)
+        game = _engine(*materials)
+        for g in (reference, game):
+            items = g.player.inventory.items
+            g.execute_experiment(list(items[:3]))          # Entdeckung → neuer Stand
+            g.execute_experiment(list(items[:3]))
+            res = g.execute_experiment(list(items[:3])[::-1])
+            assert res["success"]
+        assert game._memo.hits == 1
+        assert state_checksum(game) == state_checksum(reference)
+
+    def test_lru_eviction(self):
+        memo = ExperimentMemo(size=2)
+        for key in ((1,), (2,)):
+            memo.put(key, "x")
+        memo.get((1,))
+        memo.put((3,), "y")
+        assert list(memo.entries) == [(1,), (3,)] and memo.evictions == 1
+
+    def test_fork_gets_own_memo(self):
+        game = _engine("stone", "bone")
+        game.execute_experiment(list(game.player.inventory.items))
+        child = game.fork()
+        assert child._memo is not game._memo and not child._memo.entries
+
+    def test_totals(self):
+        reset_totals()
+        game = _engine("stone", "bone")
+        sel = list(game.player.inventory.items)
+        for _ in range(4):
+            game.execute_experiment(sel)
+        assert TOTALS["hits"] == 3 and memo_totals()["hit_rate"] == 0.75
+        reset_totals()
+        assert memo_totals() == {"hits": 0, "misses": 0, "evictions": 0,
+                                 "invalidations": 0, "hit_rate": 0.0}
+
+
+class TestMemoDifferential:
+    def test_same_session_as_unmemoized(self):
+        for seed in (2, 7, 31):
+            plain = GameEngine(seed=seed)
+            plain._memo = ExperimentMemo(0)
+            memo = GameEngine(seed=seed)
+            a = _experiment_session(plain, random.Random(seed))
+            b = _experiment_session(memo, random.Random(seed))
+            assert a == b
+            assert state_checksum(plain) == state_checksum(memo)
+            assert memo._memo.hits > 0
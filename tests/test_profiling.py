@@ -0,0 +1,154 @@
+"""Tests for engine/profiling.py — Zähler und Zeitmesser der heißen Pfade."""
+import pstats
+import random
+
+from engine.core import GameEngine
+from engine.journal import Journal, replay, state_checksum
+from engine.profiling import SECTIONS, Profiler
+from data.items import create_item
+
+
+def _session(game, rng, steps=150):
+    locs = list(game.locations)
+    for _ in range(steps):
+        r = rng.random()
+        if r < 0.4:
+            game.gather()
+        elif r < 0.45:
+            game.travel(rng.choice(locs))
+        elif r < 0.6:
+            game.execute_process(rng.choice(list(game.processes)))
+            game.available_processes()
+        else:
+            sel = list(game.player.inventory.items)
+            rng.shuffle(sel)
+            game.execute_experiment(sel[:rng.randint(2, 4)])
+        game.player.energy = game.player.max_energy
+        game.player.hp = game.player.max_hp
+
+
+class TestProfiler:
+    def test_detached_engine_untouched(self):
+        game = GameEngine(seed=1)
+        prof = Profiler.attach(game)
+        assert all(name in vars(game) for name in SECTIONS)
+        prof.detach()
+        assert not any(name in vars(game) for name in SECTIONS)
+        assert not any(name in vars(game.fork()) for name in SECTIONS)
+
+    def test_same_session_as_unprofiled(self):
+        plain, profiled = GameEngine(seed=5), GameEngine(seed=5)
+        Profiler.attach(profiled)
+        _session(plain, random.Random(5))
+        _session(profiled, random.Random(5))
+        assert state_checksum(plain) == state_checksum(profiled)
+
+    def test_sections_and_counters(self):
+        game = GameEngine(seed=1)
+        start = game.tick_counter
+        prof = Profiler.attach(game)
+        _session(game, random.Random(3))
+        data = prof.as_dict()
+        sections = data["sections"]
+        assert data["counters"]["ticks"] == game.tick_counter - start
+        assert sections["_advance_time"]["calls"] >= sections["gather"]["calls"] > 0
+        for sec in sections.values():
+            assert 0 <= sec["own_s"] <= sec["total_s"]
+        experiments = sum(n for key, n in data["counters"].items()
+                          if key.startswith("execute_experiment."))
+        assert experiments == sections["execute_experiment"]["calls"]
+        callers = prof.sections["_advance_time"].callers
+        assert {"gather", "execute_experiment"} <= set(callers)
+        assert set(prof.sections["_no_match"].callers) == {"execute_experiment"}
+
+    def test_match_and_no_match_split(self):
+        game = GameEngine(seed=1)
+        for tid in ("stone", "bone", "flint_shard", "stick", "plant_fiber"):
+            game.player.inventory.add(create_item(tid))
+        prof = Profiler.attach(game)
+        items = game.player.inventory.items
+        game.execute_experiment([items[2], items[3], items[4]])    # Entdeckung
+        game.execute_experiment([items[0], items[1]])              # Fehlschlag
+        assert prof.sections["_match"].calls == 2
+        assert prof.sections["_no_match"].calls == 1
+        assert prof.counters["execute_experiment.SUCCESS"] == 1
+
+    def test_shared_profiler_and_reset(self):
+        prof = Profiler()
+        a, b = GameEngine(seed=1), GameEngine(seed=2)
+        Profiler.attach(a, prof)
+        Profiler.attach(b, prof)
+        Profiler.attach(b, prof)                                    # doppelt: kein Effekt
+        a.gather()
+        b.gather()
+        assert prof.sections["gather"].calls == 2
+        assert prof.sections["gather"].callers[None][0] == 2
+        prof.reset()
+        a.gather()
+        assert prof.sections["gather"].calls == 1 and prof.counters == {"ticks": 1}
+
+    def test_step_actions_profiled(self):
+        game = GameEngine(seed=1)
+        prof = Profiler.attach(game)
+        game.step([("gather",), ("gather",), ("wait", 3)])
+        assert prof.sections["step"].calls == 1
+        assert prof.sections["gather"].calls == 2
+        assert set(prof.sections["gather"].callers) == {"step"}
+        assert set(prof.sections["wait"].callers) == {"step"}
+        assert prof.counters["ticks"] == 5
+
+    def test_wait_ticks_counted(self):
+        game = GameEngine(seed=1)
+        start = game.tick_counter
+        prof = Profiler.attach(game)
+        game.wait(100)
+        assert game.tick_counter - start == 100
+        assert prof.counters["ticks"] == 100
+        assert prof.sections["wait"].calls == 1
+        assert prof.sections["_advance_segment"].calls > 0
+        assert set(prof.sections["_advance_segment"].callers) == {"wait"}
+
+    def test_journal_still_records(self):
+        game = GameEngine(seed=4)
+        prof = Profiler.attach(game)
+        journal = Journal.record(game)
+        for _ in range(20):
+            game.gather()
+        game.execute_experiment(list(game.player.inventory.items)[:2])
+        journal.close(game)
+        assert len(journal.entries) > 21
+        assert state_checksum(replay(journal)) == state_checksum(game)
+        assert prof.sections["gather"].calls == 20
+
+
+class TestProfilerExport:
+    def _profiled(self):
+        game = GameEngine(seed=2)
+        prof = Profiler.attach(game)
+        _session(game, random.Random(2), steps=60)
+        return prof
+
+    def test_prometheus(self, tmp_path):
+        prof = self._profiled()
+        text = prof.prometheus()
+        calls = prof.sections["gather"].calls
+        assert f'primal_engine_calls_total{{section="gather"}} {calls}' in text
+        assert "# TYPE primal_engine_seconds_total counter" in text
+        assert f'primal_engine_events_total{{name="ticks"}} {prof.counters["ticks"]}' in text
+        path = tmp_path / "engine.prom"
+        prof.write_prometheus(path)
+        assert path.read_text(encoding="utf-8") == text
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_pstats_compatible(self, tmp_path):
+        prof = self._profiled()
+        stats = pstats.Stats(prof)
+        by_name = {key[2]: value for key, value in stats.stats.items()}
+        assert by_name["gather"][0] == prof.sections["gather"].calls
+        assert by_name["_advance_time"][3] == prof.sections["_advance_time"].total
+        path = tmp_path / "engine.prof"
+        prof.dump_stats(path)
+        loaded = pstats.Stats(str(path))
+        assert loaded.total_calls == sum(s.calls for s in prof.sections.values())
+        assert "core.py" in prof.summary() and "cumtime" in prof.summary()
+        assert Profiler().summary() == ""
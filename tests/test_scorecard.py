@@ -277,6 +277,142 @@ class TestMetricsProduceValues:
             assert payload["schema"] == 2
 
 
+class TestParallelJobs:
+    """--jobs N: Einzelläufe im Prozess-Pool, Ergebnis identisch zum seriellen Lauf."""
+
+    def test_parallel_matches_serial(self):
+        assert sc.compute_all(jobs=2) == sc.compute_all()
+        assert not sc._PREFETCH
+
+    def test_memo_counters_collected_from_workers(self):
+        sc.reset_totals()
+        _, _, memo, record = sc._run_unit(("_run_naive_discovery", sc.SEEDS[0]))
+        assert memo == dict(sc.MEMO_TOTALS) and memo["misses"] > 0
+        assert record is None                     # ohne perf keine Messung
+        sc.reset_totals()
+        sc.compute_all(jobs=2)
+        assert sc.memo_totals()["hits"] > 0
+
+    def test_every_unit_has_a_named_runner(self):
+        for name, _ in sc._work_units():
+            assert sc.RUNNERS[name].__name__ == name
+
+    def test_prefetched_error_hits_only_its_metric(self, monkeypatch):
+        monkeypatch.setitem(sc._PREFETCH, ("_run_first_craft", sc.SEEDS[0]),
+                            (False, RuntimeError("kaputt")))
+        data = sc._compute_metrics()
+        assert "kaputt" in data["actions_to_first_craft"]["error"]
+        assert sc._collapse(data["craft_variety"]) is not None
+
+
+class TestResultCache:
+    """Ergebnis-Cache: Einzelläufe über Läufe hinweg, gleiche Werte wie ohne."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(sc, "CACHE_DIR", tmp_path / "cache")
+        return tmp_path / "cache"
+
+    def test_second_run_reuses_everything(self, cache_dir):
+        first = sc.compute_all(cache=True)
+        # discovery_gap → metric_reachability trifft schon im ersten Lauf
+        assert sc._CACHE_STATS["hits"] == sc.REACHABILITY_RUNS
+        assert [p.stem for p in cache_dir.glob("*.json")] == [sc.cache_fingerprint()]
+        second = sc.compute_all(cache=True)
+        assert second == first == sc.compute_all()
+        assert sc._CACHE_STATS["misses"] == 0
+        assert sc._CACHE is None
+
+    def test_version_bump_recomputes_only_its_units(self, cache_dir, monkeypatch):
+        sc.compute_all(cache=True)
+        monkeypatch.setitem(sc.METRIC_VERSIONS, "session_depth", 99)
+        sc.compute_all(cache=True)
+        assert sc._CACHE_STATS["misses"] == len(sc.SEEDS)
+
+    def test_force_and_changed_content(self, cache_dir, monkeypatch):
+        sc.compute_all(cache=True)
+        sc.compute_all(cache=True, force=True)
+        assert sc._CACHE_STATS["hits"] == sc.REACHABILITY_RUNS
+        monkeypatch.setattr(sc, "content_hash", lambda: "anderer-content")
+        sc.compute_all(cache=True)
+        assert sc._CACHE_STATS["hits"] == sc.REACHABILITY_RUNS
+        assert len(list(cache_dir.glob("*.json"))) == 1   # alter Stand verworfen
+
+    def test_parallel_fills_only_missing_units(self, cache_dir, monkeypatch):
+        sc.compute_all(cache=True)
+        monkeypatch.setitem(sc.METRIC_VERSIONS, "craft_variety", 7)
+        monkeypatch.setattr(sc, "_CACHE", sc._load_cache(sc.cache_fingerprint()))
+        assert {name for name, _ in sc._pending_units()} == {"_run_craft_variety"}
+        monkeypatch.setattr(sc, "_CACHE", None)
+        sc.compute_all(jobs=2, cache=True)
+        assert sc._CACHE_STATS["misses"] == len(sc.SEEDS)
+
+
+class TestPerfInstrumentation:
+    """compute_all(perf=True): Zeit/Speicher/Aktionen je Metrik und Einzellauf."""
+
+    def test_perf_run_keeps_values_and_restores_hooks(self):
+        import tracemalloc
+        from engine.core import GameEngine
+        assert sc.compute_all(perf=True, memory=True) == sc.compute_all()
+        assert GameEngine.journal is None and not tracemalloc.is_tracing()
+        assert set(sc.PERF["metrics"]) == {m["key"] for m in sc.METRICS}
+        rec = sc.PERF["metrics"]["session_depth"]
+        assert rec["wall_s"] > 0 and rec["cpu_s"] > 0 and rec["peak_kib"] > 0
+        assert sc.PERF["memory"] is True
+        assert rec["actions"]["gather"] > 0 and rec["actions"]["ticks"] > 0
+        assert set(sc.PERF["units"]) == set(sc.RUNNERS)
+        units = sc.PERF["units"]["_run_session_depth"]
+        assert len(units) == len(sc.SEEDS)
+        assert sum(u["actions"]["gather"] for u in units.values()) == rec["actions"]["gather"]
+
+    def test_timing_without_tracemalloc_by_default(self, monkeypatch):
+        import tracemalloc
+        started = []
+        monkeypatch.setattr(tracemalloc, "start", lambda *a: started.append(a))
+        sc.compute_all(perf=True)
+        assert not started and sc.PERF["memory"] is False
+        rec = sc.PERF["metrics"]["session_depth"]
+        assert rec["wall_s"] > 0 and rec["peak_kib"] is None
+        assert all(u["peak_kib"] is None for u in sc.PERF["units"]["_run_session_depth"].values())
+
+    def test_parallel_units_measured_in_workers(self):
+        sc.compute_all(jobs=2, perf=True)
+        assert len(sc.PERF["units"]["_run_forage_pressure"]) == len(sc.SEEDS)
+        assert sc.PERF["metrics"]["forage_pressure"]["actions"]["gather"] == 0
+
+    def test_tally_counts_outermost_action(self):
+        from engine.core import GameEngine
+        tally = sc._ActionTally()
+        game = GameEngine(seed=1)
+        game.journal = tally
+        game.step((("gather",), ("travel", "cave"), ("wait", 5)))
+        assert tally.counts == {"gather": 1, "experiment": 0, "process": 0,
+                                "travel": 1, "ticks": game.tick_counter - 36}
+
+    def test_perf_table_delta(self):
+        rec = {"wall_s": 1.0, "cpu_s": 0.9, "peak_kib": 50.0,
+               "actions": {"gather": 1, "experiment": 2, "process": 3, "travel": 4, "ticks": 9}}
+        prev = {"perf": {"metrics": {"craft_variety": dict(rec, wall_s=2.0)}}}
+        table = sc.build_perf_table({"metrics": {"craft_variety": rec}}, prev)
+        row = next(l for l in table.splitlines() if l.startswith("| craft_variety"))
+        assert "-1.000 ↑ besser" in row and "1/2/3/4" in row and "±0" in row
+        assert "— (Baseline)" in sc.build_perf_table({"metrics": {"craft_variety": rec}}, None)
+
+    def test_perf_table_labels_measurement_mode(self):
+        rec = {"wall_s": 1.0, "cpu_s": 0.9, "peak_kib": None,
+               "actions": {"gather": 1, "experiment": 2, "process": 3, "travel": 4, "ticks": 9}}
+        traced = {"perf": {"memory": True, "metrics": {
+            "craft_variety": dict(rec, wall_s=5.0, peak_kib=50.0)}}}
+        table = sc.build_perf_table({"memory": False, "metrics": {"craft_variety": rec}}, traced)
+        row = next(l for l in table.splitlines() if l.startswith("| craft_variety"))
+        assert "ohne tracemalloc" in table
+        assert "— (andere Messart)" in row and "| — |" in row
+        table = sc.build_perf_table({"memory": True, "metrics": {
+            "craft_variety": dict(rec, peak_kib=40.0)}}, traced)
+        assert "unter tracemalloc" in table and "-4.000 ↑ besser" in table
+
+
 # ----------------------------------------------------------------------------
 # discovery_gap (Band-Metrik)
 # ----------------------------------------------------------------------------
@@ -0,0 +1,224 @@
+"""Tests for engine/tags.py — Tag-Bitmasken und Matching-basierte Slot-Zuordnung."""
+import itertools
+import random
+
+import pytest
+
+from engine.components import Item, ToolBlueprint
+from engine.core import GameEngine, TAG_FAMILIES, _slot_satisfied
+from engine.tags import BlueprintIndex, first_assignment, slot_mask, tags_mask
+
+
+def _legacy_first_match(blueprints, selected_items, survival=1.0):
+    """Frühere Permutations-Suche aus execute_experiment (Referenz)."""
+    for bp_id, bp in blueprints.items():
+        if len(selected_items) != len(bp.slots):
+            continue
+        if survival < bp.min_survival_req:
+            continue
+        for p in itertools.permutations(selected_items):
+            mapping = {}
+            match = True
+            for i, slot in enumerate(bp.slots.keys()):
+                if not _slot_satisfied(p[i].tags, bp.slots[slot]):
+                    match = False
+                    break
+                mapping[slot] = p[i]
+            if match:
+                return bp_id, [id(v) for v in mapping.values()]
+    return None
+
+
+def _new_first_match(blueprints, selected_items, survival=1.0):
+    index = BlueprintIndex(blueprints, TAG_FAMILIES)
+    masks = [tags_mask(it.tags) for it in selected_items]
+    for entry in index.buckets.get(len(selected_items), ()):
+        if survival < entry.bp.min_survival_req:
+            continue
+        assignment = first_assignment(entry.slot_masks, masks)
+        if assignment is not None:
+            return entry.key, [id(selected_items[j]) for j in assignment]
+    return None
+
+
+TAG_POOL = ["SHARP", "HARD", "FLINT", "BONE", "FIBER", "RIGID", "STONE", "CORD",
+            "KINDLING", "WOOD"]
+SLOT_POOL = TAG_POOL + list(TAG_FAMILIES)
+
+
+class TestMasks:
+    def test_single_tag_and_family_masks(self):
+        assert slot_mask("SHARP", TAG_FAMILIES) == tags_mask(["SHARP"])
+        assert slot_mask("SHARP_OR_HARD", TAG_FAMILIES) == tags_mask(["SHARP", "HARD"])
+
+    def test_mask_intersection_equals_slot_satisfied(self):
+        rng = random.Random(3)
+        for _ in range(500):
+            tags = {t: True for t in rng.sample(TAG_POOL, rng.randint(0, 4))}
+            slot = rng.choice(SLOT_POOL)
+            assert bool(tags_mask(tags) & slot_mask(slot, TAG_FAMILIES)) == \
+                _slot_satisfied(tags, slot)
+
+    def test_new_tags_are_interned_on_demand(self):
+        assert tags_mask(["NEW_TAG_FOR_TEST"]) != 0
+        assert tags_mask(["NEW_TAG_FOR_TEST"]) == tags_mask(["NEW_TAG_FOR_TEST"])
+
+
+class TestFirstAssignment:
+    def test_prefers_lexicographically_first(self):
+        a, b = tags_mask(["RIGID"]), tags_mask(["RIGID", "FIBER"])
+        slots = [tags_mask(["RIGID"]), tags_mask(["FIBER"])]
+        # Item 0 kann nur RIGID, Item 1 beides → (0, 1)
+        assert first_assignment(slots, [a, b]) == (0, 1)
+        # Umgekehrt: Slot 0 würde gern Item 0 nehmen, dann bleibt FIBER offen
+        assert first_assignment(slots, [b, a]) == (1, 0)
+
+    def test_no_perfect_matching(self):
+        r = tags_mask(["RIGID"])
+        assert first_assignment([r, tags_mask(["FIBER"])], [r, r]) is None
+        assert first_assignment([r], [r, r]) is None
+
+
+class TestDifferentialAgainstPermutations:
+    """Gleiche erste Übereinstimmung wie die alte Permutations-Suche."""
+
+    @staticmethod
+    def _random_world(rng):
+        bps = {}
+        for i in range(rng.randint(1, 8)):
+            n = rng.randint(1, 6)
+            slots = {f"s{k}": rng.choice(SLOT_POOL) for k in range(n)}
+            bps[f"bp{i}"] = ToolBlueprint(id=f"bp{i}", result_name="X", slots=slots,
+                                          base_efficiency=1.0,
+                                          min_survival_req=rng.choice([0.0, 0.0, 0.6]))
+        return bps
+
+    @pytest.mark.parametrize("seed", range(300))
+    def test_random_worlds(self, seed):
+        rng = random.Random(seed)
+        bps = self._random_world(rng)
+        n = rng.randint(1, 6)
+        stack = Item("Stapel", 0.1, tags={rng.choice(TAG_POOL): True}, quantity=3)
+        items = []
+        for _ in range(n):
+            if rng.random() < 0.2:
+                items.append(stack)  # derselbe Stack mehrfach selektiert
+            else:
+                tags = {t: True for t in rng.sample(TAG_POOL, rng.randint(1, 3))}
+                items.append(Item("I", 0.1, tags=tags))
+        survival = rng.choice([0.0, 1.0])
+        assert _new_first_match(bps, items, survival) == \
+            _legacy_first_match(bps, items, survival)
+
+    def test_game_blueprints_all_orders(self):
+        from data.items import create_item
+        engine = GameEngine()
+        pool = ["flint_shard", "stick", "plant_fiber", "reeds", "bone", "sharp_stone"]
+        for combo in itertools.permutations(pool, 3):
+            items = [create_item(t) for t in combo]
+            assert _new_first_match(engine.blueprints, items) == \
+                _legacy_first_match(engine.blueprints, items)
+
+
+class TestIndexInvalidation:
+    def test_replaced_blueprints_are_recompiled(self):
+        engine = GameEngine()
+        engine.blueprints = {"solo": ToolBlueprint(id="solo", result_name="Solo",
+                                                   slots={"a": "RIGID", "b": "RIGID"},
+                                                   base_efficiency=1.0)}
+        engine.player.inventory.items.clear()
+        a = Item("Ast", 0.5, tags={"RIGID": True})
+        b = Item("Stab", 0.5, tags={"RIGID": True})
+        engine.player.inventory.items.extend([a, b])
+        res = engine.execute_experiment([a, b])
+        assert res["success"] is True and res["blueprint_id"] == "solo"
+
+    def test_blueprints_edited_in_place_are_recompiled(self):
+        engine = GameEngine()
+        engine.player.inventory.items.clear()
+        flint = Item("Feuerstein", 0.5, tags={"FLINT": True, "SHARP": True})
+        stick = Item("Ast", 0.5, tags={"RIGID": True})
+        engine.player.inventory.items.extend([flint, stick])
+        assert engine.execute_experiment([flint, stick])["blueprint_id"] == "knife"
+        for bp in engine.blueprints.values():
+            bp.slots = {k: "BONE" for k in bp.slots} if bp.id == "knife" else bp.slots
+            if bp.id == "spear":
+                bp.slots["tip"] = "BONE"                      # im Dict selbst
+            if bp.id in ("knife_stone", "knife_bone", "rope"):
+                bp.min_survival_req = 9.0
+        res = engine.execute_experiment([flint, stick])
+        assert not res["success"]
+        bone = Item("Knochen", 0.5, tags={"BONE": True})
+        engine.player.inventory.items.append(bone)
+        assert engine.execute_experiment([bone, stick])["blueprint_id"] == "spear"
+
+
+def _legacy_no_match_reason(blueprints, known, near_misses, selected_items):
+    """Frühere Set-basierte `_no_match_reason` (Referenz, inkl. near_misses-Pflege)."""
+    available = set()
+    for it in selected_items:
+        available.update(it.tags)
+
+    def missing_tags(bp):
+        missing = []
+        for slot_value in bp.slots.values():
+            required = set(TAG_FAMILIES.get(slot_value, {slot_value}))
+            if not (required & available):
+                missing.append(next(iter(required)))
+        return missing
+
+    def overlap(bp):
+        return sum(1 for v in bp.slots.values()
+                   if set(TAG_FAMILIES.get(v, {v})) & available)
+
+    def best_missing(want_known):
+        best_score, best_tag = -1, None
+        for bp in blueprints.values():
+            if (bp.id in known) != want_known or len(bp.slots) != len(selected_items):
+                continue
+            missing = missing_tags(bp)
+            if missing and len(bp.slots) - len(missing) > best_score:
+                best_score, best_tag = len(bp.slots) - len(missing), missing[0]
+        return best_tag
+
+    tag = best_missing(True)
+    if tag:
+        return f"MISSING_TAG:{tag}"
+    near, near_overlap = None, 1
+    for bp in blueprints.values():
+        if bp.id in known or bp.id in near_misses:
+            continue
+        o = overlap(bp)
+        if 2 <= o < len(bp.slots) and o > near_overlap:
+            near_overlap, near = o, bp
+    if near is not None:
+        near_misses.add(near.id)
+        return f"NEAR_MISS:{near.id}"
+    if not near_misses:
+        tag = best_missing(False)
+        if tag:
+            return f"MISSING_TAG:{tag}"
+    return "NO_MATCH"
+
+
+class TestNoMatchReasonDifferential:
+    """Masken-basierter `_no_match_reason` ≡ frühere Set-Variante (SPEC-002/003)."""
+
+    @pytest.mark.parametrize("seed", range(300))
+    def test_random_worlds(self, seed):
+        rng = random.Random(10_000 + seed)
+        bps = TestDifferentialAgainstPermutations._random_world(rng)
+        items = [Item("I", 0.1, tags={t: True for t in rng.sample(TAG_POOL, rng.randint(0, 3))})
+                 for _ in range(rng.randint(1, 6))]
+        known = {b for b in bps if rng.random() < 0.3}
+        near = {b for b in bps if rng.random() < 0.2}
+
+        engine = GameEngine()
+        engine.blueprints = bps
+        engine.player.known_blueprints = set(known)
+        engine.player.near_misses = set(near)
+        legacy_near = set(near)
+        for _ in range(3):  # mehrfach: einmalige near_misses-Buchführung
+            assert engine._no_match_reason(items) == \
+                _legacy_no_match_reason(bps, known, legacy_near, items)
+            assert engine.player.near_misses == legacy_near
@@ -0,0 +1,84 @@
+"""Tests for tools/techtree.py — statisches Erreichbarkeits-Orakel."""
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+import scorecard as sc  # noqa: E402
+import techtree  # noqa: E402
+from data.loader import load_content  # noqa: E402
+
+
+def _content(**changes):
+    return load_content()._replace(**changes)
+
+
+class TestTechTree:
+    def test_everything_reachable_in_current_content(self):
+        tree = techtree.analyse()
+        assert not (tree.unreachable_items or tree.unreachable_blueprints
+                    or tree.unreachable_processes)
+        assert tree.summary()["blueprint_reachability"] == 1.0
+
+    def test_unlock_depths(self):
+        tree = techtree.analyse()
+        assert tree.items["stick"] == 0 and tree.items["raw_meat"] == 1   # PROJECTILE
+        assert tree.blueprints["axe"] == 1 and tree.items["log_oak"] == 2  # CHOPPING
+        assert tree.blueprints["rope"] == 2                                # Survival 0.4
+        assert tree.processes["start_fire"] < tree.processes["cook_meat"]  # HEAT_SOURCE
+
+    def test_agrees_with_simulated_metric(self):
+        simulated = sc.metric_reachability()["per_blueprint"]
+        tree = techtree.analyse()
+        assert {bp for bp, ok in simulated.items() if ok} == set(tree.blueprints)
+
+    def test_scorecard_cross_check(self):
+        result = sc.metric_reachability()
+        assert sc._reachability_disagreement(result) == []
+        result["per_blueprint"]["axe"] = False
+        assert sc._reachability_disagreement(result) == ["axe"]
+
+    def test_cross_check_as_package_module(self):
+        """Auch als `tools.scorecard` (python -m, Import als Paket) ohne
+        tools/ im Suchpfad."""
+        code = ("from tools import scorecard; "
+                "print(scorecard._reachability_disagreement({'per_blueprint': {}}))")
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True,
+                             text=True, check=True).stdout
+        assert out.startswith("[") and "axe" in out
+
+    def test_missing_node_cuts_branch(self):
+        locations = tuple(
+            dict(loc, nodes=[n for n in loc["nodes"] if n["result_template_id"] != "pebble"])
+            for loc in load_content().locations)
+        tree = techtree.analyse(_content(locations=locations))
+        assert "raw_meat" in tree.unreachable_items     # kein PROJECTILE mehr
+        assert "cook_meat" in tree.unreachable_processes
+        assert "make_fur_cloak" in tree.unreachable_processes
+
+    def test_env_requires_fire_process(self):
+        processes = tuple(p for p in load_content().processes if p["id"] != "start_fire")
+        tree = techtree.analyse(_content(processes=processes))
+        assert "cook_meat" in tree.unreachable_processes
+        assert "cooked_meat" in tree.unreachable_items
+
+    def test_survival_gate(self):
+        blueprints = tuple(dict(bp, min_survival_req=9.0) if bp["id"] == "rope" else bp
+                           for bp in load_content().blueprints)
+        tree = techtree.analyse(_content(blueprints=blueprints))
+        assert "rope" in tree.unreachable_blueprints
+        assert "cord_spear" in tree.unreachable_blueprints   # braucht CORD
+
+    def test_shadowed_blueprint_unreachable(self):
+        knife = next(bp for bp in load_content().blueprints if bp["id"] == "knife")
+        shadow = dict(knife, id="knife_copy", result_name="Kopie")
+        tree = techtree.analyse(_content(blueprints=load_content().blueprints + (shadow,)))
+        assert "knife" in tree.blueprints
+        assert tree.unreachable_blueprints == ["knife_copy"]
+
+    def test_cli_json(self, capsys):
+        techtree.main(["--json"])
+        out = capsys.readouterr().out
+        assert '"blueprint_reachability": 1.0' in out
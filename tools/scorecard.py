@@ -4,36 +4,52 @@
 Berechnet 7 messbare Eigenschaften des Spiels aus echten Playthroughs.
 Nicht Prozesstreue, sondern das Spiel selbst ist das Signal.
 
-- Stdlib only. Deterministisch (fester Seed-Satz). Läuft ohne Argumente.
+- Stdlib only. Deterministisch (fester Seed-Satz). Läuft ohne Argumente;
+  `--jobs N` verteilt die Einzelläufe auf N Prozesse (gleiches Ergebnis).
+- Performance je Metrik: Zeit und Engine-Aktionen; `--memory` misst zusätzlich
+  den Spitzenspeicher (tracemalloc — die Zeiten laufen dann deutlich langsamer).
 - Jede laufbasierte Metrik läuft über SEEDS (Median) statt über einen Run.
+- Einzelläufe landen im Ergebnis-Cache (scorecard/cache/) und werden
+  wiederverwendet, solange Seeds, Content, Code und Metrik-Version gleich
+  sind; `--force` rechnet alles neu.
 - Metriken hängen an Identitäten (blueprint_id/template_id/reason), nicht an
   Anzeigetext — damit lassen sie sich nicht durch String-Änderungen faken.
 
 Output:
-  - scorecard/YYYY-MM-DD.json   (Rohwerte + Details, schema=2)
+  - scorecard/YYYY-MM-DD.json   (Rohwerte + Details + Performance, schema=2)
   - scorecard/latest.json       (Kopie des aktuellsten Runs)
-  - SCORECARD.md                (Markdown-Tabelle mit Delta zur Vorwoche)
+  - SCORECARD.md                (Markdown-Tabelle mit Delta zur Vorwoche,
+                                 Performance-Abschnitt je Metrik)
 """
+import argparse
+import hashlib
 import json
+import os
 import random
 import statistics
 import sys
+import time
+import tracemalloc
 from datetime import date
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
-from engine.core import GameEngine, _label_for, TAG_LABELS, TAG_FAMILIES  # noqa: E402
+from engine.core import (  # noqa: E402
+    GameEngine, Reason, TAG_FAMILIES, TAG_LABELS, _label_for, _parse_reason,
+)
+from engine.memo import TOTALS as MEMO_TOTALS, memo_totals, reset_totals  # noqa: E402
 from data.items import TEMPLATE_DB, create_item  # noqa: E402
 from data.blueprints import get_all_blueprints  # noqa: E402
 from data.locations import get_all_locations    # noqa: E402
-from data.loader import load_processes          # noqa: E402
+from data.loader import content_hash, load_processes  # noqa: E402
 
 BASE_SEED = 20260803
 SCHEMA = 2                                       # Zählweise der Metriken
 SEEDS = tuple(BASE_SEED + i for i in range(20))
 HORIZON = 500                                    # Tick-Cap für Überlebensmetriken
+REACHABILITY_RUNS = 50                           # Läufe für blueprint_reachability
 SCORECARD_DIR = ROOT / "scorecard"
 ARCHIVE_DIR = SCORECARD_DIR / "archive"
 
@@ -43,14 +59,14 @@ ARCHIVE_DIR = SCORECARD_DIR / "archive"
 # ----------------------------------------------------------------------------
 
 def _edible(game):
-    return [it for it in game.player.inventory.items if "EDIBLE" in it.tags]
+    return [it for it in game.player.inventory.items if "EDIBLE" in it.tag_data()]
 
 
 def _eat_best(game):
     eds = _edible(game)
     if not eds:
         return
-    eds.sort(key=lambda it: it.tags["EDIBLE"], reverse=True)
+    eds.sort(key=lambda it: it.tag_data()["EDIBLE"], reverse=True)
     inv = game.player.inventory.items
     idx = inv.index(eds[0])
     game.eat(idx)
@@ -87,7 +103,7 @@ def _run_first_craft(seed):
     """Aktionen bis zum ersten erfolgreichen Craft bei naivem Spiel (ein Run)."""
     random.seed(seed)
     rng = random.Random(seed)
-    game = GameEngine()
+    game = GameEngine.from_prototype()
     locs = list(game.locations.keys())
     actions = 0
     since_travel = 0
@@ -106,13 +122,13 @@ def _run_first_craft(seed):
         else:
             sel = _random_sel(game, rng, kmin=2)
             if sel:
-                if game.execute_experiment(sel)["success"]:
+                if game.execute_experiment(sel).success:
                     return actions
     return None
 
 
 def metric_first_craft():
-    return _aggregate(lambda s: _run_first_craft(s))
+    return _aggregate(_run_first_craft)
 
 
 # ----------------------------------------------------------------------------
@@ -130,7 +146,7 @@ def _pair_slots(game, bp):
            if it.quantity >= 1 and it.condition > 0]
     by_tag = {}
     for it in inv:
-        for t in it.tags:
+        for t in it.tag_data():
             by_tag.setdefault(t, []).append(it)
 
     candidates = []
@@ -162,28 +178,43 @@ def _pair_slots(game, bp):
     return list(chosen)
 
 
-def metric_reachability(n=50):
+def _run_reachability(run):
+    """Blueprint-IDs, die ein frischer Start (Lauf `run`) erfolgreich craftet."""
+    random.seed(BASE_SEED + 10_000 + run)
+    game = GameEngine.from_prototype()
+    for loc in list(game.locations):
+        _travel_or_fail(game, loc)
+        for _ in range(8):
+            game.gather()
+    crafted = []
+    for bp in get_all_blueprints():
+        sel = _pair_slots(game, bp)
+        if sel and game.execute_experiment(sel).success:
+            crafted.append(bp.id)
+    return crafted
+
+
+def metric_reachability(n=REACHABILITY_RUNS):
     """Anteil der Blueprints, die von frischem Start aus erreichbar sind."""
     bps = get_all_blueprints()
-    loc_ids = [l.id for l in get_all_locations()]
     seen = {bp.id: 0 for bp in bps}
     for run in range(n):
-        random.seed(BASE_SEED + 10_000 + run)
-        game = GameEngine()
-        for loc in loc_ids:
-            _travel_or_fail(game, loc)
-            for _ in range(8):
-                game.gather()
-        for bp in bps:
-            sel = _pair_slots(game, bp)
-            if sel and game.execute_experiment(sel)["success"]:
-                seen[bp.id] += 1
+        for bp_id in _run_unit_cached(_run_reachability, run):
+            seen[bp_id] += 1
     total = max(1, len(bps))
     value = sum(1 for v in seen.values() if v > 0) / total
     return {"value": round(value, 3),
             "per_blueprint": {k: (v > 0) for k, v in seen.items()}}
 
 
+def _reachability_disagreement(result):
+    """Blueprints, bei denen Simulation und statisches Orakel (tools/techtree.py)
+    uneins sind — Gegencheck; leer, wenn beide dasselbe für erreichbar halten."""
+    from tools.techtree import analyse
+    simulated = {bp for bp, ok in (result.get("per_blueprint") or {}).items() if ok}
+    return sorted(simulated ^ set(analyse().blueprints))
+
+
 # ----------------------------------------------------------------------------
 # Metrik 3 — craft_variety (distinkte blueprint_id)
 # ----------------------------------------------------------------------------
@@ -192,7 +223,7 @@ def _run_craft_variety(seed, actions=100):
     """Distinkte erfolgreiche blueprints in N Aktionen (ein Run)."""
     random.seed(seed)
     rng = random.Random(seed)
-    game = GameEngine()
+    game = GameEngine.from_prototype()
     locs = list(game.locations.keys())
     results = set()
     done = 0
@@ -210,13 +241,13 @@ def _run_craft_variety(seed, actions=100):
             sel = _random_sel(game, rng, kmin=2)
             if sel:
                 res = game.execute_experiment(sel)
-                if res.get("blueprint_id"):
-                    results.add(res["blueprint_id"])
+                if res.success:
+                    results.add(res.blueprint_id)
     return len(results)
 
 
 def metric_craft_variety():
-    return _aggregate(lambda s: _run_craft_variety(s))
+    return _aggregate(_run_craft_variety)
 
 
 # ----------------------------------------------------------------------------
@@ -226,7 +257,7 @@ def metric_craft_variety():
 def _survival_staying(loc_id, seed):
     """Überleben, wenn man in loc_id bleibt und isst. Datensatz-getrieben."""
     random.seed(seed)
-    game = GameEngine()
+    game = GameEngine.from_prototype()
     if game.current_location_id != loc_id:
         _travel_or_fail(game, loc_id)
     while game.tick_counter < HORIZON:
@@ -253,7 +284,7 @@ def get_all_locations_ids():
 def _survival_random(seed):
     random.seed(seed)
     rng = random.Random(seed)
-    game = GameEngine()
+    game = GameEngine.from_prototype()
     locs = list(game.locations.keys())
     while game.tick_counter < HORIZON:
         if _drain_check(game):
@@ -281,7 +312,7 @@ def _run_skill_spread(seed):
 
 def metric_skill_spread():
     """Überlebenszeit optimal vs. zufällig — misst, ob Können etwas bringt."""
-    return _aggregate(lambda s: _run_skill_spread(s))
+    return _aggregate(_run_skill_spread)
 
 
 # ----------------------------------------------------------------------------
@@ -292,23 +323,25 @@ def metric_skill_spread():
 # interner Wahrheit und Spielertext. Informativ NUR, wenn die Meldung das zum
 # Code gehörende Label wirklich enthält. Verrät die Engine den Grund nicht im
 # Text, zählt die Aktion als NICHT informativ (auch wenn der Code stimmt).
-def _expected_fragment(reason):
-    if reason == "SUCCESS":
-        return "Hergestellt"
-    if reason.startswith("MISSING_TAG:"):
-        tag = reason.split(":", 1)[1]
-        return _label_for(tag)
-    if reason == "TOO_FEW_ITEMS":
-        return "mindestens zwei"
-    if reason == "BROKEN_ITEM":
-        return "zerbrochen"
-    if reason == "NO_MATCH":
-        return "ergibt nichts"
-    return None  # UNKNOWN / unklar → nie informativ
-
-
-def _informative_experiment(message, reason):
-    fragment = _expected_fragment(reason)
+# `reason` ist ein Reason (Detail separat) oder der String-Code ("MISSING_TAG:SHARP").
+_FRAGMENTS = {
+    Reason.SUCCESS: "Hergestellt",
+    Reason.TOO_FEW_ITEMS: "mindestens zwei",
+    Reason.BROKEN_ITEM: "zerbrochen",
+    Reason.NO_MATCH: "ergibt nichts",
+}
+
+
+def _expected_fragment(reason, detail=None):
+    if isinstance(reason, str):
+        reason, detail = _parse_reason(reason)
+    if reason == Reason.MISSING_TAG:
+        return _label_for(detail)
+    return _FRAGMENTS.get(reason)  # UNKNOWN / unklar → nie informativ
+
+
+def _informative_experiment(message, reason, detail=None):
+    fragment = _expected_fragment(reason, detail)
     return fragment is not None and fragment in message
 
 
@@ -316,7 +349,7 @@ def _run_feedback_quality(seed, steps=60):
     """Anteil informativer Aktionen — Meldung muss den Reason widerspiegeln."""
     random.seed(seed)
     rng = random.Random(seed)
-    game = GameEngine()
+    game = GameEngine.from_prototype()
     locs = list(game.locations.keys())
     total, informative = 0, 0
     for _ in range(steps):
@@ -333,13 +366,13 @@ def _run_feedback_quality(seed, steps=60):
             sel = _random_sel(game, rng, kmin=1)
             res = game.execute_experiment(sel) if sel else \
                 game.execute_experiment([])
-            if _informative_experiment(res["message"], res.get("reason")):
+            if _informative_experiment(res.message, res.reason, res.payload):
                 informative += 1
     return informative / total if total else 0.0
 
 
 def metric_feedback_quality():
-    return _aggregate(lambda s: _run_feedback_quality(s))
+    return _aggregate(_run_feedback_quality)
 
 
 # ----------------------------------------------------------------------------
@@ -350,7 +383,7 @@ def _run_naive_discovery(seed, actions=150):
     """Anteil der Blueprints, die ein naiver Spieler in N Aktionen entdeckt."""
     random.seed(seed)
     rng = random.Random(seed)
-    game = GameEngine()
+    game = GameEngine.from_prototype()
     locs = list(game.locations.keys())
     total = max(1, len(get_all_blueprints()))
     discovered = set()
@@ -369,8 +402,8 @@ def _run_naive_discovery(seed, actions=150):
             sel = _random_sel(game, rng, kmin=2)
             if sel:
                 res = game.execute_experiment(sel)
-                if res.get("blueprint_id"):
-                    discovered.add(res["blueprint_id"])
+                if res.success:
+                    discovered.add(res.blueprint_id)
     return len(discovered) / total
 
 
@@ -378,7 +411,7 @@ def metric_discovery_gap():
     """Abstand zwischen Erreichbarem und dem, was ein Spieler wirklich findet."""
     reach_val = _collapse(metric_reachability())
     reach = float(reach_val) if reach_val is not None else 0.0
-    naive = _aggregate(lambda s: _run_naive_discovery(s))
+    naive = _aggregate(_run_naive_discovery)
     naive_rate = float(naive["value"]) if naive.get("value") is not None else 0.0
     gap = reach - naive_rate
     return {
@@ -435,7 +468,7 @@ def _run_session_depth(seed, stall_limit=15, cap=1500):
     """Aktionen bis nichts Neues mehr passiert (ein Run)."""
     random.seed(seed)
     rng = random.Random(seed)
-    game = GameEngine()
+    game = GameEngine.from_prototype()
     locs = list(game.locations.keys())
     stall, actions = 0, 0
     while actions < cap:
@@ -461,7 +494,7 @@ def _run_session_depth(seed, stall_limit=15, cap=1500):
 
 
 def metric_session_depth():
-    return _aggregate(lambda s: _run_session_depth(s))
+    return _aggregate(_run_session_depth)
 
 
 # ----------------------------------------------------------------------------
@@ -478,7 +511,7 @@ def _run_forage_pressure(seed, actions=200):
     """
     random.seed(seed)
     rng = random.Random(seed)
-    game = GameEngine()
+    game = GameEngine.from_prototype()
     locs = list(game.locations.keys())
     n_attempts, n_underperform = 0, 0
     for _ in range(actions):
@@ -505,7 +538,7 @@ def _run_forage_pressure(seed, actions=200):
 
 def metric_forage_pressure():
     """Anteil der Sammel-Versuche an einem nicht-vollen Node (Band-Metrik)."""
-    return _aggregate(lambda s: _run_forage_pressure(s))
+    return _aggregate(_run_forage_pressure)
 
 
 # ----------------------------------------------------------------------------
@@ -537,7 +570,7 @@ def _run_warmth_stability(seed, horizon=WARMTH_HORIZON):
     """
     random.seed(seed)
     rng = random.Random(seed)  # noqa: F841 — Seed-Vielfalt für Gather-Determinismus
-    game = GameEngine()
+    game = GameEngine.from_prototype()
     inv = game.player.inventory
 
     def give(tpl, qty=1):
@@ -582,7 +615,7 @@ def _run_warmth_stability(seed, horizon=WARMTH_HORIZON):
 
 def metric_warmth_stability():
     """Anteil der Kälte-Stress-Ticks mit body_temp >= 35°C (Band-Metrik)."""
-    return _aggregate(lambda s: _run_warmth_stability(s))
+    return _aggregate(_run_warmth_stability)
 
 
 # ----------------------------------------------------------------------------
@@ -610,7 +643,7 @@ def _run_recovery_stability(seed, expose=RECOVERY_EXPOSE, recover=RECOVERY_RECOV
     """
     random.seed(seed)
     random.Random(seed)  # noqa: F841 — deterministische Ausstattung
-    game = GameEngine()
+    game = GameEngine.from_prototype()
     inv = game.player.inventory
 
     def give(t, q=1):
@@ -648,7 +681,7 @@ def _run_recovery_stability(seed, expose=RECOVERY_EXPOSE, recover=RECOVERY_RECOV
 
 def metric_recovery_stability():
     """Anteil der Verletzungs-Ticks, die behandelt+in Ruhe abgewendet werden."""
-    return _aggregate(lambda s: _run_recovery_stability(s))
+    return _aggregate(_run_recovery_stability)
 
 
 # ----------------------------------------------------------------------------
@@ -659,7 +692,7 @@ def _aggregate(run_fn, cap=None):
     """Mittelt eine laufbasierte Metrik über alle Seeds."""
     values = []
     for seed in SEEDS:
-        v = run_fn(seed)
+        v = _run_unit_cached(run_fn, seed)
         if v is not None:
             values.append(v)
     if not values:
@@ -677,6 +710,260 @@ def _aggregate(run_fn, cap=None):
     }
 
 
+# ----------------------------------------------------------------------------
+# Instrumentierung: Zeit, Speicher und Engine-Aktionen je Metrik und Einzellauf
+# ----------------------------------------------------------------------------
+
+# Aktions-Zähler hängen sich über den Journal-Hook an alle Engines (als
+# Klassenattribut GameEngine.journal, solange compute_all(perf=True) läuft);
+# ein echtes Journal an einer einzelnen Engine hat Vorrang.
+ACTION_KEYS = {"gather": "gather", "execute_experiment": "experiment",
+               "execute_process": "process", "travel": "travel"}
+
+
+class _ActionTally:
+    """Zählt öffentliche Engine-Aktionen und die dabei vergangenen Ticks."""
+
+    def __init__(self):
+        self.counts = {"gather": 0, "experiment": 0, "process": 0, "travel": 0, "ticks": 0}
+        self._depth = 0
+
+    def call(self, engine, op, method, args, kwargs):
+        if self._depth:
+            return method(engine, *args, **kwargs)
+        tick = engine.tick_counter
+        self._depth += 1
+        try:
+            return method(engine, *args, **kwargs)
+        finally:
+            self._depth -= 1
+            key = ACTION_KEYS.get(op)
+            if key:
+                self.counts[key] += 1
+            self.counts["ticks"] += engine.tick_counter - tick
+
+
+_TALLY = _ActionTally()
+_PROBES = []          # offene _Probe-Abschnitte (verschachtelt: Metrik ⊃ Einzellauf)
+PERF = {}             # {"memory": bool, "metrics": {key: …}, "units": {runner: {arg: …}}}
+
+
+class _Probe:
+    """Misst einen Abschnitt: Wand- und CPU-Zeit, Engine-Aktionen und — nur
+    wenn tracemalloc läuft — den Spitzenspeicher über dem Stand beim Betreten
+    (sonst `peak_kib` None). Ergebnis in `record`.
+
+    tracemalloc kennt nur eine Spitze; ein innerer Abschnitt setzt sie zurück
+    und reicht seine eigene an den äußeren weiter.
+    """
+
+    def __enter__(self):
+        self.traced = tracemalloc.is_tracing()
+        self.base = self.peak = 0
+        if self.traced:
+            current, peak = tracemalloc.get_traced_memory()
+            if _PROBES:
+                _PROBES[-1].peak = max(_PROBES[-1].peak, peak)
+            tracemalloc.reset_peak()
+            self.base = self.peak = current
+        self.counts = dict(_TALLY.counts)
+        self.cache_hits = _CACHE_STATS["hits"]
+        _PROBES.append(self)
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter() - self.wall
+        cpu = time.process_time() - self.cpu
+        _PROBES.pop()
+        if self.traced:
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            if _PROBES:
+                _PROBES[-1].peak = max(_PROBES[-1].peak, self.peak)
+        self.record = {
+            "wall_s": round(wall, 4),
+            "cpu_s": round(cpu, 4),
+            "peak_kib": round((self.peak - self.base) / 1024, 1) if self.traced else None,
+            "actions": {k: n - self.counts[k] for k, n in _TALLY.counts.items()},
+        }
+        if _CACHE is not None:
+            self.record["cached_units"] = _CACHE_STATS["hits"] - self.cache_hits
+        return False
+
+
+def _perf_on():
+    return GameEngine.journal is _TALLY
+
+
+def _record_unit(name, arg, record):
+    PERF.setdefault("units", {}).setdefault(name, {})[str(arg)] = record
+
+
+# ----------------------------------------------------------------------------
+# Parallel (--jobs N): (Runner, Seed)-Einheiten über einen Prozess-Pool
+# ----------------------------------------------------------------------------
+
+# Die Einzelläufe sind unabhängig (jeder setzt random.seed(seed) und baut seine
+# eigene Engine). Mit --jobs laufen sie vorab im Pool; die Metrik-Funktionen
+# aggregieren danach seriell wie gehabt und lesen die Ergebnisse aus _PREFETCH.
+# Runner werden per Name adressiert — Lambdas ließen sich nicht pickeln.
+RUNNERS = {fn.__name__: fn for fn in (
+    _run_first_craft, _run_craft_variety, _run_skill_spread, _run_feedback_quality,
+    _run_naive_discovery, _run_session_depth, _run_forage_pressure,
+    _run_warmth_stability, _run_recovery_stability, _run_reachability,
+)}
+
+_PREFETCH = {}   # (runner_name, seed) → (ok, Wert oder Exception)
+
+
+def _run_unit(unit):
+    """Eine Arbeitseinheit im Worker. Fehler kommen als Wert zurück, damit sie
+    wie im seriellen Lauf nur die betroffene Metrik treffen. Dazu die
+    Experiment-Memo-Zähler des Laufs (die Worker zählen in eigenen Prozessen)
+    und, bei compute_all(perf=True), seine Messung."""
+    name, arg = unit
+    before = dict(MEMO_TOTALS)
+    probe = _Probe() if _perf_on() else None
+    try:
+        if probe is None:
+            result = True, RUNNERS[name](arg)
+        else:
+            with probe:
+                result = True, RUNNERS[name](arg)
+    except Exception as e:  # noqa: BLE001
+        result = False, e
+    return result + ({k: MEMO_TOTALS[k] - n for k, n in before.items()},
+                     getattr(probe, "record", None))
+
+
+def _run_unit_cached(run_fn, arg):
+    """Vorab berechnetes Ergebnis (--jobs), Treffer im Ergebnis-Cache oder
+    direkter Lauf. Ist der Cache aktiv, landet jedes Ergebnis darin — auch
+    ein zweiter Aufruf innerhalb desselben Laufs (discovery_gap →
+    metric_reachability) rechnet dann nicht erneut."""
+    name = run_fn.__name__
+    if _CACHE is not None:
+        key = _unit_key(name, arg)
+        if key in _CACHE:
+            _CACHE_STATS["hits"] += 1
+            return _CACHE[key]
+    hit = _PREFETCH.get((name, arg))
+    if hit is None:
+        if _perf_on():
+            with _Probe() as probe:
+                value = run_fn(arg)
+            _record_unit(name, arg, probe.record)
+        else:
+            value = run_fn(arg)
+    else:
+        ok, value = hit
+        if not ok:
+            raise value
+    if _CACHE is not None:
+        _CACHE_STATS["misses"] += 1
+        _CACHE[key] = value
+    return value
+
+
+def _work_units():
+    """Alle laufbasierten Einheiten von compute_all()."""
+    per_seed = [name for name in RUNNERS if name != "_run_reachability"]
+    units = [(name, seed) for name in per_seed for seed in SEEDS]
+    units += [("_run_reachability", run) for run in range(REACHABILITY_RUNS)]
+    return units
+
+
+def _pending_units():
+    """Einheiten, für die der Ergebnis-Cache (falls aktiv) keinen Wert hat."""
+    return [u for u in _work_units() if _CACHE is None or _unit_key(*u) not in _CACHE]
+
+
+def _prefetch(jobs):
+    """Rechnet alle Einheiten mit `jobs` Prozessen vorab in _PREFETCH."""
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+    # fork übernimmt den Interpreter-Zustand samt Hash-Seed (Set-Reihenfolgen
+    # wie im Elternprozess); spawn nur, wo fork fehlt.
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+    units = _pending_units()
+    if not units:
+        return
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as pool:
+        for unit, (ok, value, memo, record) in zip(units, pool.map(_run_unit, units)):
+            _PREFETCH[unit] = ok, value
+            if record is not None:
+                _record_unit(*unit, record)
+            for key, n in memo.items():
+                MEMO_TOTALS[key] += n
+
+
+# ----------------------------------------------------------------------------
+# Ergebnis-Cache: Einzelläufe über Wochenläufe hinweg wiederverwenden
+# ----------------------------------------------------------------------------
+
+# Ein Einzellauf hängt nur an seinem Runner (+ Version der Metrik, zu der er
+# gehört), seinem Seed, dem Seed-Satz, den Content-Dateien und dem Code (Engine,
+# Daten-Lader, diese Datei mit den Bots). Die Cache-Datei ist nach einem Hash
+# über Seeds + Content + Code benannt; darin stehen die Läufe unter
+# "runner@vVersion:arg". Eine neue Metrik-Version verwirft nur deren Läufe,
+# geänderter Code oder Content die ganze Datei.
+CACHE_DIR = SCORECARD_DIR / "cache"
+RUNNER_METRIC = {
+    "_run_first_craft": "actions_to_first_craft",
+    "_run_reachability": "blueprint_reachability",
+    "_run_craft_variety": "craft_variety",
+    "_run_skill_spread": "skill_spread",
+    "_run_feedback_quality": "feedback_quality",
+    "_run_naive_discovery": "discovery_gap",
+    "_run_session_depth": "session_depth",
+    "_run_forage_pressure": "forage_pressure",
+    "_run_warmth_stability": "warmth_stability",
+    "_run_recovery_stability": "recovery_stability",
+}
+
+_CACHE = None                          # unit_key → Wert, solange compute_all(cache=True) läuft
+_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+def _unit_key(name, arg):
+    return f"{name}@v{METRIC_VERSIONS[RUNNER_METRIC[name]]}:{arg}"
+
+
+def _code_files():
+    return sorted([*(ROOT / "engine").glob("*.py"), *(ROOT / "data").glob("*.py"),
+                   Path(__file__).resolve()])
+
+
+def cache_fingerprint():
+    """Hash über Seed-Satz, Content-Dateien und Code — Name der Cache-Datei."""
+    h = hashlib.sha256()
+    h.update(json.dumps([SCHEMA, BASE_SEED, list(SEEDS), REACHABILITY_RUNS]).encode())
+    h.update(content_hash().encode())
+    for path in _code_files():
+        h.update(path.relative_to(ROOT).as_posix().encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()[:32]
+
+
+def _load_cache(fingerprint):
+    try:
+        return json.loads((CACHE_DIR / f"{fingerprint}.json").read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cache(fingerprint, entries):
+    """Schreibt den Cache des aktuellen Stands; ältere Stände fliegen raus."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for old in CACHE_DIR.glob("*.json"):
+        if old.stem != fingerprint:
+            old.unlink()
+    (CACHE_DIR / f"{fingerprint}.json").write_text(
+        json.dumps(entries, sort_keys=True, separators=(",", ":")) + "\n")
+
+
 # ----------------------------------------------------------------------------
 # Aggregation, JSON + Markdown
 # ----------------------------------------------------------------------------
@@ -723,12 +1010,59 @@ def _collapse(result):
     return result
 
 
-def compute_all():
+def compute_all(jobs=1, cache=False, force=False, perf=False, memory=False):
+    """Alle Metriken; mit jobs > 1 laufen die Einzelläufe parallel vorab.
+    Das Ergebnis ist in beiden Fällen identisch.
+
+    `cache` liest und schreibt den Ergebnis-Cache (scorecard/cache/): nur
+    Einzelläufe ohne gültigen Eintrag werden gerechnet. `force` rechnet alle
+    neu und schreibt den Cache frisch. `perf` misst jede Metrik und jeden
+    gerechneten Einzellauf (Zeit, Engine-Aktionen) nach PERF — die
+    Metrik-Werte bleiben dieselben. `memory` misst zusätzlich den
+    Spitzenspeicher per tracemalloc; die Zeiten enthalten dann dessen
+    Overhead (ein Vielfaches der reinen Laufzeit).
+    """
+    global _CACHE
+    fingerprint = None
+    if cache:
+        fingerprint = cache_fingerprint()
+        _CACHE = {} if force else _load_cache(fingerprint)
+        _CACHE_STATS.update(hits=0, misses=0)
+    tracing = False
+    hook = GameEngine.journal
+    if perf:
+        PERF.clear()
+        PERF.update(memory=memory or tracemalloc.is_tracing(), metrics={}, units={})
+        tracing = memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        GameEngine.journal = _TALLY
+    try:
+        if jobs > 1:
+            _prefetch(jobs)
+        return _compute_metrics()
+    finally:
+        _PREFETCH.clear()
+        if perf:
+            GameEngine.journal = hook
+            if tracing:
+                tracemalloc.stop()
+        if cache:
+            _save_cache(fingerprint, _CACHE)
+            _CACHE = None
+
+
+def _compute_metrics():
     out = {}
     for m in METRICS:
         key = m["key"]
         try:
-            val = m["fn"]()
+            if _perf_on():
+                with _Probe() as probe:
+                    val = m["fn"]()
+                PERF["metrics"][key] = probe.record
+            else:
+                val = m["fn"]()
             if isinstance(val, dict):
                 val.setdefault("version", m["version"])
             out[key] = val
@@ -855,20 +1189,94 @@ def build_table(data, prev):
     return "\n".join(lines)
 
 
-def main():
+def build_perf_table(perf, prev):
+    """Performance-Abschnitt für SCORECARD.md: je Metrik Zeit, Speicher und
+    Engine-Aktionen, Δ zur Vorwoche wie bei den Metriken (niedriger = besser).
+    Zeiten mit und ohne tracemalloc sind nicht vergleichbar — dann kein Δ."""
+    # Ohne "memory"-Feld (ältere Läufe): stets unter tracemalloc gemessen.
+    memory = bool(perf.get("memory", True))
+    prev_data = (prev or {}).get("perf") or {}
+    prev_perf = prev_data.get("metrics", {})
+    same_mode = bool(prev_data.get("memory", True)) == memory
+    timing = ("Wand-/CPU-Zeit (gemessen unter tracemalloc, mit dessen Overhead), "
+              "Spitzenspeicher" if memory else
+              "Wand-/CPU-Zeit (ohne tracemalloc; Spitzenspeicher nur mit `--memory`)")
+    lines = [
+        "## Performance",
+        "",
+        f"> Je Metrik: {timing} und",
+        "> Engine-Aktionen (Sammeln/Experiment/Prozess/Reise, vergangene Ticks).",
+        "> Aus dem Cache übernommene Einzelläufe kosten hier nichts (Spalte Cache).",
+        "",
+        "| Metrik | Wand s | Δ Vorwoche | CPU s | Spitze KiB | Δ Vorwoche | G/E/P/R | Ticks | Cache |",
+        "|--------|--------|-----------|-------|------------|-----------|---------|-------|-------|",
+    ]
+    for m in METRICS:
+        key = m["key"]
+        rec = (perf.get("metrics") or {}).get(key)
+        if rec is None:
+            continue
+        old = prev_perf.get(key) or {}
+        cells = []
+        for field in ("wall_s", "peak_kib"):
+            if rec.get(field) is None:
+                cells.append("—")
+                continue
+            if field == "wall_s" and not same_mode:
+                cells.append("— (andere Messart)")
+                continue
+            delta, arrow = _delta_cell(key, rec[field], old.get(field), "niedriger = besser")
+            cells.append(f"{delta} {arrow}" if arrow and arrow != "±0" else delta)
+        a = rec["actions"]
+        peak = f"{rec['peak_kib']:.1f}" if rec.get("peak_kib") is not None else "—"
+        lines.append(
+            f"| {key} | {rec['wall_s']:.3f} | {cells[0]} | {rec['cpu_s']:.3f} | "
+            f"{peak} | {cells[1]} | {a['gather']}/{a['experiment']}/"
+            f"{a['process']}/{a['travel']} | {a['ticks']} | {rec.get('cached_units', '—')} |")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Scorecard für Project Primal Process")
+    ap.add_argument("--jobs", "-j", type=int, default=1,
+                    help="Prozesse für die Einzelläufe (0 = alle Kerne, Default 1 = seriell)")
+    ap.add_argument("--force", action="store_true",
+                    help="Ergebnis-Cache ignorieren und alle Einzelläufe neu rechnen")
+    ap.add_argument("--memory", action="store_true",
+                    help="Spitzenspeicher je Metrik messen (tracemalloc; Zeiten dann "
+                         "mit dessen Overhead)")
+    args = ap.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
     SCORECARD_DIR.mkdir(exist_ok=True)
     ARCHIVE_DIR.mkdir(exist_ok=True)
     today = date.today().isoformat()
 
     prev = load_previous(today)
-    data = compute_all()
+    reset_totals()
+    data = compute_all(jobs=jobs, cache=True, force=args.force, perf=True, memory=args.memory)
+    print(f"[scorecard] Cache: {_CACHE_STATS['hits']} Einzelläufe wiederverwendet, "
+          f"{_CACHE_STATS['misses']} gerechnet", file=sys.stderr)
+    memo = memo_totals()
+    reach = data.get("blueprint_reachability") or {}
+    if "per_blueprint" in reach:
+        disagree = _reachability_disagreement(reach)
+        if disagree:
+            print(f"[scorecard] WARN blueprint_reachability: Simulation und Orakel "
+                  f"uneins bei {', '.join(disagree)}", file=sys.stderr)
     payload = {
         "schema": SCHEMA,
         "date": today,
         "base_seed": BASE_SEED,
         "seeds": list(SEEDS),
         "metrics": data,
+        "experiment_memo": memo,
+        "perf": {"memory": PERF["memory"], "metrics": PERF["metrics"], "units": PERF["units"]},
     }
+    print(f"[scorecard] Experiment-Memo: {memo['hits']}/{memo['hits'] + memo['misses']} "
+          f"Treffer ({memo['hit_rate']:.1%}), {memo['evictions']} verdrängt, "
+          f"{memo['invalidations']} invalidiert", file=sys.stderr)
     path = SCORECARD_DIR / f"{today}.json"
     path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n")
     (SCORECARD_DIR / "latest.json").write_text(
@@ -888,6 +1296,7 @@ def main():
                      f"misst, was ein Orakel erreichen kann; `naive_discovery_rate` "
                      f"({md.get('naive_discovery_rate')}) was ein Spieler wirklich "
                      f"findet. Der Abstand dazwischen ist das eigentliche Spiel.\n\n")
+    body += "\n" + build_perf_table(payload["perf"], prev)
     body += f"\n## Details ({today})\n\n"
     body += "```json\n" + json.dumps(data, indent=2, ensure_ascii=False) + "\n```\n"
     (ROOT / "SCORECARD.md").write_text(body)
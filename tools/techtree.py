@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""tools/techtree.py — Statisches Erreichbarkeits-Orakel für den Tech-Tree.
+
+Rechnet ohne Engine und ohne Zufall aus dem Content (`load_content()`), was ein
+Spieler von einem frischen Start aus überhaupt erreichen kann, und in wie
+vielen Schichten: Fixpunkt über
+
+- Sammel-Nodes (`locations.json`): Perception-Gate, `req_tool_tag`,
+- Prozesse (`processes.json`): Inputs, Werkzeug-Tags, Umgebungs-Tag
+  (`HEAT_SOURCE` ⇐ ein entzündbares Feuer, d.h. `start_fire` erreichbar),
+- Blueprints: Slots samt `TAG_FAMILIES`, `min_survival_req` (Survival wächst
+  um 0.2 je Blueprint, 0.1 je Prozess) und Überdeckung durch frühere
+  Blueprints gleicher Slot-Anzahl (die Engine nimmt den ersten passenden),
+- Werkzeuge: ein hergestellter Blueprint liefert ein Item mit `tool_tags`.
+
+Schicht 0 ist, was mit leeren Händen sammelbar ist; was in Schicht n
+erreichbar wird, braucht etwas aus Schicht n-1. Mengen zählen nicht (Nodes
+regenerieren), Verletzungen für die Behandlungs-Prozesse auch nicht (Sammeln
+verursacht sie). Der simulierte `metric_reachability` der Scorecard bleibt die
+Metrik; das Orakel ist der schnelle, vollständige Gegencheck.
+
+    python tools/techtree.py [--json]
+"""
+import argparse
+import itertools
+import json
+import sys
+from fractions import Fraction
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from engine.components import Player                            # noqa: E402
+from engine.core import TAG_FAMILIES                            # noqa: E402
+from engine.tags import first_assignment, slot_mask, tags_mask  # noqa: E402
+from data.loader import CompiledContent, load_content           # noqa: E402
+
+# Umgebungs-Tag → Prozesse, die ihn am Ort herstellen (engine/core.py:
+# execute_process("start_fire") → _light_fire → _env_satisfied).
+ENV_PROVIDERS = {"HEAT_SOURCE": ("start_fire",)}
+BLUEPRINT_SURVIVAL = Fraction("0.2")   # je erstmals entdecktem Blueprint
+PROCESS_SURVIVAL = Fraction("0.1")     # je erstmals ausgeführtem Prozess
+
+
+class TechTree(NamedTuple):
+    """Ergebnis von `analyse()`: minimale Schicht je erreichbarem Eintrag.
+
+    Nicht Erreichbares fehlt in den Dicts und steht in den `unreachable_*`-Listen.
+    """
+    items: Dict[str, int]          # template_id (auch Werkzeuge = Blueprint-ID)
+    blueprints: Dict[str, int]
+    processes: Dict[str, int]
+    unreachable_items: List[str]
+    unreachable_blueprints: List[str]
+    unreachable_processes: List[str]
+
+    def summary(self) -> dict:
+        bps = len(self.blueprints) + len(self.unreachable_blueprints)
+        return {
+            "blueprint_reachability": round(len(self.blueprints) / bps, 3) if bps else 0.0,
+            "max_depth": max(self.items.values(), default=0),
+            "blueprints": dict(self.blueprints),
+            "items": dict(self.items),
+            "processes": dict(self.processes),
+            "unreachable": {"items": self.unreachable_items,
+                            "blueprints": self.unreachable_blueprints,
+                            "processes": self.unreachable_processes},
+        }
+
+
+def _tool_tags(bp: dict) -> List[str]:
+    """Tags des Werkzeugs, das `_create_tool` für `bp` baut."""
+    return ["DURABILITY"] + list(bp["tool_tags"])
+
+
+def _craftable(pos: int, bucket: List[tuple], masks: set, survival: Fraction) -> bool:
+    """Ob sich Blueprint `bucket[pos]` aus Items mit den Masken `masks` craften
+    lässt, ohne dass ein früherer freigeschalteter Blueprint der Bucket greift.
+
+    Jede Maske steht für beliebig viele Items (gleiches Template mehrfach).
+    """
+    _, req, slot_masks = bucket[pos]
+    if survival < req:
+        return False
+    candidates = [[m for m in masks if m & sm] for sm in slot_masks]
+    if not all(candidates):
+        return False
+    earlier = [sms for _, r, sms in bucket[:pos] if survival >= r]
+    seen = set()
+    for combo in itertools.product(*candidates):
+        key = tuple(sorted(combo))
+        if key in seen:
+            continue
+        seen.add(key)
+        if not any(first_assignment(sms, combo) is not None for sms in earlier):
+            return True
+    return False
+
+
+def analyse(content: Optional[CompiledContent] = None) -> TechTree:
+    """Fixpunkt über den Content (Default: `load_content()`)."""
+    content = content or load_content()
+    perception = Player("oracle").stats["perception"]
+    item_tags = {tid: list(t["tags"]) for tid, t in content.items.items()}
+    for bp in content.blueprints:
+        item_tags[bp["id"]] = _tool_tags(bp)
+    nodes = [(n["result_template_id"], n["req_tool_tag"])
+             for loc in content.locations for n in loc["nodes"]
+             if n["chance"] > 0 and n["max_stock"] > 0 and perception >= n["req_perception"]]
+    # Blueprints nach Slot-Anzahl in Content-Reihenfolge, wie BlueprintIndex.
+    buckets: Dict[int, List[tuple]] = {}
+    for bp in content.blueprints:
+        slots = bp["slots"]
+        buckets.setdefault(len(slots), []).append(
+            (bp["id"], Fraction(str(bp["min_survival_req"])),
+             tuple(slot_mask(v, TAG_FAMILIES) for v in slots.values())))
+
+    items: Dict[str, int] = {}
+    blueprints: Dict[str, int] = {}
+    processes: Dict[str, int] = {}
+    depth = 0
+    while True:
+        tags = {t for tid in items for t in item_tags.get(tid, ())}
+        masks = {tags_mask(item_tags.get(tid, ())) for tid in items}
+        env = {tag for tag, pids in ENV_PROVIDERS.items() if any(p in processes for p in pids)}
+        survival = BLUEPRINT_SURVIVAL * len(blueprints) + PROCESS_SURVIVAL * len(processes)
+        new_items, new_bps, new_procs = set(), set(), set()
+
+        for tid, tool in nodes:
+            if tid not in items and (tool is None or tool in tags):
+                new_items.add(tid)
+        for proc in content.processes:
+            if proc["id"] in processes:
+                continue
+            if (all(i in items for i in proc["inputs"]) and all(t in tags for t in proc["tools"])
+                    and (not proc["required_tag_in_env"] or proc["required_tag_in_env"] in env)):
+                new_procs.add(proc["id"])
+                new_items.update(o for o in proc["outputs"] if o not in items)
+        for bucket in buckets.values():
+            for pos, (bp_id, _, _) in enumerate(bucket):
+                if bp_id not in blueprints and _craftable(pos, bucket, masks, survival):
+                    new_bps.add(bp_id)
+                    if bp_id not in items:
+                        new_items.add(bp_id)
+
+        if not (new_items or new_bps or new_procs):
+            break
+        for found, target in ((new_items, items), (new_bps, blueprints), (new_procs, processes)):
+            for key in found:
+                target[key] = depth
+        depth += 1
+
+    all_items = set(content.items) | {bp["id"] for bp in content.blueprints}
+    return TechTree(
+        items=dict(sorted(items.items(), key=lambda kv: (kv[1], kv[0]))),
+        blueprints=dict(sorted(blueprints.items(), key=lambda kv: (kv[1], kv[0]))),
+        processes=dict(sorted(processes.items(), key=lambda kv: (kv[1], kv[0]))),
+        unreachable_items=sorted(all_items - set(items)),
+        unreachable_blueprints=sorted(bp["id"] for bp in content.blueprints
+                                      if bp["id"] not in blueprints),
+        unreachable_processes=sorted(p["id"] for p in content.processes
+                                     if p["id"] not in processes),
+    )
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Tech-Tree-Orakel für Project Primal Process")
+    ap.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    args = ap.parse_args(argv)
+    tree = analyse()
+    if args.json:
+        print(json.dumps(tree.summary(), indent=2, ensure_ascii=False))
+        return
+    for title, entries in (("Blueprints", tree.blueprints), ("Prozesse", tree.processes),
+                           ("Items", tree.items)):
+        print(f"## {title}")
+        for key, d in entries.items():
+            print(f"  {d:>2}  {key}")
+    unreachable = tree.unreachable_blueprints + tree.unreachable_processes + tree.unreachable_items
+    print(f"\nNicht erreichbar: {', '.join(unreachable) if unreachable else '—'}")
+
+
+if __name__ == "__main__":
+    main()